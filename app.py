@@ -1,9 +1,16 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from src.models.fake_news_detector import FakeNewsDetector
+from src.models.stages import PROFILES
 from src.database.mongo_handler import MongoHandler
 from src.config.config import Config
+from src.utils.metrics import render_samples
+from src.utils.document import as_document
+import atexit
+import hmac
 import logging
+import multiprocessing
 import random
+import threading
 import time
 
 app = Flask(__name__)
@@ -13,24 +20,71 @@ app.config.from_object(Config)
 detector = None
 db_handler = None
 
-def initialize_components():
-    global detector, db_handler
+# Readiness of each component: 'starting', 'ready' or 'failed'
+component_status = {
+    'detector': 'starting',
+    'model': 'starting',
+    'database': 'starting'
+}
+
+def initialize_detector():
+    """Build the rule-based detector first, then warm up the transformer model"""
+    global detector
     try:
-        detector = FakeNewsDetector()
-        logging.info("✅ Fake News Detector initialized successfully")
+        instance = FakeNewsDetector(load_model=False)
+        detector = instance
+        component_status['detector'] = 'ready'
+        logging.info("✅ Fake News Detector initialized successfully (rule-based analysis available)")
     except Exception as e:
         logging.error(f"❌ Failed to initialize detector: {str(e)}")
         detector = None
-    
+        component_status['detector'] = 'failed'
+        component_status['model'] = 'failed'
+        return
+
+    # The detector picks the model up automatically once it is loaded
+    instance.load_model()
+    component_status['model'] = 'ready' if instance.model_ready else \
+        'disabled' if instance.model_status == 'disabled' else 'failed'
+
+def initialize_database():
+    global db_handler
     try:
         db_handler = MongoHandler()
+        component_status['database'] = 'ready'
         logging.info("✅ Database handler initialized successfully")
     except Exception as e:
         logging.error(f"❌ Failed to initialize database: {str(e)}")
         db_handler = None
+        component_status['database'] = 'failed'
+
+def initialize_components():
+    """Warm up all components in the background so the app serves traffic immediately"""
+    threads = [
+        threading.Thread(target=initialize_detector, name='init-detector', daemon=True),
+        threading.Thread(target=initialize_database, name='init-database', daemon=True)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+def shutdown_components():
+    """Flush queued predictions and stop worker processes before the process exits"""
+    if detector:
+        try:
+            detector.close()
+        except Exception as e:
+            logging.error(f"Error closing detector: {str(e)}")
+    if db_handler:
+        try:
+            db_handler.close()
+        except Exception as e:
+            logging.error(f"Error closing database: {str(e)}")
 
-# Initialize on startup
-initialize_components()
+# Initialize on startup; rule analysis worker processes re-import this module and must not
+if Config.AUTO_INITIALIZE and multiprocessing.parent_process() is None:
+    initialize_components()
+atexit.register(shutdown_components)
 
 @app.route('/')
 def index():
@@ -43,43 +97,119 @@ def detect_fake_news():
     try:
         data = request.json
         text = data.get('text', '')
+        include_timings = bool(data.get('timings')) or request.args.get('timings') == '1'
+        profile = data.get('profile') or request.args.get('profile')
+        cascade = data.get('cascade')
         
         if not text:
             return jsonify({'error': 'No text provided'}), 400
+        if profile is not None and (not isinstance(profile, str) or profile not in PROFILES):
+            return jsonify({'error': f"Unknown profile (expected one of: {', '.join(PROFILES)})"}), 400
         
         # Add some processing delay for better UX
-        time.sleep(0.5)
+        if Config.RESPONSE_DELAY_SECONDS > 0:
+            time.sleep(Config.RESPONSE_DELAY_SECONDS)
+        
+        # One document per request; the detector and the creative analysis share its views
+        document = as_document(text)
         
         # Try to use the actual detector first
         if detector:
             try:
-                result = detector.predict(text)
+                result = detector.predict(document, include_timings=include_timings, profile=profile,
+                                          cascade=None if cascade is None else bool(cascade))
                 
-                # Store result in database if available
+                # Queue result for storage; the response never waits on the database
                 if db_handler:
                     try:
-                        db_handler.store_prediction(text, result)
+                        db_handler.enqueue_prediction(text, result)
                     except Exception as e:
                         logging.warning(f"Failed to store prediction: {str(e)}")
                 
                 # Enhance the response with creative analysis
-                enhanced_result = enhance_analysis_creativity(result, text)
+                enhanced_result = enhance_analysis_creativity(result, document)
                 return jsonify(enhanced_result)
                 
             except Exception as e:
                 logging.error(f"Detector prediction failed: {str(e)}")
                 # Fall back to creative mock analysis
-                return jsonify(create_creative_fallback_analysis(text))
+                return jsonify(create_creative_fallback_analysis(document))
         else:
             # If detector is not available, provide creative mock analysis
-            return jsonify(create_creative_fallback_analysis(text))
+            return jsonify(create_creative_fallback_analysis(document))
     
     except Exception as e:
         logging.error(f"Error in fake news detection: {str(e)}")
         return jsonify({'error': 'Analysis temporarily unavailable. Please try again.'}), 500
 
+@app.route('/api/detect/batch', methods=['POST'])
+def detect_fake_news_batch():
+    """Batch fake news detection; accepts a JSON array of texts"""
+    try:
+        data = request.get_json(silent=True)
+        profile = request.args.get('profile')
+        cascade = None
+
+        # Accept either a bare array or {"texts": [...], "profile": ...}
+        if isinstance(data, dict):
+            profile = data.get('profile') or profile
+            cascade = data.get('cascade')
+            data = data.get('texts')
+        if not isinstance(data, list) or not data:
+            return jsonify({'error': 'Expected a non-empty JSON array of texts'}), 400
+        if profile is not None and (not isinstance(profile, str) or profile not in PROFILES):
+            return jsonify({'error': f"Unknown profile (expected one of: {', '.join(PROFILES)})"}), 400
+        if len(data) > Config.MAX_BATCH_ITEMS:
+            return jsonify({'error': f'Batch too large (max {Config.MAX_BATCH_ITEMS} items)'}), 413
+
+        # Items may be plain strings or {"text": ...} objects
+        texts = [item.get('text', '') if isinstance(item, dict) else item for item in data]
+
+        if detector:
+            predictions = detector.predict_batch(texts, profile=profile,
+                                                 cascade=None if cascade is None else bool(cascade))
+        else:
+            predictions = [None] * len(texts)
+
+        results = []
+        for index, (text, prediction) in enumerate(zip(texts, predictions)):
+            try:
+                if not isinstance(text, str) or not text.strip():
+                    item = {'error': 'No text provided'}
+                elif prediction is None:
+                    item = create_creative_fallback_analysis(text)
+                elif 'error' in prediction and 'prediction' not in prediction:
+                    item = {'error': prediction['error']}
+                else:
+                    if db_handler:
+                        try:
+                            db_handler.enqueue_prediction(text, prediction)
+                        except Exception as e:
+                            logging.warning(f"Failed to store prediction: {str(e)}")
+                    item = enhance_analysis_creativity(prediction, text)
+            except Exception as e:
+                logging.error(f"Batch item {index} failed: {str(e)}")
+                item = {'error': 'Analysis failed for this item'}
+
+            item['index'] = index
+            results.append(item)
+
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'errors': sum(1 for item in results if 'error' in item)
+        })
+
+    except Exception as e:
+        logging.error(f"Error in batch detection: {str(e)}")
+        return jsonify({'error': 'Analysis temporarily unavailable. Please try again.'}), 500
+
+# Detector result fields returned to clients as they are
+PASSTHROUGH_FIELDS = ('profile', 'decided_by', 'cascade', 'model_unavailable', 'statistical_unavailable', 'near_duplicate', 'timings')
+
 def enhance_analysis_creativity(result, text):
     """Make the analysis more creative and engaging"""
+    document = as_document(text)
     
     # Determine if it's fake or real
     prediction = result.get('prediction', 'unknown')
@@ -87,11 +217,11 @@ def enhance_analysis_creativity(result, text):
     is_fake = prediction.lower() in ['fake', 'false', 'unreliable']
     
     # Creative analysis components
-    creative_insights = generate_creative_insights(text, is_fake, confidence)
-    risk_factors = analyze_risk_factors(text, is_fake)
+    creative_insights = generate_creative_insights(document, is_fake, confidence)
+    risk_factors = analyze_risk_factors(document, is_fake)
     recommendations = generate_recommendations(is_fake, confidence)
     
-    return {
+    enhanced = {
         'prediction': prediction,
         'confidence': confidence,
         'sources_matched': result.get('sources_matched', []),
@@ -101,19 +231,27 @@ def enhance_analysis_creativity(result, text):
             'risk_factors': risk_factors,
             'recommendations': recommendations,
             'credibility_score': calculate_credibility_score(confidence, is_fake),
-            'analysis_summary': generate_analysis_summary(text, is_fake, confidence)
+            'analysis_summary': generate_analysis_summary(document, is_fake, confidence)
         }
     }
+    
+    # Profile, deciding tier (rules, model, a near-duplicate's stored verdict) and requested timings
+    for field in PASSTHROUGH_FIELDS:
+        if field in result:
+            enhanced[field] = result[field]
+    
+    return enhanced
 
 def create_creative_fallback_analysis(text):
     """Create a creative fallback analysis when the main detector is unavailable"""
     
     # Analyze text characteristics for creative insights
-    word_count = len(text.split())
-    has_caps = any(word.isupper() for word in text.split())
-    has_numbers = any(char.isdigit() for char in text)
-    has_exclamation = '!' in text
-    has_question = '?' in text
+    document = as_document(text)
+    word_count = document.word_count
+    has_caps = document.has_uppercase_word
+    has_numbers = document.has_digit
+    has_exclamation = '!' in document.text
+    has_question = '?' in document.text
     
     # Generate prediction based on simple heuristics
     suspicion_score = 0
@@ -130,8 +268,8 @@ def create_creative_fallback_analysis(text):
     prediction = 'fake' if is_fake else 'real'
     
     # Generate creative analysis
-    creative_insights = generate_creative_insights(text, is_fake, confidence)
-    risk_factors = analyze_risk_factors(text, is_fake)
+    creative_insights = generate_creative_insights(document, is_fake, confidence)
+    risk_factors = analyze_risk_factors(document, is_fake)
     recommendations = generate_recommendations(is_fake, confidence)
     
     return {
@@ -144,7 +282,7 @@ def create_creative_fallback_analysis(text):
             'risk_factors': risk_factors,
             'recommendations': recommendations,
             'credibility_score': calculate_credibility_score(confidence, is_fake),
-            'analysis_summary': generate_analysis_summary(text, is_fake, confidence),
+            'analysis_summary': generate_analysis_summary(document, is_fake, confidence),
             'note': '🔬 Analysis performed using linguistic patterns and heuristics'
         }
     }
@@ -154,9 +292,10 @@ def generate_creative_insights(text, is_fake, confidence):
     insights = []
     
     # Analyze text characteristics
-    word_count = len(text.split())
-    sentence_count = len([s for s in text.split('.') if s.strip()])
-    avg_word_length = sum(len(word) for word in text.split()) / max(word_count, 1)
+    document = as_document(text)
+    word_count = document.word_count
+    sentence_count = document.sentence_count
+    avg_word_length = document.avg_word_length
     
     # Linguistic insights
     if avg_word_length > 6:
@@ -169,17 +308,18 @@ def generate_creative_insights(text, is_fake, confidence):
     
     # Emotional indicators
     emotional_words = ['shocking', 'unbelievable', 'amazing', 'terrible', 'incredible', 'devastating']
-    if any(word in text.lower() for word in emotional_words):
+    if any(word in document.lower for word in emotional_words):
         insights.append("⚡ Contains emotional language - may be designed to provoke reaction")
     
     # Specificity check
-    if any(char.isdigit() for char in text):
+    if document.has_digit:
         insights.append("🔢 Includes specific numbers or dates - adds credibility")
     
     return insights[:3]  # Limit to top 3 insights
 
 def analyze_risk_factors(text, is_fake):
     """Analyze potential risk factors in the text"""
+    document = as_document(text)
     risk_factors = []
     
     if is_fake:
@@ -196,10 +336,10 @@ def analyze_risk_factors(text, is_fake):
         ])
     
     # Additional risk factors based on text analysis
-    if '!!!' in text:
+    if '!!!' in document.text:
         risk_factors.append("❗ Excessive punctuation may indicate sensationalism")
     
-    if len(text.split()) < 30:
+    if document.word_count < 30:
         risk_factors.append("📏 Short content - may lack context or detail")
     
     return risk_factors[:4]  # Limit to top 4 risk factors
@@ -251,7 +391,7 @@ def calculate_credibility_score(confidence, is_fake):
 
 def generate_analysis_summary(text, is_fake, confidence):
     """Generate a comprehensive analysis summary"""
-    word_count = len(text.split())
+    word_count = as_document(text).word_count
     
     if is_fake:
         return f"🔍 Analysis of {word_count} words reveals potential misinformation patterns. " \
@@ -260,6 +400,190 @@ def generate_analysis_summary(text, is_fake, confidence):
         return f"📰 Analysis of {word_count} words suggests authentic news content. " \
                f"Confidence level: {confidence:.1%}. Content appears to follow journalistic standards."
 
+@app.route('/healthz')
+def healthz():
+    """Liveness: the process is up and serving requests"""
+    return jsonify({'status': 'ok', 'components': dict(component_status)})
+
+@app.route('/readyz')
+def readyz():
+    """
+    Readiness: requests can be answered by the detector. The model and the
+    database may still be warming up; their state is reported alongside.
+    """
+    ready = component_status['detector'] == 'ready'
+    body = {'ready': ready, 'components': dict(component_status)}
+    return jsonify(body), 200 if ready else 503
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus text exposition of stage latencies, cache and storage counters"""
+    parts = [render_samples(
+        'fnd_component_ready', 'Whether a component finished initializing',
+        [({'component': name}, int(state == 'ready')) for name, state in component_status.items()]
+    )]
+
+    if detector:
+        parts.append(render_samples(
+            'fnd_metrics_enabled', 'Whether stage latency recording is enabled',
+            [({}, int(detector.metrics.enabled))]
+        ))
+        parts.append(detector.metrics.render_prometheus())
+
+        cache_stats = detector.cache_stats()
+        for field in ('hits', 'misses', 'evictions', 'expirations'):
+            parts.append(render_samples(
+                f'fnd_cache_{field}_total', f'Result cache {field} per tier',
+                [({'tier': tier}, stats[field]) for tier, stats in cache_stats.items()], 'counter'
+            ))
+        parts.append(render_samples(
+            'fnd_cache_entries', 'Result cache entries per tier',
+            [({'tier': tier}, stats['entries']) for tier, stats in cache_stats.items()]
+        ))
+
+        cascade_stats = detector.cascade_stats()
+        parts.append(render_samples(
+            'fnd_cascade_decisions_total', 'Cascade decisions per deciding tier',
+            [({'tier': tier}, count) for tier, count in cascade_stats['decisions'].items()], 'counter'
+        ))
+
+        lemma_stats = detector.lemma_stats()
+        if lemma_stats:
+            parts.append(render_samples(
+                'fnd_lemma_cache_lookups_total', 'Lemma cache lookups per outcome',
+                [({'outcome': 'hit'}, lemma_stats['hits']), ({'outcome': 'miss'}, lemma_stats['misses'])],
+                'counter'
+            ))
+            parts.append(render_samples(
+                'fnd_lemma_cache_entries', 'Tokens memoized in the lemma cache',
+                [({}, lemma_stats['entries'])]
+            ))
+
+        if detector.rule_pool:
+            pool_stats = detector.rule_pool.stats()
+            parts.append(render_samples(
+                'fnd_process_pool_tasks_total', 'Rule analysis tasks per outcome',
+                [({'outcome': outcome}, pool_stats[outcome]) for outcome in ('completed', 'failed', 'cancelled')],
+                'counter'
+            ))
+            parts.append(render_samples(
+                'fnd_process_pool_in_flight', 'Rule analysis tasks queued or running in worker processes',
+                [({}, pool_stats['in_flight'])]
+            ))
+
+        if detector.inference_server:
+            inference_stats = detector.inference_server.stats()
+            parts.append(render_samples(
+                'fnd_inference_requests_total', 'Texts classified by the inference worker',
+                [({}, inference_stats['requests'])], 'counter'
+            ))
+            parts.append(render_samples(
+                'fnd_inference_batches_total', 'Forward passes run by the inference worker',
+                [({}, inference_stats['batches'])], 'counter'
+            ))
+            parts.append(render_samples(
+                'fnd_inference_queue_depth', 'Texts waiting for the inference worker',
+                [({}, inference_stats['queue_depth'])]
+            ))
+
+    if db_handler:
+        writer_stats = db_handler.writer_stats()
+        if writer_stats:
+            parts.append(render_samples(
+                'fnd_storage_documents_total', 'Prediction documents handled by the write-behind queue',
+                [({'outcome': key}, writer_stats[key]) for key in ('enqueued', 'written', 'dropped', 'failed')],
+                'counter'
+            ))
+            parts.append(render_samples(
+                'fnd_storage_queue_depth', 'Prediction documents waiting to be written',
+                [({}, writer_stats['queue_depth'])]
+            ))
+
+    return Response(''.join(parts), mimetype='text/plain; version=0.0.4')
+
+@app.route('/metrics/config', methods=['GET', 'POST'])
+def metrics_config():
+    """Inspect or toggle stage latency recording at runtime (POST needs METRICS_CONFIG_WRITABLE and X-Admin-Token)"""
+    if request.method == 'POST':
+        error = admin_error(Config.METRICS_CONFIG_WRITABLE, 'Metrics configuration')
+        if error:
+            return error
+    if not detector:
+        return jsonify({'error': 'Detector not available'}), 503
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+        if 'enabled' in data:
+            detector.metrics.enabled = bool(data['enabled'])
+        if data.get('reset'):
+            detector.metrics.reset()
+    return jsonify({'enabled': detector.metrics.enabled, 'stages': detector.metrics.summary()})
+
+@app.route('/api/stages')
+def get_stages():
+    """Analysis stages with declared and measured cost, the profiles and cascade decisions"""
+    if not detector:
+        return jsonify({'error': 'Detector not available'}), 503
+    return jsonify(detector.stage_info())
+
+def admin_error(enabled, feature):
+    """None if an administrative request may proceed, otherwise the error response"""
+    if not enabled:
+        return jsonify({'error': f'{feature} is disabled'}), 403
+    token = request.headers.get('X-Admin-Token', '')
+    if not Config.ADMIN_TOKEN or not hmac.compare_digest(token.encode(), Config.ADMIN_TOKEN.encode()):
+        return jsonify({'error': 'Missing or invalid X-Admin-Token header'}), 401
+    return None
+
+@app.route('/api/feedback', methods=['POST'])
+def submit_feedback():
+    """
+    Reviewer labels for the statistical classifier: {"text": ..., "label": "fake"|"real"}
+    or {"items": [...]}. The model is updated incrementally and swapped in without downtime.
+    Requires FEEDBACK_ENABLED and the ADMIN_TOKEN shared secret in the X-Admin-Token header.
+    """
+    error = admin_error(Config.FEEDBACK_ENABLED, 'Feedback')
+    if error:
+        return error
+    if not detector:
+        return jsonify({'error': 'Detector not available'}), 503
+
+    data = request.get_json(silent=True)
+    items = data.get('items', [data]) if isinstance(data, dict) else data
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'Expected {"text", "label"} or {"items": [...]}'}), 400
+    if len(items) > Config.MAX_FEEDBACK_ITEMS:
+        return jsonify({'error': f'Too many items (max {Config.MAX_FEEDBACK_ITEMS})'}), 413
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get('text'), str) or not item['text'].strip() \
+                or item.get('label') is None:
+            return jsonify({'error': f'Item {index} needs a non-empty text and a label'}), 400
+
+    try:
+        update = detector.update_statistical_model([item['text'] for item in items],
+                                                   [item['label'] for item in items])
+    except LookupError as e:
+        return jsonify({'error': str(e)}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logging.error(f"Feedback update failed: {str(e)}")
+        return jsonify({'error': 'Feedback could not be applied. Please try again.'}), 500
+    return jsonify(update)
+
+@app.route('/api/cache/stats')
+def get_cache_stats():
+    """Hit, miss and eviction statistics of the detector result cache and the near-duplicate index"""
+    if not detector:
+        return jsonify({'error': 'Detector not available'}), 503
+    stats = detector.cache_stats()
+    lemma_stats = detector.lemma_stats()
+    if lemma_stats:
+        stats['lemmas'] = lemma_stats
+    near_duplicate_stats = detector.near_duplicate_stats()
+    if near_duplicate_stats:
+        stats['near_duplicates'] = near_duplicate_stats
+    return jsonify(stats)
+
 @app.route('/api/history')
 def get_history():
     try:
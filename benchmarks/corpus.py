@@ -0,0 +1,70 @@
+import random
+from typing import List
+from src.data.trusted_sources import TRUSTED_SOURCES, UNRELIABLE_SOURCES
+from src.data.indicator_lexicons import (
+    FAKE_INDICATORS, TRUSTED_INDICATORS, CONSPIRACY_KEYWORDS, NEWS_LANGUAGE_PATTERNS
+)
+
+# Approximate document sizes in characters
+SIZE_CLASSES = {
+    'tweet': 280,
+    'short': 2000,
+    'article': 20000,
+    'long': 100000
+}
+
+FILLER_WORDS = [
+    'the', 'government', 'announced', 'new', 'policy', 'on', 'energy', 'and', 'climate',
+    'officials', 'said', 'in', 'a', 'statement', 'that', 'market', 'prices', 'rose', 'after',
+    'report', 'was', 'published', 'by', 'researchers', 'at', 'university', 'with', 'data',
+    'showing', 'increase', 'of', 'cases', 'across', 'several', 'regions', 'while', 'critics',
+    'argue', 'plan', 'could', 'affect', 'local', 'communities', 'economy', 'election', 'vote'
+]
+
+PROPER_NOUNS = ['Washington', 'London', 'Berlin', 'Tokyo', 'Europe', 'Canada', 'John Smith', 'Maria Lopez']
+MONTHS = ['January', 'March', 'June', 'September', 'November']
+
+
+def _sentence(rng: random.Random, fake_ratio: float) -> str:
+    words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 22))]
+
+    # Sprinkle in phrases the analyzers look for
+    roll = rng.random()
+    if roll < fake_ratio:
+        words.insert(rng.randrange(len(words)), rng.choice(FAKE_INDICATORS + CONSPIRACY_KEYWORDS))
+    elif roll < fake_ratio + 0.3:
+        words.insert(rng.randrange(len(words)), rng.choice(TRUSTED_INDICATORS + NEWS_LANGUAGE_PATTERNS))
+    if rng.random() < 0.15:
+        words.insert(rng.randrange(len(words)), rng.choice(TRUSTED_SOURCES + UNRELIABLE_SOURCES))
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words)), rng.choice(PROPER_NOUNS))
+    if rng.random() < 0.15:
+        words.append(f"on {rng.choice(MONTHS)} {rng.randint(1, 28)}, {rng.randint(2018, 2025)}")
+    if rng.random() < 0.15:
+        words.append(f"{rng.randint(2, 900)} percent")
+    if rng.random() < 0.05:
+        words.append(f"https://example{rng.randint(1, 50)}.com/story/{rng.randint(1000, 9999)}")
+
+    sentence = ' '.join(words)
+    if rng.random() < 0.1:
+        sentence = f'"{sentence}"'
+    ending = '!' if rng.random() < fake_ratio / 2 else '.'
+    return sentence[0].upper() + sentence[1:] + ending
+
+
+def generate_document(size: int, rng: random.Random, fake_ratio: float = 0.2) -> str:
+    """Generate one synthetic news text of roughly `size` characters"""
+    sentences = []
+    length = 0
+    while length < size:
+        sentence = _sentence(rng, fake_ratio)
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return ' '.join(sentences)[:max(size, 1)]
+
+
+def generate_corpus(size_class: str, count: int, seed: int = 42, fake_ratio: float = 0.2) -> List[str]:
+    """Deterministic corpus of `count` documents of the given size class"""
+    rng = random.Random(f"{seed}-{size_class}")
+    size = SIZE_CLASSES[size_class]
+    return [generate_document(size, rng, fake_ratio) for _ in range(count)]
@@ -0,0 +1,270 @@
+"""
+Benchmark suite for the detection hot paths.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --compare baseline.json --threshold 0.15
+
+Every benchmark runs over a deterministic synthetic corpus per size class
+and reports throughput plus p50/p90/p99 latency. With --compare, results
+are checked against a stored baseline and the exit code is 1 if any
+benchmark regressed by more than the threshold.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# Benchmarks measure the code, not the UX delay, warm-up threads or the result cache
+os.environ.setdefault('RESPONSE_DELAY_SECONDS', '0')
+os.environ.setdefault('AUTO_INITIALIZE', 'false')
+
+from benchmarks.corpus import SIZE_CLASSES, generate_corpus
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark setup when its dependencies are unavailable"""
+
+
+class _StubClassifier:
+    """Stands in for the transformers pipeline; returns a fixed label instantly"""
+
+    def __call__(self, texts, batch_size=None, **kwargs):
+        if isinstance(texts, str):
+            return [{'label': 'POSITIVE', 'score': 0.9}]
+        return [{'label': 'POSITIVE', 'score': 0.9} for _ in texts]
+
+
+def _build_detector(real_model: bool):
+    try:
+        from src.models.fake_news_detector import FakeNewsDetector
+        from src.models.inference_server import BatchingInferenceServer
+        detector = FakeNewsDetector(load_model=False)
+    except Exception as e:
+        reason = next((line.strip() for line in str(e).splitlines() if line.strip(' *')), type(e).__name__)
+        raise BenchmarkSkipped(f"FakeNewsDetector unavailable: {reason}")
+
+    if real_model:
+        detector.load_model()
+        if not detector.model_ready:
+            raise BenchmarkSkipped("transformer model could not be loaded")
+    else:
+        stub = _StubClassifier()
+        detector.classifier = stub
+        detector.model_name = 'stub'
+        detector.inference_server = BatchingInferenceServer(stub, batch_size=detector.config.BATCH_SIZE, max_wait_ms=0)
+        detector.model_status = 'ready'
+
+    # Identical corpus documents must not turn into cache hits
+    detector.cache.enabled = False
+    return detector
+
+
+def setup_kmp_matcher() -> Callable[[str], object]:
+    from src.algorithms.kmp_matcher import KMPMatcher
+    matcher = KMPMatcher()
+    return matcher.analyze_text_comprehensive
+
+
+def setup_preprocessor() -> Callable[[str], object]:
+    from src.utils.text_preprocessor import TextPreprocessor
+    preprocessor = TextPreprocessor()
+    return preprocessor.preprocess
+
+
+def setup_preprocessor_lightweight() -> Callable[[str], object]:
+    from src.utils.text_preprocessor import TextPreprocessor
+    preprocessor = TextPreprocessor(lightweight=True)
+    return preprocessor.preprocess_tokens
+
+
+def setup_predict_stub() -> Callable[[str], object]:
+    return _build_detector(real_model=False).predict
+
+
+def setup_predict_model() -> Callable[[str], object]:
+    return _build_detector(real_model=True).predict
+
+
+def setup_api_detect() -> Callable[[str], object]:
+    import app as app_module
+    app_module.detector = _build_detector(real_model=False)
+    app_module.db_handler = None
+    client = app_module.app.test_client()
+
+    def call(text):
+        response = client.post('/api/detect', json={'text': text})
+        if response.status_code != 200:
+            raise RuntimeError(f"/api/detect returned {response.status_code}")
+        return response
+
+    return call
+
+
+BENCHMARKS = {
+    'kmp_matcher.analyze_text_comprehensive': setup_kmp_matcher,
+    'text_preprocessor.preprocess': setup_preprocessor,
+    'text_preprocessor.preprocess_tokens[lightweight]': setup_preprocessor_lightweight,
+    'detector.predict[stub_model]': setup_predict_stub,
+    'detector.predict[model]': setup_predict_model,
+    'api.detect': setup_api_detect
+}
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def measure(func: Callable[[str], object], corpus: List[str], min_iterations: int = 20,
+            min_time: float = 0.5, max_time: float = 10.0, warmup: int = 3) -> Dict:
+    """Run func over the corpus (cycling) and summarise per-call latencies"""
+    for text in corpus[:warmup]:
+        func(text)
+
+    latencies = []
+    characters = 0
+    started = time.perf_counter()
+    index = 0
+    while True:
+        elapsed = time.perf_counter() - started
+        if len(latencies) >= min_iterations and elapsed >= min_time:
+            break
+        if latencies and elapsed >= max_time:
+            break
+
+        text = corpus[index % len(corpus)]
+        index += 1
+        call_start = time.perf_counter()
+        func(text)
+        latencies.append(time.perf_counter() - call_start)
+        characters += len(text)
+
+    total = sum(latencies)
+    latencies.sort()
+    return {
+        'iterations': len(latencies),
+        'docs_per_sec': len(latencies) / total if total else 0.0,
+        'mb_per_sec': characters / total / 1e6 if total else 0.0,
+        'mean_ms': 1000 * statistics.fmean(latencies),
+        'p50_ms': 1000 * _percentile(latencies, 0.50),
+        'p90_ms': 1000 * _percentile(latencies, 0.90),
+        'p99_ms': 1000 * _percentile(latencies, 0.99)
+    }
+
+
+def run(benchmarks: List[str], sizes: List[str], corpus_size: int = 20, seed: int = 42,
+        min_iterations: int = 20, min_time: float = 0.5, max_time: float = 10.0) -> Dict:
+    corpora = {size: generate_corpus(size, corpus_size, seed) for size in sizes}
+    results = {}
+    skipped = {}
+
+    for name in benchmarks:
+        try:
+            func = BENCHMARKS[name]()
+        except BenchmarkSkipped as e:
+            skipped[name] = str(e)
+            print(f"- {name}: skipped ({e})", file=sys.stderr)
+            continue
+
+        results[name] = {}
+        for size in sizes:
+            stats = measure(func, corpora[size], min_iterations, min_time, max_time)
+            results[name][size] = stats
+            print(f"- {name} [{size}]: {stats['docs_per_sec']:.1f} docs/s, "
+                  f"p50 {stats['p50_ms']:.3f} ms, p99 {stats['p99_ms']:.3f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'corpus_size': corpus_size,
+            'sizes': {size: SIZE_CLASSES[size] for size in sizes}
+        },
+        'results': results,
+        'skipped': skipped
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.15) -> List[Dict]:
+    """
+    Regressions of `current` against `baseline`: latency (p50/p99) higher or
+    throughput lower by more than `threshold` (a fraction) for any benchmark
+    and size class present in both.
+    """
+    regressions = []
+    for name, sizes in current.get('results', {}).items():
+        for size, stats in sizes.items():
+            base = baseline.get('results', {}).get(name, {}).get(size)
+            if not base:
+                continue
+
+            for metric in ('p50_ms', 'p99_ms'):
+                if base[metric] > 0 and stats[metric] > base[metric] * (1 + threshold):
+                    regressions.append({
+                        'benchmark': name, 'size': size, 'metric': metric,
+                        'baseline': base[metric], 'current': stats[metric],
+                        'change': stats[metric] / base[metric] - 1
+                    })
+
+            if base['docs_per_sec'] > 0 and stats['docs_per_sec'] < base['docs_per_sec'] * (1 - threshold):
+                regressions.append({
+                    'benchmark': name, 'size': size, 'metric': 'docs_per_sec',
+                    'baseline': base['docs_per_sec'], 'current': stats['docs_per_sec'],
+                    'change': stats['docs_per_sec'] / base['docs_per_sec'] - 1
+                })
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Benchmark detector, matcher and preprocessor hot paths')
+    parser.add_argument('--benchmarks', nargs='+', choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZE_CLASSES), default=list(SIZE_CLASSES))
+    parser.add_argument('--corpus-size', type=int, default=20, help='documents per size class')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--min-iterations', type=int, default=20)
+    parser.add_argument('--min-time', type=float, default=0.5, help='minimum seconds per benchmark and size')
+    parser.add_argument('--max-time', type=float, default=10.0, help='maximum seconds per benchmark and size')
+    parser.add_argument('--output', help='write results JSON here')
+    parser.add_argument('--compare', metavar='BASELINE', help='baseline JSON to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.15, help='allowed relative slowdown (0.15 = 15%%)')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    results = run(args.benchmarks, args.sizes, args.corpus_size, args.seed,
+                  args.min_iterations, args.min_time, args.max_time)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for item in regressions:
+            print(f"REGRESSION {item['benchmark']} [{item['size']}] {item['metric']}: "
+                  f"{item['baseline']:.3f} -> {item['current']:.3f} ({item['change']:+.1%})", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
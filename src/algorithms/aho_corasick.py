@@ -0,0 +1,100 @@
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick multi-pattern string matching automaton.
+
+    All patterns are compiled once into a trie with failure links, so every
+    occurrence of every pattern is found in a single linear pass over the
+    text, independent of how many patterns were compiled. Matching is case
+    insensitive and reports overlapping occurrences, exactly like
+    KMPMatcher.kmp_search.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        seen = set()
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self.patterns.append(pattern)
+            self._add_pattern(pattern, len(self.patterns) - 1)
+
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, pattern_id: int):
+        """Insert a pattern into the trie"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self):
+        """
+        Breadth-first construction of failure links. Each state's output list
+        is extended with the outputs of its failure state so that a single
+        lookup reports every pattern ending at the current position.
+        """
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._fail[next_state] == next_state:
+                    self._fail[next_state] = 0
+
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def search(self, text: str) -> Dict[str, List[int]]:
+        """
+        Find every occurrence of every compiled pattern in one pass.
+        Returns a mapping of pattern -> sorted list of starting indices,
+        containing only the patterns that were found.
+        """
+        text = text.lower()
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        patterns = self.patterns
+
+        matches = {}
+        state = 0
+
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                pattern = patterns[pattern_id]
+                start = i - len(pattern) + 1
+                if pattern in matches:
+                    matches[pattern].append(start)
+                else:
+                    matches[pattern] = [start]
+
+        return matches
+
+    def __len__(self) -> int:
+        return len(self.patterns)
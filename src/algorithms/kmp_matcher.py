@@ -1,6 +1,7 @@
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from src.data.trusted_sources import TRUSTED_SOURCES, UNRELIABLE_SOURCES
+from src.algorithms.aho_corasick import AhoCorasickAutomaton
 import logging
 
 class KMPMatcher:
@@ -13,6 +14,36 @@ class KMPMatcher:
         self.trusted_sources = TRUSTED_SOURCES
         self.unreliable_sources = UNRELIABLE_SOURCES
         self.fake_news_patterns = self._load_fake_news_patterns()
+        self.compile_patterns()
+    
+    def compile_patterns(self):
+        """
+        Compile all sources and fake news patterns into a single Aho-Corasick
+        automaton. Call again after modifying the pattern lists.
+        """
+        self.automaton = AhoCorasickAutomaton(
+            list(self.trusted_sources) + list(self.unreliable_sources) + list(self.fake_news_patterns)
+        )
+    
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """
+        Find every source and fake news pattern in one linear pass.
+        Returns a mapping of lowercased pattern -> starting indices.
+        """
+        return self.automaton.search(text)
+    
+    def _collect_matches(self, patterns: List[str], found: Dict[str, List[int]], key: str) -> List[Dict]:
+        """Build match entries for the patterns of one list, in list order"""
+        matched = []
+        for pattern in patterns:
+            positions = found.get(pattern.lower())
+            if positions:
+                matched.append({
+                    key: pattern,
+                    'positions': list(positions),
+                    'count': len(positions)
+                })
+        return matched
     
     def _load_fake_news_patterns(self) -> List[str]:
         """Load common fake news patterns for KMP matching"""
@@ -91,34 +122,18 @@ class KMPMatcher:
         
         return matches
     
-    def verify_sources(self, text: str) -> Dict:
+    def verify_sources(self, text: str, found: Optional[Dict[str, List[int]]] = None) -> Dict:
         """
-        Verify news sources using KMP matching
+        Verify news sources using multi-pattern matching
         Returns reliability score and matched sources
         """
         try:
-            matched_trusted = []
-            matched_unreliable = []
+            if found is None:
+                found = self.find_all(text)
             
-            # Check for trusted sources
-            for source in self.trusted_sources:
-                matches = self.kmp_search(text, source)
-                if matches:
-                    matched_trusted.append({
-                        'source': source,
-                        'positions': matches,
-                        'count': len(matches)
-                    })
-            
-            # Check for unreliable sources
-            for source in self.unreliable_sources:
-                matches = self.kmp_search(text, source)
-                if matches:
-                    matched_unreliable.append({
-                        'source': source,
-                        'positions': matches,
-                        'count': len(matches)
-                    })
+            # Check for trusted and unreliable sources
+            matched_trusted = self._collect_matches(self.trusted_sources, found, 'source')
+            matched_unreliable = self._collect_matches(self.unreliable_sources, found, 'source')
             
             # Calculate reliability score
             reliability_score = self._calculate_reliability_score(
@@ -144,20 +159,14 @@ class KMPMatcher:
                 'total_unreliable_matches': 0
             }
     
-    def detect_fake_patterns(self, text: str) -> Dict:
+    def detect_fake_patterns(self, text: str, found: Optional[Dict[str, List[int]]] = None) -> Dict:
         """
-        Detect common fake news patterns using KMP matching
+        Detect common fake news patterns using multi-pattern matching
         """
-        pattern_matches = []
+        if found is None:
+            found = self.find_all(text)
         
-        for pattern in self.fake_news_patterns:
-            matches = self.kmp_search(text, pattern)
-            if matches:
-                pattern_matches.append({
-                    'pattern': pattern,
-                    'positions': matches,
-                    'count': len(matches)
-                })
+        pattern_matches = self._collect_matches(self.fake_news_patterns, found, 'pattern')
         
         # Calculate suspicion score based on pattern matches
         suspicion_score = min(len(pattern_matches) * 0.1, 1.0)
@@ -192,8 +201,10 @@ class KMPMatcher:
         """
         Comprehensive analysis combining source verification and pattern detection
         """
-        source_analysis = self.verify_sources(text)
-        pattern_analysis = self.detect_fake_patterns(text)
+        # Single pass shared by source verification and pattern detection
+        found = self.find_all(text)
+        source_analysis = self.verify_sources(text, found)
+        pattern_analysis = self.detect_fake_patterns(text, found)
         
         # Combine scores
         final_reliability = source_analysis['reliability_score'] * (1 - pattern_analysis['suspicion_score'])
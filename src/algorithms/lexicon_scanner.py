@@ -0,0 +1,141 @@
+import hashlib
+import json
+from typing import Dict, List, Optional
+from src.algorithms.aho_corasick import AhoCorasickAutomaton
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class LexiconHits:
+    """
+    Result of a single LexiconScanner pass over a text.
+    Offsets refer to positions in the lowercased text.
+    """
+
+    def __init__(self, phrase_offsets: Dict[str, List[int]], categories: Dict[str, List[str]], text_length: int):
+        self.phrase_offsets = phrase_offsets
+        self.categories = categories
+        self.text_length = text_length
+
+    def has(self, phrase: str) -> bool:
+        """Whether a single phrase was found"""
+        return phrase.lower() in self.phrase_offsets
+
+    def offsets(self, category: str) -> Dict[str, List[int]]:
+        """Matched phrases of a category with their offsets"""
+        return {
+            phrase: self.phrase_offsets[phrase]
+            for phrase in self.categories[category]
+            if phrase in self.phrase_offsets
+        }
+
+    def count(self, category: str) -> int:
+        """Number of distinct phrases of a category found in the text"""
+        return sum(1 for phrase in self.categories[category] if phrase in self.phrase_offsets)
+
+    def total(self, category: str) -> int:
+        """Total number of occurrences of all phrases of a category"""
+        return sum(len(self.phrase_offsets.get(phrase, ())) for phrase in self.categories[category])
+
+    def any_within(self, category: str, start: int = 0, end: Optional[int] = None) -> bool:
+        """
+        Whether any phrase of a category occurs entirely inside text[start:end].
+        Negative bounds are interpreted like slice indices.
+        """
+        if end is None:
+            end = self.text_length
+        if start < 0:
+            start = max(self.text_length + start, 0)
+        if end < 0:
+            end = max(self.text_length + end, 0)
+
+        for phrase in self.categories[category]:
+            for offset in self.phrase_offsets.get(phrase, ()):
+                if offset >= start and offset + len(phrase) <= end:
+                    return True
+        return False
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Per-category hit counts and offsets"""
+        summary = {}
+        for category in self.categories:
+            offsets = self.offsets(category)
+            if offsets:
+                summary[category] = {
+                    'count': len(offsets),
+                    'occurrences': sum(len(positions) for positions in offsets.values()),
+                    'offsets': offsets
+                }
+        return summary
+
+
+class LexiconScanner:
+    """
+    Compiled scanner for named phrase categories.
+
+    Every phrase of every category is compiled into one Aho-Corasick
+    automaton, so the text is scanned once regardless of how many
+    categories and phrases there are. Phrases match as substrings, like the
+    `phrase in text` checks they replace, so 'governments' still counts as
+    'government'. Only phrases of at most `boundary_max_length` characters
+    (abbreviations such as 'u' or 'r') must not be glued to surrounding
+    word characters (the same rule as regex \\b), so they no longer match
+    inside other words. boundary_max_length=None applies the boundary rule
+    to every phrase; word_boundaries=False to none.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]], word_boundaries: bool = True,
+                 boundary_max_length: Optional[int] = 2):
+        self.categories = {
+            name: [phrase.lower() for phrase in phrases if phrase]
+            for name, phrases in categories.items()
+        }
+        self.word_boundaries = word_boundaries
+        self.boundary_max_length = boundary_max_length
+
+        all_phrases = [phrase for phrases in self.categories.values() for phrase in phrases]
+        self.automaton = AhoCorasickAutomaton(all_phrases)
+
+    def fingerprint(self) -> str:
+        """Short digest of the compiled categories; changes whenever a phrase list changes"""
+        payload = json.dumps([self.categories, self.word_boundaries, self.boundary_max_length], sort_keys=True)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+    def scan(self, text: str) -> LexiconHits:
+        """Scan the text once and return hits for every category"""
+        return self.scan_lower((text or '').lower())
+
+    def scan_lower(self, text_lower: str) -> LexiconHits:
+        """scan() for a text the caller has already lowercased"""
+        found = self.automaton.search(text_lower)
+
+        if self.word_boundaries:
+            found = self._filter_boundaries(text_lower, found)
+
+        return LexiconHits(found, self.categories, len(text_lower))
+
+    def _filter_boundaries(self, text_lower: str, found: Dict[str, List[int]]) -> Dict[str, List[int]]:
+        """Drop matches of boundary-checked phrases that start or end inside a word"""
+        filtered = {}
+        text_length = len(text_lower)
+
+        for phrase, positions in found.items():
+            if self.boundary_max_length is not None and len(phrase) > self.boundary_max_length:
+                filtered[phrase] = positions
+                continue
+            check_start = _is_word_char(phrase[0])
+            check_end = _is_word_char(phrase[-1])
+            kept = []
+            for start in positions:
+                end = start + len(phrase)
+                if check_start and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if check_end and end < text_length and _is_word_char(text_lower[end]):
+                    continue
+                kept.append(start)
+            if kept:
+                filtered[phrase] = kept
+
+        return filtered
@@ -0,0 +1,40 @@
+"""
+Offline command line entry point.
+
+Usage:
+    python -m src.cli score input.jsonl -o scored.jsonl
+    python -m src.cli score - --format csv < input.csv
+    python -m src.cli export-onnx --output models/onnx
+    python -m src.cli parity --backend int8
+    python -m src.cli build-lemmas corpus.jsonl --top 50000
+    python -m src.cli nltk-data --archive dist/nltk_data.tar.gz
+    python -m src.cli features corpus.jsonl --output features.npz
+    python -m src.cli train-statistical labeled.jsonl --output models/statistical
+    python -m src.cli update-statistical relabeled.jsonl
+    python -m src.cli build-duplicate-index --input predictions.jsonl
+"""
+import argparse
+import logging
+import sys
+
+from src.cli import duplicates, features, lemmas, model, nltk_data, score, statistical
+
+COMMANDS = [score, model, lemmas, nltk_data, features, statistical, duplicates]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m src.cli', description='Fake news detector command line tools')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for command in COMMANDS:
+        command.register(subparsers)
+    return parser
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Rebuild the near-duplicate index from stored predictions.
+
+    python -m src.cli build-duplicate-index
+    python -m src.cli build-duplicate-index --input predictions.jsonl --output models/near_duplicates.npz
+
+Without --input the MongoDB `predictions` collection is read, oldest
+first, so the newest verdicts win when the index is full. --input takes
+JSONL records with the same fields (e.g. a mongoexport dump). Texts are
+preprocessed as the detector does, so run this with the same
+PREPROCESS_LIGHTWEIGHT and NLTK data as the servers; servers load the
+index on first use after a restart.
+"""
+import io
+import json
+import sys
+
+from src.config.config import Config
+
+
+def read_predictions(stream):
+    """Yield the JSON objects of a JSONL stream; other lines are skipped"""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('build-duplicate-index',
+                                   help='Rebuild the near-duplicate index from stored predictions')
+    parser.add_argument('--input', default=None,
+                        help="JSONL predictions instead of MongoDB, or '-' for stdin")
+    parser.add_argument('--output', default=Config.NEAR_DUPLICATE_INDEX_PATH)
+    parser.add_argument('--threshold', type=float, default=Config.NEAR_DUPLICATE_THRESHOLD)
+    parser.add_argument('--max-entries', type=int, default=Config.NEAR_DUPLICATE_MAX_ENTRIES)
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    from src.utils.near_duplicates import build_index
+    from src.utils.text_preprocessor import TextPreprocessor
+
+    preprocessor = TextPreprocessor(
+        lightweight=Config.PREPROCESS_LIGHTWEIGHT,
+        lemma_table=Config.LEMMA_TABLE_PATH,
+        lemma_cache_size=Config.LEMMA_CACHE_SIZE
+    )
+
+    db_handler = stream = None
+    try:
+        if args.input is None:
+            from src.database.mongo_handler import MongoHandler
+            try:
+                db_handler = MongoHandler()
+            except Exception as e:
+                print(f"Could not connect to MongoDB: {str(e)}", file=sys.stderr)
+                return 1
+            records = db_handler.iter_predictions(newest=args.max_entries)
+        elif args.input == '-':
+            records = read_predictions(io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8'))
+        else:
+            stream = open(args.input, encoding='utf-8')
+            records = read_predictions(stream)
+        index, indexed = build_index(records, preprocessor, args.threshold, args.max_entries)
+    finally:
+        if stream:
+            stream.close()
+        if db_handler:
+            db_handler.close()
+
+    index.save(args.output)
+    print(json.dumps({
+        'indexed': indexed,
+        'entries': len(index),
+        'preprocessing': index.preprocessing,
+        'output': args.output
+    }))
+    return 0
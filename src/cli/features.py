@@ -0,0 +1,70 @@
+"""
+Extract the text features of stored records for offline analytics.
+
+    python -m src.cli features corpus.jsonl --output features.npz
+
+Records (JSONL/CSV/text, as for `score`) are streamed through
+extract_features_batch() a chunk at a time. The output .npz holds the
+feature matrix (`values`, one row per record), its column names
+(`columns`) and the record ids (`ids`); per-column means go to stderr.
+"""
+import io
+import itertools
+import json
+import sys
+
+from src.cli.score import detect_format, read_records
+
+
+def extract(records, chunk_size: int = 10000):
+    """(ids, FeatureMatrix) of (record_id, text) pairs"""
+    from src.utils.batch_features import extract_features_batch
+
+    ids = []
+
+    def texts():
+        for record_id, text in records:
+            ids.append(record_id)
+            yield text if isinstance(text, str) else ''
+
+    matrix = extract_features_batch(texts(), chunk_size)
+    return ids, matrix
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('features', help='Extract text features of records into a NumPy archive')
+    parser.add_argument('input', help="input file, or '-' for stdin")
+    parser.add_argument('--output', required=True, help='output .npz file')
+    parser.add_argument('--format', choices=['auto', 'jsonl', 'csv', 'txt'], default='auto')
+    parser.add_argument('--text-field', default='text')
+    parser.add_argument('--id-field', default='id')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='records encoded per vectorized pass')
+    parser.add_argument('--limit', type=int, default=None, help='stop after this many records')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    import numpy as np
+
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'jsonl' if args.input == '-' else detect_format(args.input)
+
+    if args.input == '-':
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    else:
+        stream = open(args.input, encoding='utf-8', newline='')
+    try:
+        records = read_records(stream, fmt, args.text_field, args.id_field)
+        ids, matrix = extract(itertools.islice(records, args.limit), args.chunk_size)
+    finally:
+        stream.close()
+
+    np.savez(args.output, values=matrix.values, columns=np.array(matrix.columns),
+             ids=np.array([str(record_id) for record_id in ids]))
+    print(json.dumps({
+        'records': len(matrix),
+        'output': args.output,
+        'means': {name: float(matrix[name].mean()) if len(matrix) else 0.0 for name in matrix.columns}
+    }), file=sys.stderr)
+    return 0
@@ -0,0 +1,83 @@
+"""
+Build the precomputed lemma table that seeds LemmaCache.
+
+    python -m src.cli build-lemmas corpus.jsonl --top 50000
+    python -m src.cli build-lemmas frequencies.tsv --format frequency
+
+Tokens are counted over a corpus of records (JSONL/CSV/text, as for
+`score`) or taken from a word<TAB>count frequency list, and the most
+frequent ones are lemmatized once with WordNet.
+"""
+import io
+import json
+import sys
+from collections import Counter
+
+from src.config.config import Config
+from src.cli.score import detect_format, read_records
+from src.utils.lemma_cache import save_lemma_table
+from src.utils.nltk_resources import ensure_resource
+
+
+def count_tokens(stream, fmt: str, text_field: str) -> Counter:
+    from src.utils.text_preprocessor import TextPreprocessor
+    preprocessor = TextPreprocessor(lightweight=True)
+
+    counts = Counter()
+    if fmt == 'frequency':
+        for line in stream:
+            fields = line.split()
+            if len(fields) >= 2 and fields[1].isdigit():
+                counts[fields[0].lower()] += int(fields[1])
+            elif fields:
+                counts[fields[0].lower()] += 1
+        return counts
+
+    for _, text in read_records(stream, fmt, text_field):
+        if text:
+            counts.update(preprocessor.preprocess_tokens(text, remove_stopwords=False, lemmatize=False))
+    return counts
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('build-lemmas', help='Build the lemma table that seeds the lemma cache')
+    parser.add_argument('input', help="corpus or frequency list, or '-' for stdin")
+    parser.add_argument('--format', choices=['auto', 'jsonl', 'csv', 'txt', 'frequency'], default='auto')
+    parser.add_argument('--text-field', default='text')
+    parser.add_argument('--top', type=int, default=50000, help='number of most frequent tokens to keep')
+    parser.add_argument('--output', default=Config.LEMMA_TABLE_PATH)
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    if not ensure_resource('wordnet'):
+        print("WordNet data is not installed (python -m src.cli nltk-data)", file=sys.stderr)
+        return 1
+    from nltk.stem import WordNetLemmatizer
+    lemmatizer = WordNetLemmatizer()
+
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'jsonl' if args.input == '-' else detect_format(args.input)
+
+    if args.input == '-':
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    else:
+        stream = open(args.input, encoding='utf-8', newline='')
+    try:
+        counts = count_tokens(stream, fmt, args.text_field)
+    finally:
+        stream.close()
+
+    top = counts.most_common(args.top)
+    save_lemma_table(args.output, ((token, lemmatizer.lemmatize(token)) for token, _ in top))
+
+    total = sum(counts.values())
+    covered = sum(count for _, count in top)
+    print(json.dumps({
+        'distinct_tokens': len(counts),
+        'entries': len(top),
+        'token_coverage': covered / total if total else 0.0,
+        'output': args.output
+    }), file=sys.stderr)
+    return 0
@@ -0,0 +1,69 @@
+"""
+Offline model tooling for the inference backends.
+
+    python -m src.cli export-onnx --model martin-ha/toxic-comment-model --output models/onnx
+    python -m src.cli parity --backend onnx --onnx-dir models/onnx --samples 200
+"""
+import json
+import sys
+
+from src.config.config import Config
+from src.models.backends import BACKENDS, PyTorchBackend, check_parity, create_backend, export_onnx
+
+DEFAULT_MODEL = 'martin-ha/toxic-comment-model'
+
+
+def _load_texts(args):
+    if args.input:
+        from src.cli.score import detect_format, read_records
+        with open(args.input, encoding='utf-8', newline='') as f:
+            texts = [text for _, text in read_records(f, detect_format(args.input), args.text_field) if text]
+        return texts[:args.samples]
+
+    # Synthetic sample corpus shared with the benchmark suite
+    from benchmarks.corpus import generate_corpus
+    half = args.samples // 2
+    return generate_corpus('tweet', args.samples - half, seed=args.seed) + generate_corpus('short', half, seed=args.seed)
+
+
+def register(subparsers):
+    export = subparsers.add_parser('export-onnx', help='Export a classifier to ONNX (+ int8 quantized copy)')
+    export.add_argument('--model', default=DEFAULT_MODEL)
+    export.add_argument('--output', default=Config.ONNX_MODEL_DIR)
+    export.add_argument('--no-quantize', action='store_true', help='skip the int8 quantized copy')
+    export.add_argument('--opset', type=int, default=14)
+    export.set_defaults(func=run_export)
+
+    parity = subparsers.add_parser('parity', help='Check label agreement of a backend against full precision')
+    parity.add_argument('--backend', choices=[name for name in BACKENDS if name != 'pytorch'], default='int8')
+    parity.add_argument('--model', default=DEFAULT_MODEL, help='reference checkpoint')
+    parity.add_argument('--onnx-dir', default=Config.ONNX_MODEL_DIR)
+    parity.add_argument('--input', help='JSONL/CSV/text file of sample texts (default: synthetic corpus)')
+    parity.add_argument('--text-field', default='text')
+    parity.add_argument('--samples', type=int, default=200)
+    parity.add_argument('--seed', type=int, default=42)
+    parity.add_argument('--batch-size', type=int, default=Config.BATCH_SIZE)
+    parity.add_argument('--min-agreement', type=float, default=0.99)
+    parity.set_defaults(func=run_parity)
+
+
+def run_export(args) -> int:
+    meta = export_onnx(args.model, args.output, quantize=not args.no_quantize, opset=args.opset)
+    print(json.dumps(meta, indent=2))
+    return 0
+
+
+def run_parity(args) -> int:
+    texts = _load_texts(args)
+    reference = PyTorchBackend(args.model, Config.MAX_LENGTH)
+    candidate = create_backend(args.backend, args.model, Config.MAX_LENGTH, onnx_model_dir=args.onnx_dir)
+
+    report = check_parity(reference, candidate, texts, args.batch_size)
+    report['backend'] = args.backend
+    report['passed'] = report['agreement'] >= args.min_agreement
+    print(json.dumps(report, indent=2))
+
+    if not report['passed']:
+        print(f"Label agreement {report['agreement']:.3f} below {args.min_agreement}", file=sys.stderr)
+        return 1
+    return 0
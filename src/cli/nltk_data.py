@@ -0,0 +1,50 @@
+"""
+Provision NLTK data for offline workers.
+
+    python -m src.cli nltk-data                                  # download into NLTK_DATA_DIR
+    python -m src.cli nltk-data --archive dist/nltk_data.tar.gz  # ... and pack an artifact
+    python -m src.cli nltk-data --from-archive nltk_data.tar.gz  # install the artifact, offline
+    python -m src.cli nltk-data --check                          # report what is available
+
+Processes only look for the data locally at first use (see
+src/utils/nltk_resources.py), so a provisioned worker starts without
+touching the network.
+"""
+import json
+import sys
+
+from src.config.config import Config
+from src.utils import nltk_resources
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('nltk-data', help='Download or install the NLTK data used by the detector')
+    parser.add_argument('--output', default=Config.NLTK_DATA_DIR, help='local NLTK data directory')
+    parser.add_argument('--resources', nargs='+', choices=list(nltk_resources.RESOURCES),
+                        default=list(nltk_resources.RESOURCES))
+    parser.add_argument('--archive', help='also pack the directory into this .tar.gz artifact')
+    parser.add_argument('--from-archive', help='install a packed artifact instead of downloading')
+    parser.add_argument('--check', action='store_true', help='only report which resources are available')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    if args.from_archive:
+        nltk_resources.unpack(args.from_archive, args.output)
+    elif not args.check:
+        nltk_resources.provision(args.output, args.resources)
+
+    available = nltk_resources.status(args.resources, data_dir=args.output)
+    print(json.dumps(available), file=sys.stderr)
+
+    # punkt and punkt_tab are alternatives; only the one this NLTK version loads is required
+    required = [name for name in args.resources
+                if name not in ('punkt', 'punkt_tab') or name == nltk_resources.tokenizer_resource()]
+    if not all(available[name] for name in required):
+        return 1
+
+    if args.archive and not args.check:
+        nltk_resources.pack(args.output, args.archive)
+        print(f"packed {args.output} into {args.archive}", file=sys.stderr)
+    return 0
+
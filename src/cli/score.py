@@ -0,0 +1,275 @@
+"""
+Bulk scoring of JSONL/CSV/plain-text records.
+
+Records are read lazily and scored in chunks on a pool of worker
+processes, each holding its own rule-based FakeNewsDetector. At most
+`window` chunks are in flight, so memory stays bounded regardless of
+input size, and results are written in input order. With --model the
+transformer runs once in the parent process and scores each finished
+chunk in batched forward passes. Checkpoints record how many records
+have been written and the output offset, so an interrupted run can be
+resumed with --resume.
+"""
+import csv
+import io
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Per-process detector used by pool workers
+_detector = None
+
+
+def _make_detector(load_model: bool = False):
+    # Imported lazily so the CLI and idle workers start quickly
+    from src.models.fake_news_detector import FakeNewsDetector
+    return FakeNewsDetector(load_model=load_model)
+
+
+def _init_worker():
+    global _detector
+    logging.disable(logging.WARNING)
+    _detector = _make_detector(load_model=False)
+
+
+def _score_chunk(texts: List[Optional[str]]) -> List[Dict]:
+    if _detector is None:
+        _init_worker()
+    return _detector.predict_batch(texts)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs tasks in the calling process (--workers 0)"""
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension == '.txt':
+        return 'txt'
+    return 'jsonl'
+
+
+def read_records(stream: Iterable[str], fmt: str = 'jsonl', text_field: str = 'text',
+                 id_field: str = 'id') -> Iterator[Tuple[object, Optional[str]]]:
+    """
+    Yield (record_id, text) pairs one at a time. Unparseable records yield
+    a None text, which is scored as an error instead of aborting the run.
+    """
+    if fmt == 'csv':
+        csv.field_size_limit(sys.maxsize)
+        for row in csv.DictReader(stream):
+            yield row.get(id_field), row.get(text_field)
+    elif fmt == 'txt':
+        for line in stream:
+            line = line.rstrip('\n')
+            if line:
+                yield None, line
+    else:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield None, None
+                continue
+            if isinstance(record, str):
+                yield None, record
+            elif isinstance(record, dict):
+                yield record.get(id_field), record.get(text_field)
+            else:
+                yield None, None
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Progress:
+    def __init__(self, enabled: bool, interval: float = 2.0, start: int = 0):
+        self.enabled = enabled
+        self.interval = interval
+        self.start = start
+        self.started = time.monotonic()
+        self.last = self.started
+
+    def update(self, done: int, force: bool = False):
+        now = time.monotonic()
+        if not self.enabled or (not force and now - self.last < self.interval):
+            return
+        self.last = now
+        rate = (done - self.start) / max(now - self.started, 1e-9)
+        print(f"scored {done} records ({rate:.1f}/s)", file=sys.stderr)
+
+
+def _load_checkpoint(path: str) -> Optional[Dict]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_checkpoint(path: str, records: int, offset: int):
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump({'records': records, 'output_offset': offset}, f)
+    os.replace(temp_path, path)
+
+
+def score_records(records: Iterable[Tuple[object, Optional[str]]], output_path: str, workers: Optional[int] = None,
+                  chunk_size: int = 32, window: Optional[int] = None, checkpoint_every: int = 1000,
+                  resume: bool = False, use_model: bool = False, progress: bool = True) -> Dict[str, int]:
+    """
+    Score (record_id, text) pairs and write one JSON line per record to
+    output_path ('-' for stdout) in input order.
+    """
+    to_stdout = output_path == '-'
+    checkpoint_path = None if to_stdout else output_path + '.checkpoint'
+
+    start = 0
+    if resume and checkpoint_path:
+        checkpoint = _load_checkpoint(checkpoint_path)
+        if checkpoint:
+            start = checkpoint['records']
+            with open(output_path, 'r+b') as f:
+                f.truncate(checkpoint['output_offset'])
+            records = itertools.islice(records, start, None)
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    window = window or max(2, 2 * workers)
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker) if workers > 0 else _InlineExecutor()
+    model_detector = _make_detector(load_model=True) if use_model else None
+
+    if to_stdout:
+        output = sys.stdout
+    else:
+        output = open(output_path, 'a' if start else 'w', encoding='utf-8')
+
+    stats = {'records': start, 'errors': 0, 'resumed_from': start}
+    tracker = _Progress(progress, start=start)
+    last_checkpoint = start
+    in_flight = deque()
+
+    def drain_one():
+        nonlocal last_checkpoint
+        chunk, future = in_flight.popleft()
+        try:
+            results = future.result()
+        except Exception as e:
+            logging.error(f"❌ Chunk scoring failed: {str(e)}")
+            results = [{'error': str(e)} for _ in chunk]
+
+        if model_detector is not None:
+            valid = [index for index, result in enumerate(results) if 'error' not in result]
+            scores = model_detector._get_ml_predictions([chunk[index][1] for index in valid])
+            for index, score in zip(valid, scores):
+                results[index]['model_score'] = score
+
+        for (record_id, _), result in zip(chunk, results):
+            if 'error' in result:
+                stats['errors'] += 1
+            output.write(json.dumps({'index': stats['records'], 'id': record_id, 'result': result}) + '\n')
+            stats['records'] += 1
+
+        if checkpoint_path and stats['records'] - last_checkpoint >= checkpoint_every:
+            output.flush()
+            os.fsync(output.fileno())
+            _save_checkpoint(checkpoint_path, stats['records'], output.tell())
+            last_checkpoint = stats['records']
+        tracker.update(stats['records'])
+
+    try:
+        for chunk in _chunked(records, chunk_size):
+            in_flight.append((chunk, executor.submit(_score_chunk, [text for _, text in chunk])))
+            if len(in_flight) >= window:
+                drain_one()
+        while in_flight:
+            drain_one()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        output.flush()
+        if not to_stdout:
+            output.close()
+        if model_detector is not None and model_detector.inference_server:
+            model_detector.inference_server.close()
+
+    # A completed run needs no checkpoint
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    tracker.update(stats['records'], force=True)
+    return stats
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('score', help='Score JSONL/CSV/text records in bulk')
+    parser.add_argument('input', help="input file, or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-', help="output JSONL file (default: stdout)")
+    parser.add_argument('--format', choices=['auto', 'jsonl', 'csv', 'txt'], default='auto')
+    parser.add_argument('--text-field', default='text')
+    parser.add_argument('--id-field', default='id')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (0 = in-process, default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=32, help='records per worker task')
+    parser.add_argument('--window', type=int, default=None, help='maximum chunks in flight')
+    parser.add_argument('--checkpoint-every', type=int, default=1000, help='records between checkpoints')
+    parser.add_argument('--resume', action='store_true', help='continue from the last checkpoint of --output')
+    parser.add_argument('--model', action='store_true', help='also score with the transformer model, batched')
+    parser.add_argument('--quiet', action='store_true', help='no progress output')
+    parser.set_defaults(func=run)
+
+
+def run(args) -> int:
+    if args.resume and args.output == '-':
+        print("--resume requires --output", file=sys.stderr)
+        return 2
+
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'jsonl' if args.input == '-' else detect_format(args.input)
+
+    if args.input == '-':
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    else:
+        stream = open(args.input, encoding='utf-8', newline='')
+
+    try:
+        stats = score_records(
+            read_records(stream, fmt, args.text_field, args.id_field),
+            args.output,
+            workers=args.workers,
+            chunk_size=max(1, args.chunk_size),
+            window=args.window,
+            checkpoint_every=max(1, args.checkpoint_every),
+            resume=args.resume,
+            use_model=args.model,
+            progress=not args.quiet
+        )
+    finally:
+        stream.close()
+
+    print(json.dumps(stats), file=sys.stderr)
+    return 0
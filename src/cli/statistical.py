@@ -0,0 +1,155 @@
+"""
+Train the naive Bayes classifier used by the 'statistical' stage, and
+update it incrementally from reviewer feedback.
+
+    python -m src.cli train-statistical labeled.jsonl --output models/statistical
+    python -m src.cli train-statistical labeled.csv --vectorizer tfidf --ngram-max 1
+    python -m src.cli update-statistical relabeled.jsonl --model-dir models/statistical
+
+Records are JSONL/CSV/text as for `score`, with a label field ('fake' or
+'real' by default). With the hashing vectorizer the corpus is streamed in
+chunks and memory stays bounded; tfidf keeps the texts and the vocabulary
+in memory. Updates go through partial_fit on hashed features, so they need
+no vocabulary rebuild; running servers pick the new version up within
+STATISTICAL_RELOAD_SECONDS.
+"""
+import io
+import json
+import os
+import sys
+
+from src.config.config import Config
+from src.cli.score import detect_format
+
+
+def read_labeled(stream, fmt: str, text_field: str, label_field: str):
+    """Yield (text, label) pairs; unparseable records yield (None, None) and are skipped by training"""
+    import csv
+    if fmt == 'csv':
+        csv.field_size_limit(sys.maxsize)
+        for row in csv.DictReader(stream):
+            yield row.get(text_field), row.get(label_field)
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield None, None
+            continue
+        if isinstance(record, dict):
+            yield record.get(text_field), record.get(label_field)
+        else:
+            yield None, None
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('train-statistical', help='Train the naive Bayes classifier tier')
+    parser.add_argument('input', help="labeled JSONL/CSV file, or '-' for stdin")
+    parser.add_argument('--output', default=Config.STATISTICAL_MODEL_DIR)
+    parser.add_argument('--format', choices=['auto', 'jsonl', 'csv'], default='auto')
+    parser.add_argument('--text-field', default='text')
+    parser.add_argument('--label-field', default='label')
+    parser.add_argument('--labels', nargs=2, default=['fake', 'real'], help='the two label values')
+    parser.add_argument('--credible-label', default='real', help='label whose probability is the stage score')
+    parser.add_argument('--vectorizer', choices=['hashing', 'tfidf'], default='hashing')
+    parser.add_argument('--n-features', type=int, default=2 ** 18,
+                        help='hash buckets (hashing) or maximum vocabulary size (tfidf)')
+    parser.add_argument('--ngram-max', type=int, default=2, help='longest word n-gram')
+    parser.add_argument('--alpha', type=float, default=0.1, help='additive smoothing')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='records per partial_fit call (hashing)')
+    parser.add_argument('--holdout', type=float, default=0.1, help='fraction of records held out for evaluation')
+    parser.set_defaults(func=run)
+
+    update = subparsers.add_parser('update-statistical', help='Apply labeled feedback to the classifier tier')
+    update.add_argument('input', help="labeled JSONL/CSV file, or '-' for stdin")
+    update.add_argument('--model-dir', default=Config.STATISTICAL_MODEL_DIR)
+    update.add_argument('--format', choices=['auto', 'jsonl', 'csv'], default='auto')
+    update.add_argument('--text-field', default='text')
+    update.add_argument('--label-field', default='label')
+    update.add_argument('--chunk-size', type=int, default=5000, help='records per partial_fit call')
+    update.set_defaults(func=run_update)
+
+
+def _open_labeled(args):
+    fmt = args.format
+    if fmt == 'auto':
+        fmt = 'jsonl' if args.input == '-' else detect_format(args.input)
+    if args.input == '-':
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline='')
+    else:
+        stream = open(args.input, encoding='utf-8', newline='')
+    return fmt, stream
+
+
+def run_update(args) -> int:
+    from src.models.statistical import MANIFEST_FILE, StatisticalClassifier
+
+    if not os.path.exists(os.path.join(args.model_dir, MANIFEST_FILE)):
+        print(f"No statistical model in {args.model_dir}; train one with train-statistical", file=sys.stderr)
+        return 1
+    classifier = StatisticalClassifier.load(args.model_dir, mmap=False)
+
+    fmt, stream = _open_labeled(args)
+    if fmt == 'txt':
+        stream.close()
+        print("Updates need labeled JSONL or CSV records", file=sys.stderr)
+        return 2
+
+    applied = skipped = 0
+    texts, labels = [], []
+    try:
+        for text, label in read_labeled(stream, fmt, args.text_field, args.label_field):
+            if not isinstance(text, str) or not text.strip() or \
+                    label is None or str(label).strip().lower() not in classifier.classes:
+                skipped += 1
+                continue
+            texts.append(text)
+            labels.append(label)
+            if len(texts) >= args.chunk_size:
+                classifier = classifier.updated(texts, labels)
+                applied += len(texts)
+                texts, labels = [], []
+        if texts:
+            classifier = classifier.updated(texts, labels)
+            applied += len(texts)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    finally:
+        stream.close()
+
+    artifact_id = classifier.save(args.model_dir) if applied else classifier.model_id
+    print(json.dumps({'applied': applied, 'skipped': skipped, 'artifact_id': artifact_id,
+                      'output': args.model_dir}), file=sys.stderr)
+    return 0
+
+
+def run(args) -> int:
+    from src.models.statistical import train
+
+    fmt, stream = _open_labeled(args)
+    if fmt == 'txt':
+        stream.close()
+        print("Training needs labeled JSONL or CSV records", file=sys.stderr)
+        return 2
+
+    try:
+        classifier, metrics = train(
+            read_labeled(stream, fmt, args.text_field, args.label_field),
+            vectorizer=args.vectorizer, labels=args.labels, credible_label=args.credible_label.lower(),
+            n_features=args.n_features, ngram_range=(1, args.ngram_max), alpha=args.alpha,
+            chunk_size=args.chunk_size, holdout=args.holdout
+        )
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    finally:
+        stream.close()
+
+    artifact_id = classifier.save(args.output)
+    print(json.dumps(dict(metrics, artifact_id=artifact_id, output=args.output)), file=sys.stderr)
+    return 0
@@ -7,12 +7,125 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     MONGO_URI = os.environ.get('MONGO_URI') or 'mongodb://localhost:27017/fake_news_db'
     MONGO_DB_NAME = os.environ.get('MONGO_DB_NAME') or 'fake_news_db'
+    MONGO_TIMEOUT_MS = int(os.environ.get('MONGO_TIMEOUT_MS', 5000))
+    
+    # Write-behind storage of predictions; overflow policy is 'drop' or 'block'
+    WRITE_BEHIND_BATCH_SIZE = int(os.environ.get('WRITE_BEHIND_BATCH_SIZE', 100))
+    WRITE_BEHIND_FLUSH_INTERVAL = float(os.environ.get('WRITE_BEHIND_FLUSH_INTERVAL', 1.0))
+    WRITE_BEHIND_MAX_QUEUE = int(os.environ.get('WRITE_BEHIND_MAX_QUEUE', 10000))
+    WRITE_BEHIND_OVERFLOW = os.environ.get('WRITE_BEHIND_OVERFLOW', 'drop')
+    
+    # Rule-based analysis only: the transformer is never loaded and torch is never imported
+    RULES_ONLY = os.environ.get('RULES_ONLY', 'false').lower() == 'true'
     
     # Model configurations
     MODEL_NAME = 'distilbert-base-uncased'
     MAX_LENGTH = 512
     BATCH_SIZE = 16
     
+    # Classifier backend: 'pytorch' (full precision), 'int8' (dynamic quantization, CPU)
+    # or 'onnx' (ONNX Runtime over a model exported with `python -m src.cli export-onnx`)
+    INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND', 'pytorch')
+    ONNX_MODEL_DIR = os.environ.get('ONNX_MODEL_DIR', 'models/onnx')
+    INFERENCE_THREADS = int(os.environ.get('INFERENCE_THREADS', 0))
+    
+    # Chunked inference: texts longer than MAX_LENGTH tokens are split into overlapping windows
+    # instead of truncated. MAX_WINDOWS bounds the cost per text; selection is 'head_tail' or
+    # 'even', aggregation 'mean' or 'max'
+    CHUNKED_INFERENCE = os.environ.get('CHUNKED_INFERENCE', 'false').lower() == 'true'
+    WINDOW_OVERLAP = int(os.environ.get('WINDOW_OVERLAP', 64))
+    MAX_WINDOWS = int(os.environ.get('MAX_WINDOWS', 8))
+    WINDOW_SELECTION = os.environ.get('WINDOW_SELECTION', 'head_tail')
+    WINDOW_AGGREGATION = os.environ.get('WINDOW_AGGREGATION', 'mean')
+    WINDOW_BATCH_SIZE = int(os.environ.get('WINDOW_BATCH_SIZE', 32))
+    
+    # Micro-batching: how long the inference worker waits to fill a batch
+    BATCH_MAX_WAIT_MS = float(os.environ.get('BATCH_MAX_WAIT_MS', 10))
+    INFERENCE_TIMEOUT = float(os.environ.get('INFERENCE_TIMEOUT', 30))
+    
+    # Stage profile used when a request does not name one: 'fast', 'balanced' or 'full'
+    # (see src/models/stages.py)
+    DEFAULT_PROFILE = os.environ.get('DEFAULT_PROFILE', 'balanced')
+    
+    # Cheap-first cascade: the transformer is only run when the rule score falls strictly
+    # inside (CASCADE_LOWER, CASCADE_UPPER); decisive rule scores are answered by the rules alone
+    CASCADE_ENABLED = os.environ.get('CASCADE_ENABLED', 'false').lower() == 'true'
+    CASCADE_LOWER = float(os.environ.get('CASCADE_LOWER', 0.25))
+    CASCADE_UPPER = float(os.environ.get('CASCADE_UPPER', 0.75))
+    # Share of the transformer score in the final score of an escalated text; the rule score
+    # keeps the rest. Above 0.5 the model decides texts the rules were unsure about
+    CASCADE_MODEL_WEIGHT = float(os.environ.get('CASCADE_MODEL_WEIGHT', 0.75))
+    
+    # Rule-based analysis executor: 'thread' runs it in the request thread, 'process'
+    # in a pool of warm worker processes (PROCESS_WORKERS=0 means one per CPU)
+    EXECUTOR_MODE = os.environ.get('EXECUTOR_MODE', 'thread')
+    PROCESS_WORKERS = int(os.environ.get('PROCESS_WORKERS', 0))
+    PROCESS_START_METHOD = os.environ.get('PROCESS_START_METHOD', 'spawn')
+    
+    # Naive Bayes artifact trained with `python -m src.cli train-statistical`; used by the
+    # 'statistical' stage and memory-mapped by every process that loads it
+    STATISTICAL_MODEL_DIR = os.environ.get('STATISTICAL_MODEL_DIR', 'models/statistical')
+    # How often a process checks the artifact for a newer version written by another process
+    # (feedback updates, retraining); 0 checks on every use
+    STATISTICAL_RELOAD_SECONDS = float(os.environ.get('STATISTICAL_RELOAD_SECONDS', 1.0))
+    # POST /api/feedback updates and saves the serving Naive Bayes model, so it is off unless
+    # enabled and then requires the ADMIN_TOKEN shared secret
+    FEEDBACK_ENABLED = os.environ.get('FEEDBACK_ENABLED', 'false').lower() == 'true'
+    # Examples accepted per POST /api/feedback request
+    MAX_FEEDBACK_ITEMS = int(os.environ.get('MAX_FEEDBACK_ITEMS', 1000))
+    
+    # Shared secret of the administrative endpoints, sent in the X-Admin-Token header;
+    # while it is empty those endpoints reject every request
+    ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+    
+    # predict_batch scores the rule stages of a batch with the sparse linear rule engine
+    # (src/models/rule_engine.py); thread executor only. Features are still computed per
+    # document, so this is not faster, and scores may differ from predict() by rounding
+    LINEAR_RULE_ENGINE = os.environ.get('LINEAR_RULE_ENGINE', 'false').lower() == 'true'
+    
+    # Skip NLTK in TextPreprocessor (built-in stopword list, no lemmatization)
+    PREPROCESS_LIGHTWEIGHT = os.environ.get('PREPROCESS_LIGHTWEIGHT', 'false').lower() == 'true'
+    
+    # NLTK data is looked up lazily, first in NLTK_DATA_DIR (provision it with
+    # `python -m src.cli nltk-data`); missing resources are downloaded only when
+    # NLTK_AUTO_DOWNLOAD=true, so servers stay offline by default
+    NLTK_DATA_DIR = os.environ.get('NLTK_DATA_DIR', 'models/nltk_data')
+    NLTK_AUTO_DOWNLOAD = os.environ.get('NLTK_AUTO_DOWNLOAD', 'false').lower() == 'true'
+    
+    # Memoized lemmas, seeded from a token<TAB>lemma table built with `python -m src.cli build-lemmas`
+    LEMMA_CACHE_SIZE = int(os.environ.get('LEMMA_CACHE_SIZE', 100000))
+    LEMMA_TABLE_PATH = os.environ.get('LEMMA_TABLE_PATH', 'models/lemmas.tsv')
+    
+    # Result cache (per tier: rule-based results, model outputs, online verification)
+    CACHE_ENABLED = os.environ.get('CACHE_ENABLED', 'true').lower() == 'true'
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 10000))
+    CACHE_TTL_SECONDS = float(os.environ.get('CACHE_TTL_SECONDS', 3600))
+    CACHE_SHARDS = int(os.environ.get('CACHE_SHARDS', 16))
+    
+    # Near-duplicate reuse (src/utils/near_duplicates.py): on an exact cache miss, a text whose
+    # estimated shingle similarity to an indexed one reaches the threshold gets that verdict, whatever
+    # profile produced it, instead of a full analysis. The index grows from live predictions, is saved
+    # on shutdown and can be rebuilt from MongoDB with `python -m src.cli build-duplicate-index`
+    NEAR_DUPLICATE_ENABLED = os.environ.get('NEAR_DUPLICATE_ENABLED', 'false').lower() == 'true'
+    NEAR_DUPLICATE_THRESHOLD = float(os.environ.get('NEAR_DUPLICATE_THRESHOLD', 0.8))
+    NEAR_DUPLICATE_MAX_ENTRIES = int(os.environ.get('NEAR_DUPLICATE_MAX_ENTRIES', 100000))
+    NEAR_DUPLICATE_INDEX_PATH = os.environ.get('NEAR_DUPLICATE_INDEX_PATH', 'models/near_duplicates.npz')
+    
+    # Per-stage latency histograms exposed on /metrics
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+    # POST /metrics/config toggles or resets that recording; off unless enabled and then
+    # requires the ADMIN_TOKEN shared secret (GET stays open)
+    METRICS_CONFIG_WRITABLE = os.environ.get('METRICS_CONFIG_WRITABLE', 'false').lower() == 'true'
+    
+    # Maximum number of texts accepted by /api/detect/batch
+    MAX_BATCH_ITEMS = int(os.environ.get('MAX_BATCH_ITEMS', 1000))
+    
+    # Artificial delay on /api/detect for UX; set to 0 for benchmarks
+    RESPONSE_DELAY_SECONDS = float(os.environ.get('RESPONSE_DELAY_SECONDS', 0.5))
+    
+    # Start background warm-up of detector and database when app.py is imported
+    AUTO_INITIALIZE = os.environ.get('AUTO_INITIALIZE', 'true').lower() == 'true'
+    
     # KMP Algorithm settings
     TRUSTED_SOURCES_THRESHOLD = 0.8
     SIMILARITY_THRESHOLD = 0.7 
\ No newline at end of file
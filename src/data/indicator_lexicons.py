@@ -0,0 +1,241 @@
+# Phrase lists used by FakeNewsDetector analyzers.
+# All lists are compiled into a single LexiconScanner at detector start-up.
+
+# Enhanced trusted news indicators
+TRUSTED_INDICATORS = [
+    'according to', 'sources say', 'reported by', 'reuters', 'ap news', 'bbc', 'cnn', 'npr',
+    'associated press', 'new york times', 'washington post', 'wall street journal',
+    'study shows', 'research indicates', 'data suggests', 'statistics show', 'poll conducted',
+    'survey found', 'analysis reveals', 'investigation shows', 'officials said',
+    'spokesperson confirmed', 'press release', 'statement issued', 'conference call',
+    'peer-reviewed', 'published in', 'journal of', 'university study', 'academic research'
+]
+
+# Enhanced fake news indicators
+FAKE_INDICATORS = [
+    'you won\'t believe', 'doctors hate', 'this one trick', 'secret they don\'t want',
+    'mainstream media', 'they don\'t want you to know', 'wake up', 'open your eyes',
+    'the truth is', 'conspiracy', 'cover up', 'hidden agenda', 'fake news media',
+    'deep state', 'shadow government', 'illuminati', 'new world order',
+    'click here', 'share if you agree', 'like and share', 'going viral',
+    'must read', 'urgent alert', 'breaking exclusive', 'insider reveals'
+]
+
+# Credible news sources
+CREDIBLE_SOURCES = [
+    'reuters.com', 'apnews.com', 'bbc.com', 'cnn.com', 'npr.org',
+    'nytimes.com', 'washingtonpost.com', 'wsj.com', 'bloomberg.com',
+    'guardian.com', 'economist.com', 'time.com', 'newsweek.com',
+    'usatoday.com', 'abcnews.go.com', 'cbsnews.com', 'nbcnews.com',
+    'pbs.org', 'politico.com', 'axios.com', 'thehill.com'
+]
+
+# Fact-checking sources
+FACT_CHECK_SITES = [
+    'snopes.com', 'factcheck.org', 'politifact.com', 'truthorfiction.com',
+    'fullfact.org', 'factcheckni.org', 'checkyourfact.com', 'leadstories.com'
+]
+
+# Search verification: current events keywords that can be verified
+VERIFIABLE_EVENTS = [
+    'ukraine war', 'gaza conflict', 'israel palestine', 'russia ukraine',
+    'artificial intelligence', 'climate change', 'covid pandemic',
+    'us election', 'biden administration', 'trump', 'putin', 'zelensky'
+]
+
+# Search verification: unverifiable sensational claims
+SENSATIONAL_CLAIMS = ['miracle cure', 'secret revealed', 'shocking truth', 'hidden agenda']
+
+# Fact-checker verification: known debunked claims patterns
+DEBUNKED_CLAIMS = [
+    '5g causes covid', 'vaccines cause autism', 'earth is flat',
+    'chemtrails', 'moon landing fake', 'birds aren\'t real',
+    'covid is hoax', 'climate change hoax', 'deep state'
+]
+
+# Fact-checker verification: fact-checker language
+FACT_CHECK_LANGUAGE = [
+    'according to snopes', 'factcheck.org confirms', 'politifact rates',
+    'verified by reuters', 'ap fact check', 'bbc reality check'
+]
+
+# AI pattern analysis: logical structure
+INTRO_PHRASES = ['according to', 'reports indicate', 'breaking']
+CONCLUSION_PHRASES = ['in conclusion', 'officials said', 'investigation continues']
+
+# AI pattern analysis: credible attribution patterns
+ATTRIBUTION_PATTERNS = [
+    'according to officials', 'spokesperson said', 'confirmed by',
+    'reported by', 'sources close to', 'government statement'
+]
+
+# AI pattern analysis: emotional manipulation
+MANIPULATION_PATTERNS = [
+    'you won\'t believe', 'shocking truth', 'they don\'t want you to know',
+    'doctors hate', 'one weird trick', 'this will blow your mind',
+    'urgent warning', 'share before deleted', 'going viral'
+]
+
+# AI pattern analysis: conspiracy theory indicators
+CONSPIRACY_INDICATORS = [
+    'deep state', 'new world order', 'illuminati', 'false flag',
+    'crisis actor', 'staged event', 'cover up', 'wake up sheeple'
+]
+
+# AI pattern analysis: professional journalism indicators
+JOURNALISM_INDICATORS = [
+    'investigation revealed', 'documents show', 'data indicates',
+    'study found', 'research suggests', 'analysis shows',
+    'experts say', 'officials confirm'
+]
+
+# Factual patterns: official language
+OFFICIAL_PATTERNS = [
+    'according to officials', 'government statement', 'press conference',
+    'official report', 'published study', 'research findings'
+]
+
+# Misinformation patterns: conspiracy theory keywords
+CONSPIRACY_KEYWORDS = [
+    'deep state', 'shadow government', 'new world order', 'illuminati',
+    'chemtrails', 'false flag', 'crisis actor', 'hoax', 'staged'
+]
+
+# Misinformation patterns: emotional manipulation tactics
+MISINFORMATION_MANIPULATION = [
+    'they don\'t want you to know', 'hidden truth', 'secret agenda',
+    'wake up sheeple', 'open your eyes', 'mainstream media lies'
+]
+
+# Misinformation patterns: urgency manipulation
+URGENCY_PATTERNS = [
+    'urgent', 'breaking exclusive', 'must share', 'before it\'s deleted',
+    'going viral', 'share before', 'time sensitive'
+]
+
+# News recency: time-sensitive language
+RECENT_PATTERNS = ['today', 'yesterday', 'this week', 'recently', 'latest']
+
+# Linguistic analysis: professional language patterns
+PROFESSIONAL_INDICATORS = [
+    'according to', 'reported that', 'stated that', 'confirmed that',
+    'announced that', 'revealed that', 'indicated that', 'suggested that'
+]
+
+# Linguistic analysis: informal/unprofessional language
+INFORMAL_INDICATORS = [
+    'omg', 'lol', 'wtf', 'gonna', 'wanna', 'gotta', 'kinda',
+    'sorta', 'dunno', 'yeah', 'nah', 'ur', 'u', 'r'
+]
+
+# Content analysis: current events and news language
+NEWS_LANGUAGE_PATTERNS = [
+    'breaking news', 'developing story', 'latest updates', 'exclusive report',
+    'investigation reveals', 'sources confirm', 'officials announce',
+    'statement released', 'press briefing', 'live coverage',
+    'correspondent reports', 'newsroom', 'editorial board'
+]
+
+# Content analysis: balanced reporting indicators
+BALANCED_INDICATORS = [
+    'however', 'on the other hand', 'critics argue', 'supporters claim',
+    'both sides', 'different perspectives', 'varying opinions',
+    'while some', 'others believe', 'alternative view'
+]
+
+# Content analysis: emotional manipulation
+EMOTIONAL_MANIPULATION = [
+    'you must', 'everyone should', 'never trust', 'always believe',
+    'only way', 'the truth is', 'wake up', 'open your eyes',
+    'they want', 'they control', 'hidden agenda', 'secret plan'
+]
+
+# Content analysis: current events relevance (2024-2025)
+CURRENT_EVENTS_KEYWORDS = [
+    'ukraine', 'russia', 'gaza', 'israel', 'palestine', 'iran',
+    'artificial intelligence', 'ai technology', 'climate change',
+    'election', 'democracy', 'inflation', 'economy', 'covid',
+    'pandemic', 'vaccination', 'energy crisis', 'renewable energy'
+]
+
+# Content analysis: proper attribution and sourcing
+ATTRIBUTION_QUALITY = [
+    'according to', 'cited by', 'referenced in', 'documented by',
+    'verified by', 'confirmed by', 'reported in', 'published by'
+]
+
+# Source credibility: news organization mentions
+NEWS_ORGANIZATIONS = [
+    'reuters', 'associated press', 'ap news', 'bbc', 'cnn', 'npr', 'pbs',
+    'new york times', 'washington post', 'wall street journal', 'guardian',
+    'times of israel', 'jerusalem post', 'haaretz', 'al jazeera', 'france24'
+]
+
+# Source credibility: official sources
+OFFICIAL_SOURCES = [
+    'government', 'ministry', 'department', 'official statement', 'press release',
+    'spokesperson', 'ambassador', 'diplomat', 'united nations', 'nato'
+]
+
+# Source credibility: attribution
+ATTRIBUTION_PHRASES = [
+    'according to', 'sources say', 'reported by', 'confirmed by',
+    'statement from', 'announced by', 'disclosed by'
+]
+
+# Source credibility: anonymous sourcing
+ANONYMOUS_SOURCES = ['anonymous source']
+
+# Strong indicators of fake news
+STRONG_FAKE_PATTERNS = [
+    'you won\'t believe', 'doctors hate this', 'this one trick',
+    'mainstream media doesn\'t want', 'they don\'t want you to know',
+    'wake up sheeple', 'false flag', 'crisis actor', 'hoax',
+    'fake news media', 'deep state', 'conspiracy', 'cover up',
+    'click here now', 'share before deleted', 'going viral',
+    'must share immediately', 'breaking exclusive'
+]
+
+# Strong indicators of real news
+STRONG_REAL_PATTERNS = [
+    'according to reuters', 'associated press reports', 'bbc news',
+    'government officials', 'press conference', 'official statement',
+    'published study', 'research shows', 'data indicates',
+    'spokesperson confirmed', 'investigation reveals',
+    'peer-reviewed', 'academic research', 'statistical analysis'
+]
+
+# Category name -> phrase list, compiled together by FakeNewsDetector
+INDICATOR_LEXICONS = {
+    'trusted_indicators': TRUSTED_INDICATORS,
+    'fake_indicators': FAKE_INDICATORS,
+    'credible_sources': CREDIBLE_SOURCES,
+    'verifiable_events': VERIFIABLE_EVENTS,
+    'sensational_claims': SENSATIONAL_CLAIMS,
+    'debunked_claims': DEBUNKED_CLAIMS,
+    'fact_check_language': FACT_CHECK_LANGUAGE,
+    'intro_phrases': INTRO_PHRASES,
+    'conclusion_phrases': CONCLUSION_PHRASES,
+    'attribution_patterns': ATTRIBUTION_PATTERNS,
+    'manipulation_patterns': MANIPULATION_PATTERNS,
+    'conspiracy_indicators': CONSPIRACY_INDICATORS,
+    'journalism_indicators': JOURNALISM_INDICATORS,
+    'official_patterns': OFFICIAL_PATTERNS,
+    'conspiracy_keywords': CONSPIRACY_KEYWORDS,
+    'misinformation_manipulation': MISINFORMATION_MANIPULATION,
+    'urgency_patterns': URGENCY_PATTERNS,
+    'recent_patterns': RECENT_PATTERNS,
+    'professional_indicators': PROFESSIONAL_INDICATORS,
+    'informal_indicators': INFORMAL_INDICATORS,
+    'news_language_patterns': NEWS_LANGUAGE_PATTERNS,
+    'balanced_indicators': BALANCED_INDICATORS,
+    'emotional_manipulation': EMOTIONAL_MANIPULATION,
+    'current_events_keywords': CURRENT_EVENTS_KEYWORDS,
+    'attribution_quality': ATTRIBUTION_QUALITY,
+    'news_organizations': NEWS_ORGANIZATIONS,
+    'official_sources': OFFICIAL_SOURCES,
+    'attribution_phrases': ATTRIBUTION_PHRASES,
+    'anonymous_sources': ANONYMOUS_SOURCES,
+    'strong_fake_patterns': STRONG_FAKE_PATTERNS,
+    'strong_real_patterns': STRONG_REAL_PATTERNS
+}
@@ -1,7 +1,8 @@
 from pymongo import MongoClient
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from src.config.config import Config
+from src.database.write_behind import PredictionWriter
 import logging
 
 class MongoHandler:
@@ -9,32 +10,78 @@ class MongoHandler:
         self.config = Config()
         self.client = None
         self.db = None
+        self.writer = None
         self.connect()
     
     def connect(self):
         try:
-            self.client = MongoClient(self.config.MONGO_URI)
+            self.client = MongoClient(
+                self.config.MONGO_URI,
+                serverSelectionTimeoutMS=self.config.MONGO_TIMEOUT_MS
+            )
             self.db = self.client[self.config.MONGO_DB_NAME]
             self.client.admin.command('ping')
             logging.info("Successfully connected to MongoDB")
         except Exception as e:
             logging.error(f"Failed to connect to MongoDB: {str(e)}")
             raise
+        
+        self.writer = PredictionWriter(
+            self.db.predictions,
+            batch_size=self.config.WRITE_BEHIND_BATCH_SIZE,
+            flush_interval=self.config.WRITE_BEHIND_FLUSH_INTERVAL,
+            max_queue=self.config.WRITE_BEHIND_MAX_QUEUE,
+            overflow=self.config.WRITE_BEHIND_OVERFLOW
+        )
+    
+    def close(self):
+        """Flush pending writes and close the connection"""
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+        if self.client:
+            self.client.close()
+    
+    def _build_document(self, text: str, prediction_result: Dict) -> Dict:
+        return {
+            "text": text,
+            "prediction": prediction_result.get('prediction'),
+            "confidence": prediction_result.get('confidence'),
+            "status": prediction_result.get('status'),
+            "verification_score": prediction_result.get('verification_score'),
+            "timestamp": datetime.utcnow()
+        }
+    
+    def enqueue_prediction(self, text: str, prediction_result: Dict) -> bool:
+        """
+        Queue a prediction for write-behind storage without waiting on MongoDB.
+        Returns False if the document was dropped because the queue is full.
+        """
+        if not self.writer:
+            raise RuntimeError("Write-behind queue is not running")
+        return self.writer.put(self._build_document(text, prediction_result))
+    
+    def writer_stats(self) -> Dict:
+        return self.writer.stats() if self.writer else {}
     
     def store_prediction(self, text: str, prediction_result: Dict) -> str:
         try:
-            document = {
-                "text": text,
-                "prediction": prediction_result.get('prediction'),
-                "confidence": prediction_result.get('confidence'),
-                "timestamp": datetime.utcnow()
-            }
+            document = self._build_document(text, prediction_result)
             result = self.db.predictions.insert_one(document)
             return str(result.inserted_id)
         except Exception as e:
             logging.error(f"Error storing prediction: {str(e)}")
             raise
     
+    def iter_predictions(self, newest: Optional[int] = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """Stored predictions oldest first, only the `newest` most recent ones if given, without their ids"""
+        cursor = self.db.predictions.find(
+            {}, {'_id': 0, 'text': 1, 'prediction': 1, 'confidence': 1, 'status': 1, 'verification_score': 1}
+        ).sort("timestamp", 1).batch_size(batch_size)
+        if newest:
+            cursor = cursor.skip(max(0, self.db.predictions.count_documents({}) - newest))
+        return iter(cursor)
+    
     def get_prediction_history(self, limit: int = 100) -> List[Dict]:
         try:
             cursor = self.db.predictions.find().sort("timestamp", -1).limit(limit)
@@ -0,0 +1,112 @@
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Optional
+from pymongo.errors import BulkWriteError
+
+
+class PredictionWriter:
+    """
+    Write-behind buffer for prediction documents.
+
+    Documents are queued by request threads and written by a background
+    thread with insert_many(ordered=False), either when `batch_size`
+    documents are buffered or `flush_interval` seconds after the first
+    buffered document. The queue is bounded; when it is full the writer
+    either drops the document or blocks the caller for at most
+    `block_timeout` seconds (then drops), depending on `overflow`.
+    """
+
+    def __init__(self, collection, batch_size: int = 100, flush_interval: float = 1.0,
+                 max_queue: int = 10000, overflow: str = 'drop', block_timeout: float = 0.05):
+        if overflow not in ('drop', 'block'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.collection = collection
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._closed = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {'enqueued': 0, 'written': 0, 'dropped': 0, 'failed': 0, 'batches': 0}
+
+        self._worker = threading.Thread(target=self._run, name='prediction-writer', daemon=True)
+        self._worker.start()
+
+    def put(self, document: Dict) -> bool:
+        """Queue a document; returns False if it was dropped"""
+        if self._closed.is_set():
+            self._count('dropped')
+            return False
+
+        try:
+            if self.overflow == 'block':
+                self._queue.put(document, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(document)
+        except queue.Full:
+            self._count('dropped')
+            return False
+
+        self._count('enqueued')
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Stop accepting documents and flush everything still queued"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            logging.warning(f"Prediction writer did not finish flushing ({self._queue.qsize()} documents pending)")
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if self._closed.is_set():
+                    remaining = 0
+                try:
+                    if remaining <= 0:
+                        batch.append(self._queue.get_nowait())
+                    else:
+                        batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._flush(batch)
+
+    def _flush(self, batch):
+        try:
+            result = self.collection.insert_many(batch, ordered=False)
+            self._count('written', len(result.inserted_ids))
+        except BulkWriteError as e:
+            failed = len(e.details.get('writeErrors', []))
+            logging.error(f"Error storing predictions: {failed} of {len(batch)} documents failed")
+            self._count('written', len(batch) - failed)
+            self._count('failed', failed)
+        except Exception as e:
+            logging.error(f"Error storing predictions: {str(e)}")
+            self._count('failed', len(batch))
+        self._count('batches')
@@ -0,0 +1,376 @@
+"""
+Pluggable CPU/GPU inference backends for the sequence classifier.
+
+Every backend is a callable with the same contract as a transformers
+text-classification pipeline: it takes a list of texts and returns one
+{'label', 'score'} dict per text, so BatchingInferenceServer and
+_label_to_credibility work unchanged.
+
+    pytorch  full-precision model (GPU if available)
+    int8     dynamic int8 quantization of the Linear layers, CPU only
+    onnx     ONNX Runtime session over a model written by export_onnx()
+
+With a WindowPolicy attached, texts longer than max_length are not
+truncated: each is tokenized once, split into overlapping windows, the
+windows of all texts in the call run as one batch, and the per-window
+scores are aggregated back into one prediction per text.
+"""
+import inspect
+import json
+import logging
+import math
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+BACKENDS = ('pytorch', 'int8', 'onnx')
+
+ONNX_MODEL_FILE = 'model.onnx'
+ONNX_INT8_MODEL_FILE = 'model.int8.onnx'
+ONNX_META_FILE = 'export_meta.json'
+
+
+def _activation(problem_type: Optional[str], num_labels: int) -> str:
+    """Same choice as the transformers pipeline: sigmoid for multi-label / single-logit models"""
+    if problem_type == 'multi_label_classification' or num_labels == 1:
+        return 'sigmoid'
+    return 'softmax'
+
+
+def _logits_to_scores(logits: np.ndarray, activation: str) -> np.ndarray:
+    if activation == 'sigmoid':
+        return 1.0 / (1.0 + np.exp(-logits))
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _scores_to_predictions(scores: np.ndarray, id2label: Dict[int, str]) -> List[Dict]:
+    best = scores.argmax(axis=-1)
+    return [
+        {'label': id2label[int(index)], 'score': float(row[index])}
+        for row, index in zip(scores, best)
+    ]
+
+
+def _logits_to_predictions(logits: np.ndarray, id2label: Dict[int, str], activation: str) -> List[Dict]:
+    return _scores_to_predictions(_logits_to_scores(logits, activation), id2label)
+
+
+class WindowPolicy:
+    """
+    How long texts are split for chunked inference.
+
+    overlap      tokens shared by consecutive windows
+    max_windows  budget per text; longer texts keep a subset of windows
+    selection    'head_tail' keeps the first and last windows (lede and
+                 conclusion), 'even' spreads the budget over the text
+    aggregation  'mean' averages window scores weighted by window length,
+                 'max' uses the scores of the most confident window
+    batch_size   windows per forward pass
+    """
+
+    SELECTIONS = ('head_tail', 'even')
+    AGGREGATIONS = ('mean', 'max')
+
+    def __init__(self, overlap: int = 64, max_windows: int = 8, selection: str = 'head_tail',
+                 aggregation: str = 'mean', batch_size: int = 32):
+        if selection not in self.SELECTIONS:
+            raise ValueError(f"Unknown window selection '{selection}'")
+        if aggregation not in self.AGGREGATIONS:
+            raise ValueError(f"Unknown window aggregation '{aggregation}'")
+        self.overlap = max(0, overlap)
+        self.max_windows = max(1, max_windows)
+        self.selection = selection
+        self.aggregation = aggregation
+        self.batch_size = max(1, batch_size)
+
+    def spans(self, length: int, window: int) -> List[tuple]:
+        """(start, end) token spans covering `length` tokens, reduced to the budget"""
+        step = max(1, window - min(self.overlap, window - 1))
+        starts = list(range(0, max(length - window, 0) + 1, step))
+        if starts[-1] + window < length:
+            starts.append(length - window)
+
+        if len(starts) > self.max_windows:
+            if self.selection == 'head_tail':
+                head = math.ceil(self.max_windows / 2)
+                tail = self.max_windows - head
+                starts = starts[:head] + (starts[-tail:] if tail else [])
+            else:
+                last = len(starts) - 1
+                picks = sorted({round(i * last / max(self.max_windows - 1, 1)) for i in range(self.max_windows)})
+                starts = [starts[index] for index in picks]
+
+        return [(start, min(start + window, length)) for start in starts]
+
+    def aggregate(self, scores: np.ndarray, weights: Sequence[int]) -> np.ndarray:
+        if self.aggregation == 'max':
+            return scores[scores.max(axis=1).argmax()]
+        return np.average(scores, axis=0, weights=np.asarray(weights, dtype=float))
+
+
+class ClassifierBackend:
+    """Base class: tokenizes a batch, runs forward(), maps the logits to labels"""
+
+    name = 'base'
+    tensor_type = 'np'
+
+    def __init__(self, tokenizer, id2label: Dict[int, str], activation: str, max_length: int = 512,
+                 windows: Optional[WindowPolicy] = None):
+        self.tokenizer = tokenizer
+        self.id2label = {int(key): value for key, value in id2label.items()}
+        self.activation = activation
+        self.max_length = max_length
+        self.windows = windows
+
+    def __call__(self, texts, batch_size: Optional[int] = None, **kwargs) -> List[Dict]:
+        if isinstance(texts, str):
+            texts = [texts]
+        texts = list(texts)
+        if self.windows is not None:
+            return self._predict_windows(texts)
+
+        batch_size = batch_size or len(texts) or 1
+        predictions = []
+        for start in range(0, len(texts), batch_size):
+            predictions.extend(_logits_to_predictions(
+                self.logits(texts[start:start + batch_size]), self.id2label, self.activation
+            ))
+        return predictions
+
+    def encode(self, texts: Sequence[str]):
+        return self.tokenizer(
+            list(texts), padding=True, truncation=True,
+            max_length=self.max_length, return_tensors=self.tensor_type
+        )
+
+    def logits(self, texts: Sequence[str]) -> np.ndarray:
+        return self.forward(self.encode(texts))
+
+    def forward(self, encoded) -> np.ndarray:
+        raise NotImplementedError
+
+    def _with_special_tokens(self, ids: List[int]) -> List[int]:
+        build = getattr(self.tokenizer, 'build_inputs_with_special_tokens', None)
+        if build is not None:
+            return build(ids)
+        # Tokenizers without the helper: single-sequence BERT/RoBERTa layout
+        prefix = self.tokenizer.cls_token_id if self.tokenizer.cls_token_id is not None else self.tokenizer.bos_token_id
+        suffix = self.tokenizer.sep_token_id if self.tokenizer.sep_token_id is not None else self.tokenizer.eos_token_id
+        return ([prefix] if prefix is not None else []) + list(ids) + ([suffix] if suffix is not None else [])
+
+    def _predict_windows(self, texts: List[str]) -> List[Dict]:
+        """Tokenize once, score the windows of every text together, aggregate per text"""
+        token_ids = self.tokenizer(texts, add_special_tokens=False, truncation=False)['input_ids']
+        window = self.max_length - self.tokenizer.num_special_tokens_to_add(pair=False)
+
+        windows, owners, weights = [], [], []
+        for owner, ids in enumerate(token_ids):
+            for start, end in self.windows.spans(len(ids), window):
+                windows.append(self._with_special_tokens(ids[start:end]))
+                owners.append(owner)
+                weights.append(max(end - start, 1))
+
+        scores = []
+        for start in range(0, len(windows), self.windows.batch_size):
+            encoded = self.tokenizer.pad(
+                {'input_ids': windows[start:start + self.windows.batch_size]},
+                return_tensors=self.tensor_type
+            )
+            scores.append(_logits_to_scores(self.forward(encoded), self.activation))
+        scores = np.concatenate(scores) if scores else np.zeros((0, len(self.id2label)))
+
+        owners = np.asarray(owners)
+        weights = np.asarray(weights)
+        aggregated = np.stack([
+            self.windows.aggregate(scores[owners == owner], weights[owners == owner])
+            for owner in range(len(texts))
+        ])
+        return _scores_to_predictions(aggregated, self.id2label)
+
+
+class PyTorchBackend(ClassifierBackend):
+    """transformers model run under torch.inference_mode, optionally int8-quantized"""
+
+    tensor_type = 'pt'
+
+    def __init__(self, model_name: str, max_length: int = 512, quantize: bool = False, num_threads: int = 0,
+                 windows: Optional[WindowPolicy] = None):
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        if num_threads:
+            torch.set_num_threads(num_threads)
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model.eval()
+
+        if quantize:
+            # Weights of every Linear layer become int8; activations are quantized on the fly
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.device = torch.device('cpu')
+        else:
+            self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        model.to(self.device)
+
+        config = model.config
+        super().__init__(tokenizer, config.id2label, _activation(config.problem_type, config.num_labels),
+                         max_length, windows)
+        self.name = 'int8' if quantize else 'pytorch'
+        self.model_name = model_name
+        self.model = model
+        self._torch = torch
+
+    def forward(self, encoded) -> np.ndarray:
+        encoded = encoded.to(self.device)
+        with self._torch.inference_mode():
+            output = self.model(**encoded)
+        return output.logits.float().cpu().numpy()
+
+
+class OnnxBackend(ClassifierBackend):
+    """ONNX Runtime session over a directory written by export_onnx()"""
+
+    name = 'onnx'
+
+    def __init__(self, model_dir: str, max_length: int = 512, prefer_int8: bool = True, num_threads: int = 0,
+                 windows: Optional[WindowPolicy] = None):
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("onnxruntime is required for INFERENCE_BACKEND=onnx (pip install onnxruntime)") from e
+        from transformers import AutoTokenizer
+
+        with open(os.path.join(model_dir, ONNX_META_FILE)) as f:
+            meta = json.load(f)
+
+        model_file = ONNX_INT8_MODEL_FILE if prefer_int8 and meta.get('int8') else ONNX_MODEL_FILE
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, model_file), options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+        tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        super().__init__(tokenizer, meta['id2label'], meta['activation'], max_length, windows)
+        self.model_name = meta['model_name']
+
+    def forward(self, encoded) -> np.ndarray:
+        input_ids = encoded['input_ids']
+        feeds = {}
+        for name in self.input_names:
+            if name in encoded:
+                feeds[name] = np.asarray(encoded[name], dtype=np.int64)
+            else:
+                # Windows built from token ids carry no token_type_ids; single segments are all zeros
+                feeds[name] = np.zeros_like(input_ids, dtype=np.int64)
+        return self.session.run(None, feeds)[0]
+
+
+def create_backend(kind: str, model_name: Optional[str] = None, max_length: int = 512,
+                   onnx_model_dir: Optional[str] = None, num_threads: int = 0,
+                   windows: Optional[WindowPolicy] = None) -> ClassifierBackend:
+    """Build the backend selected by Config.INFERENCE_BACKEND"""
+    if kind == 'pytorch':
+        return PyTorchBackend(model_name, max_length, quantize=False, num_threads=num_threads, windows=windows)
+    if kind == 'int8':
+        return PyTorchBackend(model_name, max_length, quantize=True, num_threads=num_threads, windows=windows)
+    if kind == 'onnx':
+        if not onnx_model_dir:
+            raise ValueError("ONNX_MODEL_DIR must be set for the onnx backend")
+        return OnnxBackend(onnx_model_dir, max_length, num_threads=num_threads, windows=windows)
+    raise ValueError(f"Unknown inference backend '{kind}' (expected one of {', '.join(BACKENDS)})")
+
+
+def export_onnx(model_name: str, output_dir: str, quantize: bool = True, opset: int = 14) -> Dict:
+    """
+    Export a checkpoint to ONNX (plus a dynamically int8-quantized copy)
+    together with its tokenizer, for use by OnnxBackend.
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(['export sample text'], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+    dynamic_axes['logits'] = {0: 'batch'}
+
+    export_kwargs = {}
+    if 'dynamo' in inspect.signature(torch.onnx.export).parameters:
+        # The TorchScript exporter handles dynamic axes for these models without extra dependencies
+        export_kwargs['dynamo'] = False
+
+    model_path = os.path.join(output_dir, ONNX_MODEL_FILE)
+    with torch.inference_mode():
+        torch.onnx.export(
+            model, tuple(sample[name] for name in input_names), model_path,
+            input_names=input_names, output_names=['logits'],
+            dynamic_axes=dynamic_axes, opset_version=opset, **export_kwargs
+        )
+    tokenizer.save_pretrained(output_dir)
+
+    int8 = False
+    if quantize:
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            quantize_dynamic(model_path, os.path.join(output_dir, ONNX_INT8_MODEL_FILE), weight_type=QuantType.QInt8)
+            int8 = True
+        except ImportError:
+            logging.warning("⚠️ onnxruntime not installed; skipping int8 quantization of the ONNX model")
+
+    config = model.config
+    meta = {
+        'model_name': model_name,
+        'id2label': {str(key): value for key, value in config.id2label.items()},
+        'activation': _activation(config.problem_type, config.num_labels),
+        'input_names': input_names,
+        'opset': opset,
+        'int8': int8
+    }
+    with open(os.path.join(output_dir, ONNX_META_FILE), 'w') as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def check_parity(reference: ClassifierBackend, candidate: ClassifierBackend, texts: Sequence[str],
+                 batch_size: int = 16) -> Dict:
+    """
+    Compare a candidate backend against the full-precision reference:
+    label agreement, score drift and per-batch latency of both.
+    """
+    import time
+
+    reference_predictions, candidate_predictions = [], []
+    reference_times, candidate_times = [], []
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        for backend, predictions, times in ((reference, reference_predictions, reference_times),
+                                            (candidate, candidate_predictions, candidate_times)):
+            began = time.perf_counter()
+            predictions.extend(backend(batch, batch_size=batch_size))
+            times.append(time.perf_counter() - began)
+
+    agreements = [ref['label'] == cand['label'] for ref, cand in zip(reference_predictions, candidate_predictions)]
+    drift = [abs(ref['score'] - cand['score']) for ref, cand in zip(reference_predictions, candidate_predictions)]
+    reference_p50 = float(np.median(reference_times)) if reference_times else 0.0
+    candidate_p50 = float(np.median(candidate_times)) if candidate_times else 0.0
+    return {
+        'samples': len(agreements),
+        'agreement': sum(agreements) / len(agreements) if agreements else 1.0,
+        'mismatches': [index for index, agreed in enumerate(agreements) if not agreed],
+        'max_score_drift': max(drift) if drift else 0.0,
+        'reference_batch_p50_ms': 1000 * reference_p50,
+        'candidate_batch_p50_ms': 1000 * candidate_p50,
+        'speedup': reference_p50 / candidate_p50 if candidate_p50 else 0.0
+    }
@@ -1,41 +1,74 @@
-import torch
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-import numpy as np
 from src.algorithms.kmp_matcher import KMPMatcher
+from src.algorithms.lexicon_scanner import LexiconScanner
+from src.models.inference_server import BatchingInferenceServer
+from src.models.rule_pool import RuleAnalysisPool
+from src.models.rules import RULE_SETS
+from src.models.stages import INPUTS, PROFILES, STAGES, describe_stages, required_inputs, resolve_profile
+from src.data.indicator_lexicons import (
+    INDICATOR_LEXICONS, TRUSTED_INDICATORS, FAKE_INDICATORS, CREDIBLE_SOURCES, FACT_CHECK_SITES
+)
 from src.utils.text_preprocessor import TextPreprocessor
+from src.utils.result_cache import TieredResultCache, text_key
+from src.utils.document import AnalyzedDocument, as_document
+from src.utils.metrics import StageMetrics
+from src.utils.nltk_resources import ensure_resource
 from src.config.config import Config
 import logging
+import os
 import re
-from textstat import flesch_reading_ease, flesch_kincaid_grade
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
-from collections import Counter
-import requests
-from datetime import datetime
+import threading
 import time
-import hashlib
-import os
-import pickle
-import json
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import Pipeline
-
-# Download required NLTK data
-try:
-    nltk.download('vader_lexicon', quiet=True)
-    nltk.download('punkt', quiet=True)
-except:
-    pass
+from datetime import datetime
+
+# torch/transformers and NumPy (via src.models.backends), SciPy (via src.models.rule_engine)
+# and textstat are imported only by the code paths that use them, so rules-only processes
+# and tools start quickly
+
+# Key-claim extraction patterns, compiled once
+CLAIM_PATTERNS = {
+    'proper_nouns': re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b'),
+    'dates': re.compile(r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}|\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\b\d{4}\b'),
+    'numbers': re.compile(r'\b\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:million|billion|thousand|percent|%))?'),
+    'quotes': re.compile(r'"([^"]*)"')
+}
+
+# Bump whenever scoring logic changes; cached rule-based results are keyed on it
+RULESET_VERSION = '2'
 
 class FakeNewsDetector:
-    def __init__(self):
+    def __init__(self, load_model=True, executor_mode=None):
+        """
+        Build the rule-based analyzers. With load_model=False the transformer
+        is not loaded here; call load_model() later (e.g. from a background
+        thread) and it is picked up as soon as it is ready. executor_mode
+        'process' runs the rule analyzers in a pool of worker processes;
+        it defaults to Config.EXECUTOR_MODE.
+        """
         self.config = Config()
         self.classifier = None
+        self.model_name = None
+        self.model_backend = None
+        self.model_status = 'not_loaded'
+        self.inference_server = None
         self.kmp_matcher = KMPMatcher()
-        self.preprocessor = TextPreprocessor()
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
-        self.load_model()
+        self.preprocessor = TextPreprocessor(
+            lightweight=self.config.PREPROCESS_LIGHTWEIGHT,
+            lemma_table=self.config.LEMMA_TABLE_PATH,
+            lemma_cache_size=self.config.LEMMA_CACHE_SIZE
+        )
+        # VADER is loaded on first use (see sentiment_analyzer)
+        self._sentiment_analyzer = None
+        self._sentiment_checked = False
+        # The naive Bayes artifact is memory-mapped on first use and reloaded when a newer
+        # version appears (see statistical_model); updates are serialized, reads never wait
+        self._statistical_model = None
+        self._statistical_version = None
+        self._statistical_checked_at = None
+        self._statistical_update_lock = threading.Lock()
+        # MinHash index of past verdicts, consulted on exact cache misses (see near_duplicates)
+        self._near_duplicates = None
+        self._near_duplicates_checked = False
+        self._near_duplicates_lock = threading.Lock()
         
         # Pre-compiled regex patterns for efficiency
         self.patterns = {
@@ -51,47 +84,245 @@ class FakeNewsDetector:
             'locations': re.compile(r'\b(?:United States|USA|America|Europe|Asia|Africa|Australia|Canada|UK|Britain|England|France|Germany|China|Japan|India|Russia)\b', re.IGNORECASE)
         }
         
-        # Enhanced trusted news indicators
-        self.trusted_indicators = [
-            'according to', 'sources say', 'reported by', 'reuters', 'ap news', 'bbc', 'cnn', 'npr',
-            'associated press', 'new york times', 'washington post', 'wall street journal',
-            'study shows', 'research indicates', 'data suggests', 'statistics show', 'poll conducted',
-            'survey found', 'analysis reveals', 'investigation shows', 'officials said',
-            'spokesperson confirmed', 'press release', 'statement issued', 'conference call',
-            'peer-reviewed', 'published in', 'journal of', 'university study', 'academic research'
-        ]
-        
-        # Enhanced fake news indicators
-        self.fake_indicators = [
-            'you won\'t believe', 'doctors hate', 'this one trick', 'secret they don\'t want',
-            'mainstream media', 'they don\'t want you to know', 'wake up', 'open your eyes',
-            'the truth is', 'conspiracy', 'cover up', 'hidden agenda', 'fake news media',
-            'deep state', 'shadow government', 'illuminati', 'new world order',
-            'click here', 'share if you agree', 'like and share', 'going viral',
-            'must read', 'urgent alert', 'breaking exclusive', 'insider reveals'
-        ]
-        
-        # Credible news sources
-        self.credible_sources = [
-            'reuters.com', 'apnews.com', 'bbc.com', 'cnn.com', 'npr.org',
-            'nytimes.com', 'washingtonpost.com', 'wsj.com', 'bloomberg.com',
-            'guardian.com', 'economist.com', 'time.com', 'newsweek.com',
-            'usatoday.com', 'abcnews.go.com', 'cbsnews.com', 'nbcnews.com',
-            'pbs.org', 'politico.com', 'axios.com', 'thehill.com'
-        ]
-        
-        # Fact-checking sources
-        self.fact_checkers = [
-            'snopes.com', 'factcheck.org', 'politifact.com', 'truthorfiction.com',
-            'fullfact.org', 'factcheckni.org', 'checkyourfact.com', 'leadstories.com'
-        ]
-        
-        # Cache for online verification results
-        self.verification_cache = {}
+        # Indicator lists (see src/data/indicator_lexicons.py)
+        self.trusted_indicators = TRUSTED_INDICATORS
+        self.fake_indicators = FAKE_INDICATORS
+        self.credible_sources = CREDIBLE_SOURCES
+        self.fact_checkers = FACT_CHECK_SITES
+        
+        # All indicator phrases compiled once; each request scans the text a single time
+        self.lexicon = LexiconScanner(INDICATOR_LEXICONS)
+        
+        # Rule-based results are keyed on the rule-set version, model outputs on the model id,
+        # so changing a rule never throws away cached inference results
+        self.ruleset_version = f"{RULESET_VERSION}-{self.lexicon.fingerprint()}"
+        self.cache = TieredResultCache(
+            ['rules', 'model', 'verification'],
+            max_entries=self.config.CACHE_MAX_ENTRIES,
+            ttl=self.config.CACHE_TTL_SECONDS,
+            shards=self.config.CACHE_SHARDS,
+            enabled=self.config.CACHE_ENABLED
+        )
+        
+        # Per-stage latency histograms; can be toggled at runtime via metrics.enabled
+        self.metrics = StageMetrics(enabled=self.config.METRICS_ENABLED)
+        
+        # CPU-bound rule analysis can run in warm worker processes instead of request threads
+        self.executor_mode = executor_mode or self.config.EXECUTOR_MODE
+        self.rule_pool = None
+        if self.executor_mode == 'process':
+            self.rule_pool = RuleAnalysisPool(
+                workers=self.config.PROCESS_WORKERS or None,
+                start_method=self.config.PROCESS_START_METHOD
+            )
+        
+        # Compiled rule stages for batch scoring, built on first use per stage selection
+        self._rule_engines = {}
+        
+        # Cheap-first cascade: decisions per tier, used to tune the uncertainty band
+        self._cascade_lock = threading.Lock()
+        self._cascade_counts = {'rules': 0, 'model': 0, 'model_unavailable': 0}
+        
+        if load_model:
+            self.load_model()
+        
+    @property
+    def model_ready(self):
+        return self.model_status == 'ready'
+    
+    def _profile_stages(self, profile):
+        """
+        Stages of a profile that can run now. Until the transformer is ready,
+        or while no naive Bayes artifact is loaded, that stage is dropped, so
+        the other weights are renormalised instead of a neutral 0.5 diluting
+        the score.
+        """
+        stages = resolve_profile(profile)
+        available = [stage for stage in stages
+                     if (self.model_ready or not stage.in_parent)
+                     and (stage.name != 'statistical' or self.statistical_model is not None)]
+        return available or stages
+    
+    @property
+    def sentiment_analyzer(self):
+        """VADER analyzer, built on first use; None if its lexicon is not available"""
+        if not self._sentiment_checked:
+            analyzer = None
+            if ensure_resource('vader_lexicon'):
+                try:
+                    from nltk.sentiment import SentimentIntensityAnalyzer
+                    analyzer = SentimentIntensityAnalyzer()
+                except Exception as e:
+                    logging.warning(f"⚠️ Could not load VADER sentiment analyzer: {str(e)}")
+            self._sentiment_analyzer = analyzer
+            self._sentiment_checked = True
+        return self._sentiment_analyzer
+    
+    @property
+    def statistical_model(self):
+        """
+        Naive Bayes classifier from STATISTICAL_MODEL_DIR, loaded on first
+        use; None without an artifact. At most every STATISTICAL_RELOAD_SECONDS
+        the manifest is checked and a version written by another process is
+        swapped in.
+        """
+        checked_at = self._statistical_checked_at
+        if checked_at is None or time.monotonic() - checked_at >= self.config.STATISTICAL_RELOAD_SECONDS:
+            self._refresh_statistical_model()
+        return self._statistical_model
+    
+    def _statistical_manifest_version(self):
+        from src.models.statistical import MANIFEST_FILE
+        try:
+            return os.stat(os.path.join(self.config.STATISTICAL_MODEL_DIR, MANIFEST_FILE)).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _refresh_statistical_model(self):
+        version = self._statistical_manifest_version()
+        first_check = self._statistical_checked_at is None
+        self._statistical_checked_at = time.monotonic()
+        if version == self._statistical_version and not first_check:
+            return
+        # An update in progress is about to swap in this version anyway; keep serving meanwhile
+        if not self._statistical_update_lock.acquire(blocking=first_check):
+            return
+        try:
+            if first_check or version != self._statistical_version:
+                from src.models.statistical import load_if_present
+                self._statistical_model = load_if_present(self.config.STATISTICAL_MODEL_DIR)
+                self._statistical_version = version
+        finally:
+            self._statistical_update_lock.release()
+    
+    @property
+    def near_duplicates(self):
+        """
+        NearDuplicateIndex of past verdicts when NEAR_DUPLICATE_ENABLED, else
+        None. Loaded from NEAR_DUPLICATE_INDEX_PATH on first use; an index
+        built with different preprocessing is ignored and a new one started.
+        """
+        if not self.config.NEAR_DUPLICATE_ENABLED:
+            return None
+        if not self._near_duplicates_checked:
+            with self._near_duplicates_lock:
+                if not self._near_duplicates_checked:
+                    from src.utils.near_duplicates import NearDuplicateIndex, load_if_present
+                    index = load_if_present(self.config.NEAR_DUPLICATE_INDEX_PATH,
+                                            self.config.NEAR_DUPLICATE_THRESHOLD,
+                                            self.config.NEAR_DUPLICATE_MAX_ENTRIES, self.preprocessor.mode)
+                    self._near_duplicates = index or NearDuplicateIndex(
+                        self.config.NEAR_DUPLICATE_THRESHOLD,
+                        max_entries=self.config.NEAR_DUPLICATE_MAX_ENTRIES,
+                        preprocessing=self.preprocessor.mode
+                    )
+                    self._near_duplicates_checked = True
+        return self._near_duplicates
+    
+    def _find_near_duplicate(self, document, profile=None, timings=None):
+        """
+        (signature, result): the stored verdict of an indexed near-duplicate
+        of the document as a prediction result, or None with the signature
+        to index the document under once it has been analyzed
+        """
+        index = self.near_duplicates
+        if index is None:
+            return None, None
+        with self.metrics.timer('near_duplicate_lookup', timings):
+            signature = index.signature(self.preprocessor.preprocess_tokens(document.text))
+            match = index.query(signature)
+        if match is None:
+            return signature, None
+        similarity, verdict = match
+        result = dict(verdict)
+        result.update({
+            'profile': profile,
+            'decided_by': 'near_duplicate',
+            'near_duplicate': {'similarity': round(similarity, 4), 'threshold': index.threshold}
+        })
+        return signature, result
+    
+    def _remember_verdict(self, document, result, signature=None):
+        """Index the verdict of an analyzed document; replaces the verdict of an indexed one"""
+        index = self.near_duplicates
+        if index is None or 'error' in result or result.get('decided_by') == 'near_duplicate':
+            return
+        from src.utils.near_duplicates import verdict_of
+        key = text_key(document.text)
+        if signature is None:
+            if index.update(key, verdict_of(result)):
+                return
+            signature = index.signature(self.preprocessor.preprocess_tokens(document.text))
+        index.add(key, signature, verdict_of(result))
+    
+    def save_near_duplicates(self):
+        """Write the near-duplicate index to NEAR_DUPLICATE_INDEX_PATH if it changed since loading"""
+        index = self._near_duplicates
+        if index is None or not index.modified:
+            return False
+        index.save(self.config.NEAR_DUPLICATE_INDEX_PATH)
+        logging.info(f"✅ Saved near-duplicate index with {len(index)} entries")
+        return True
+    
+    def update_statistical_model(self, texts, labels, persist=True):
+        """
+        Add reviewer-labeled examples to the statistical classifier with
+        partial_fit and swap the updated model in. The update works on
+        copies of the counts, so requests keep using the current model until
+        the single reference assignment that replaces it; concurrent updates
+        are applied one after the other. With persist=True the new version
+        is also written to STATISTICAL_MODEL_DIR, where other processes
+        pick it up. Raises ValueError for unknown labels or a model that
+        cannot be updated, LookupError when no model is loaded.
+        """
+        started = time.perf_counter()
+        self.statistical_model  # loads the artifact on first use
+        with self._statistical_update_lock:
+            # Read under the lock so an update that finished meanwhile is built upon
+            current = self._statistical_model
+            if current is None:
+                raise LookupError("No statistical model loaded; train one with `python -m src.cli train-statistical`")
+            updated = current.updated(texts, labels)
+            if persist and updated is not current:
+                updated.save(self.config.STATISTICAL_MODEL_DIR)
+                self._statistical_version = self._statistical_manifest_version()
+            self._statistical_model = updated
         
+        return {
+            'examples': len(texts),
+            'model_id': updated.model_id,
+            'updates': updated.manifest.get('updates', 0),
+            'persisted': bool(persist),
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)
+        }
+    
     def load_model(self):
         """Load efficient pre-trained model for fake news detection"""
+        if self.config.RULES_ONLY:
+            # torch and transformers are never imported in this mode
+            self.model_status = 'disabled'
+            logging.info("ℹ️ RULES_ONLY is set; transformer model disabled")
+            return
+        
+        self.model_status = 'loading'
+        classifier = None
+        backend = self.config.INFERENCE_BACKEND
         try:
+            from src.models.backends import create_backend
+            windows = self._window_policy()
+            if backend == 'onnx':
+                # Exported offline; the directory records which checkpoint it came from
+                try:
+                    classifier = create_backend(
+                        'onnx', max_length=self.config.MAX_LENGTH, onnx_model_dir=self.config.ONNX_MODEL_DIR,
+                        num_threads=self.config.INFERENCE_THREADS, windows=windows
+                    )
+                    self.model_name = classifier.model_name
+                    logging.info(f"✅ Loaded ONNX model: {self.model_name}")
+                except Exception as e:
+                    logging.warning(f"⚠️ Failed to load ONNX model, using int8 PyTorch backend: {str(e)}")
+                    backend = 'int8'
+            
             # Try to use a more efficient model or fallback to a general classification model
             model_options = [
                 "martin-ha/toxic-comment-model",  # Good for detecting misleading content
@@ -100,66 +331,423 @@ class FakeNewsDetector:
             ]
             
             for model_name in model_options:
+                if classifier:
+                    break
                 try:
-                    self.classifier = pipeline(
-                        "text-classification",
-                        model=model_name,
-                        tokenizer=model_name,
-                        device=0 if torch.cuda.is_available() else -1,
-                        max_length=512,
-                        truncation=True
+                    classifier = create_backend(
+                        backend, model_name, max_length=self.config.MAX_LENGTH,
+                        num_threads=self.config.INFERENCE_THREADS, windows=windows
                     )
-                    logging.info(f"✅ Loaded model: {model_name}")
-                    break
+                    self.model_name = model_name
+                    logging.info(f"✅ Loaded model: {model_name} ({backend})")
                 except Exception as e:
                     logging.warning(f"⚠️ Failed to load {model_name}: {str(e)}")
                     continue
             
-            if not self.classifier:
-                # Fallback to sentiment analysis which is always available
-                self.classifier = pipeline(
-                    "sentiment-analysis",
-                    model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                    device=0 if torch.cuda.is_available() else -1
+            if not classifier:
+                # Fallback to the full-precision sentiment model which is always available
+                backend = 'pytorch'
+                classifier = create_backend(
+                    backend, "cardiffnlp/twitter-roberta-base-sentiment-latest",
+                    max_length=self.config.MAX_LENGTH, windows=windows
                 )
+                self.model_name = "cardiffnlp/twitter-roberta-base-sentiment-latest"
                 logging.info("✅ Loaded fallback sentiment model")
+            
+            # All inference goes through one worker thread that batches concurrent requests
+            inference_server = BatchingInferenceServer(
+                classifier,
+                batch_size=self.config.BATCH_SIZE,
+                max_wait_ms=self.config.BATCH_MAX_WAIT_MS
+            )
+            
+            # Publish only when fully built; concurrent requests start using it immediately
+            self.classifier = classifier
+            self.model_backend = f"{backend}+windows" if windows else backend
+            self.inference_server = inference_server
+            self.model_status = 'ready'
                 
         except Exception as e:
             logging.error(f"❌ Error loading any model: {str(e)}")
             self.classifier = None
+            self.inference_server = None
+            self.model_status = 'failed'
+
+    def _window_policy(self):
+        """Sliding-window settings for long texts, or None to truncate at MAX_LENGTH"""
+        if not self.config.CHUNKED_INFERENCE:
+            return None
+        from src.models.backends import WindowPolicy
+        return WindowPolicy(
+            overlap=self.config.WINDOW_OVERLAP,
+            max_windows=self.config.MAX_WINDOWS,
+            selection=self.config.WINDOW_SELECTION,
+            aggregation=self.config.WINDOW_AGGREGATION,
+            batch_size=self.config.WINDOW_BATCH_SIZE
+        )
+
+    def predict(self, text, include_timings=False, profile=None, cascade=None):
+        """
+        Enhanced prediction using external verification APIs for maximum accuracy.
+        `text` may be a string or an AnalyzedDocument shared with the caller.
+        `profile` ('fast', 'balanced' or 'full', default Config.DEFAULT_PROFILE)
+        selects which stages are computed (see src/models/stages.py); an
+        unknown profile raises ValueError. With `cascade` (default
+        Config.CASCADE_ENABLED) the transformer is only consulted when the
+        rule score is uncertain and then carries CASCADE_MODEL_WEIGHT of the
+        score; 'decided_by' reports which tier decided.
+        With include_timings=True the result carries a 'timings' block with
+        per-stage latency in milliseconds.
+        """
+        if self._cascade_active(cascade, profile):
+            return self._predict_cascade([text], include_timings, profile)[0]
+        return self._predict(text, include_timings, profile=profile)
+
+    def _cache_key(self, profile, stages, document, cascade=False, linear=False):
+        ruleset_version = self.ruleset_version
+        # Rule-engine scores can differ from predict() by rounding, so they are not shared
+        if linear:
+            ruleset_version += '+linear'
+        if any(stage.name == 'statistical' for stage in stages):
+            statistical_model = self.statistical_model
+            ruleset_version += f"+nb-{statistical_model.model_id if statistical_model else 'none'}"
+        # The exact stripped text: several rules read character offsets and spacing
+        key = text_key(document.text)
+        # Results that (may) include the transformer score are only valid for that model
+        if cascade:
+            return (ruleset_version, f"{profile}+cascade", self.model_name, self.model_backend, key)
+        if any(stage.in_parent for stage in stages):
+            return (ruleset_version, profile, self.model_name, self.model_backend, key)
+        return (ruleset_version, profile, key)
 
-    def predict(self, text):
+    def _cascade_active(self, cascade, profile):
+        """Cascade applies to profiles that do not already run the transformer on every text"""
+        enabled = self.config.CASCADE_ENABLED if cascade is None else cascade
+        stages = resolve_profile(profile or self.config.DEFAULT_PROFILE)
+        return bool(enabled) and not any(stage.in_parent for stage in stages)
+
+    def _predict_cascade(self, texts, include_timings=False, profile=None, signals_futures=None):
         """
-        Enhanced prediction using external verification APIs for maximum accuracy
+        Rules first: texts whose rule score is decisive are answered by the
+        rules alone; texts inside the uncertainty band (CASCADE_LOWER,
+        CASCADE_UPPER) are escalated to the transformer in one batched call.
+        An escalated text's score is CASCADE_MODEL_WEIGHT times the model
+        score plus the rest times the rule score, so with the default 0.75 the
+        model decides the texts the rules could not.
         """
+        profile = profile or self.config.DEFAULT_PROFILE
+        stages = self._profile_stages(profile)
+        model_stage = STAGES['model']
+        lower, upper = self.config.CASCADE_LOWER, self.config.CASCADE_UPPER
+        # The rule stages share what the model does not take, in their usual proportions
+        model_weight = min(max(self.config.CASCADE_MODEL_WEIGHT, 0.0), 1.0)
+        rule_weight = sum(stage.weight for stage in stages)
+        escalated_weights = {stage.name: (1 - model_weight) * stage.weight / rule_weight for stage in stages}
+        escalated_weights[model_stage.name] = model_weight
+        signals_futures = signals_futures or [None] * len(texts)
+        
+        results = []
+        uncertain = []
+        decided = {'rules': 0, 'model': 0, 'model_unavailable': 0}
+        for index, text in enumerate(texts):
+            document = as_document(text).strip()
+            cache_key = self._cache_key(profile, stages, document, cascade=True)
+            cached = self.cache.get('rules', cache_key)
+            if cached is not None:
+                if signals_futures[index] is not None:
+                    signals_futures[index].cancel()
+                result = dict(cached)
+                if include_timings:
+                    result['timings'] = {'cache_hit': True}
+                results.append(result)
+                continue
+            
+            result = self._predict(document, include_timings, signals_futures[index], profile)
+            results.append(result)
+            if 'error' in result or result.get('decided_by') == 'near_duplicate':
+                continue
+            
+            rule_score = result['verification_score'] / 100
+            result['cascade'] = {'rule_score': rule_score, 'band': [lower, upper], 'escalated': False}
+            if lower < rule_score < upper:
+                uncertain.append((index, cache_key))
+                continue
+            decided['rules'] += 1
+            self.cache.set('rules', cache_key, {k: v for k, v in result.items() if k != 'timings'})
+        
+        if uncertain and self.model_ready:
+            batch_timings = {}
+            with self.metrics.timer('model', batch_timings):
+                scores = self._get_ml_predictions([as_document(texts[index]).strip().text for index, _ in uncertain])
+            for (index, cache_key), score in zip(uncertain, scores):
+                rules_result = results[index]
+                signals = {'key_claims': rules_result['key_claims'], 'model': score}
+                for stage in stages:
+                    signals[stage.name] = rules_result['external_verification'][stage.result_key]
+                result = self._assemble_result(signals, stages + [model_stage], None, profile,
+                                               decided_by='model', weights=escalated_weights)
+                result['cascade'] = dict(rules_result['cascade'], escalated=True)
+                self.cache.set('rules', cache_key, result)
+                self._remember_verdict(as_document(texts[index]).strip(), result)
+                
+                result = dict(result)
+                if 'timings' in rules_result:
+                    result['timings'] = dict(rules_result['timings'])
+                    result['timings']['model'] = round(batch_timings['model'] * 1000, 3)
+                results[index] = result
+                decided['model'] += 1
+        elif uncertain:
+            # Nothing to escalate to yet; the rule result stands
+            for index, cache_key in uncertain:
+                results[index]['cascade']['model_unavailable'] = True
+                self.cache.set('rules', cache_key, {k: v for k, v in results[index].items() if k != 'timings'})
+                decided['model_unavailable'] += 1
+        
+        with self._cascade_lock:
+            for tier, count in decided.items():
+                self._cascade_counts[tier] += count
+        return results
+
+    def cascade_stats(self):
+        """Cascade decisions per tier since start, and the resulting escalation rate"""
+        with self._cascade_lock:
+            counts = dict(self._cascade_counts)
+        total = sum(counts.values())
+        return {
+            'enabled': self.config.CASCADE_ENABLED,
+            'band': [self.config.CASCADE_LOWER, self.config.CASCADE_UPPER],
+            'model_weight': self.config.CASCADE_MODEL_WEIGHT,
+            'decisions': counts,
+            'escalation_rate': (counts['model'] + counts['model_unavailable']) / total if total else 0.0
+        }
+
+    def _predict(self, text, include_timings=False, signals_future=None, profile=None):
+        timings = {} if include_timings else None
+        profile = profile or self.config.DEFAULT_PROFILE
+        stages = self._profile_stages(profile)
+        
+        with self.metrics.timer('total', timings):
+            document = as_document(text).strip()
+            with self.metrics.timer('cache_lookup', timings):
+                cache_key = self._cache_key(profile, stages, document)
+                cached = self.cache.get('rules', cache_key)
+            
+            if cached is not None:
+                if signals_future is not None:
+                    signals_future.cancel()
+                result = dict(cached)
+            else:
+                signature, result = self._find_near_duplicate(document, profile, timings)
+                if result is not None:
+                    if signals_future is not None:
+                        signals_future.cancel()
+                else:
+                    result = self._predict_uncached(document, timings, signals_future, profile, stages)
+                    if 'error' not in result:
+                        self.cache.set('rules', cache_key, result)
+                        self._remember_verdict(document, result, signature)
+                    result = dict(result)
+        
+        if timings is not None:
+            result['timings'] = {stage: round(seconds * 1000, 3) for stage, seconds in timings.items()}
+            result['timings']['cache_hit'] = cached is not None
+        return result
+
+    def stage_info(self):
+        """Registered stages with declared and measured cost, and the profiles"""
+        info = describe_stages(self.metrics.summary())
+        info['default_profile'] = self.config.DEFAULT_PROFILE
+        statistical_model = self.statistical_model
+        info['statistical_model'] = statistical_model and {
+            'model_id': statistical_model.model_id,
+            'vectorizer': statistical_model.manifest['vectorizer'],
+            'n_features': statistical_model.n_features,
+            'metrics': statistical_model.manifest.get('metrics'),
+            'updates': statistical_model.manifest.get('updates', 0),
+            'updated_examples': statistical_model.manifest.get('updated_examples', 0)
+        }
+        info['cascade'] = self.cascade_stats()
+        return info
+
+    def cache_stats(self):
+        """Hit, miss and eviction statistics per cache tier"""
+        return self.cache.stats()
+
+    def lemma_stats(self):
+        """Lemma cache size and hit rate of this process, or None without a lemmatizer"""
+        if self.preprocessor.lemma_cache is None:
+            return None
+        return self.preprocessor.lemma_cache.stats()
+
+    def near_duplicate_stats(self):
+        """Size and hit rate of the near-duplicate index, or None when it is disabled"""
+        index = self.near_duplicates
+        return index.stats() if index is not None else None
+
+    def close(self):
+        """Stop the inference worker and the rule analysis pool, and save the near-duplicate index"""
         try:
-            # Preprocess text
-            processed_text = self.preprocessor.preprocess(text)
-            
-            # Extract key claims from the text
-            key_claims = self._extract_key_claims(text)
-            
-            # Multi-source verification
-            google_verification = self._verify_with_google_search(key_claims, text)
-            fact_check_verification = self._verify_with_fact_checkers(key_claims, text)
-            ai_content_analysis = self._analyze_with_ai_patterns(text)
-            source_credibility = self._analyze_source_credibility(text)
-            
-            # New weights focused on external verification
-            weights = {
-                'google_search': 0.35,      # Google search verification
-                'fact_checkers': 0.30,      # Fact-checking APIs
-                'ai_analysis': 0.20,        # AI pattern analysis (not word count)
-                'source_credibility': 0.15  # Source analysis
-            }
+            self.save_near_duplicates()
+        except Exception as e:
+            logging.warning(f"⚠️ Could not save near-duplicate index: {str(e)}")
+        if self.rule_pool:
+            self.rule_pool.close()
+        if self.inference_server:
+            self.inference_server.close()
+
+    def compute_signals(self, text, timings=None, stages=None):
+        """
+        Run the rule stages named in `stages` (default: those of
+        Config.DEFAULT_PROFILE) and the shared inputs they read; nothing
+        else is computed. The result is deliberately small (key claims and
+        one score per stage) because in process mode it is what crosses the
+        process boundary. All stages read the same AnalyzedDocument, so each
+        derived view of the text is built once.
+        """
+        timer = self.metrics.timer
+        document = as_document(text)
+        if stages is None:
+            stages = [stage.name for stage in resolve_profile(self.config.DEFAULT_PROFILE)]
+        selected = [STAGES[name] for name in stages if not STAGES[name].in_parent]
+        
+        # Shared inputs, e.g. the single lexicon pass read by every lexicon stage
+        inputs = {}
+        for name in required_inputs(selected):
+            timer_name, build = INPUTS[name]
+            with timer(timer_name, timings):
+                inputs[name] = build(self, document)
+        
+        signals = {'key_claims': inputs.get('key_claims', [])}
+        for stage in selected:
+            with timer(stage.name, timings):
+                signals[stage.name] = stage.compute(self, document, inputs)
+        return signals
+
+    def _rule_engine(self, stage_names):
+        """LinearRuleEngine over the compiled stages among stage_names (numpy/scipy load on first use)"""
+        engine = self._rule_engines.get(stage_names)
+        if engine is None:
+            from src.models.rule_engine import LinearRuleEngine
+            engine = LinearRuleEngine(self, stage_names)
+            self._rule_engines[stage_names] = engine
+        return engine
+
+    def compute_signals_batch(self, texts, stages=None, timings=None):
+        """
+        compute_signals() for a batch: the compiled rule stages of all texts
+        are scored together by the sparse linear rule engine; other rule
+        stages run per text. Stage scores match compute_signals() up to
+        floating-point rounding.
+        """
+        timer = self.metrics.timer
+        documents = [as_document(text) for text in texts]
+        if stages is None:
+            stages = [stage.name for stage in resolve_profile(self.config.DEFAULT_PROFILE)]
+        selected = [STAGES[name] for name in stages if not STAGES[name].in_parent]
+        engine = self._rule_engine(tuple(stage.name for stage in selected))
+        
+        # Shared inputs are built once per document; the engine reuses the extracted key claims
+        all_inputs = []
+        for document in documents:
+            inputs = {}
+            for name in required_inputs(selected):
+                timer_name, build = INPUTS[name]
+                with timer(timer_name, timings):
+                    inputs[name] = build(self, document)
+            all_inputs.append(inputs)
+        
+        with timer('rule_engine', timings):
+            key_claims = [inputs['key_claims'] for inputs in all_inputs] if engine.reads_key_claims else None
+            scores = engine.score(documents, key_claims) if documents else None
+        
+        # The lexicon hits and regex matches are cached on each document
+        remaining = [stage for stage in selected if stage.name not in engine.stages]
+        batch_signals = []
+        for row, (document, inputs) in enumerate(zip(documents, all_inputs)):
+            signals = {'key_claims': inputs.get('key_claims', [])}
+            for column, name in enumerate(engine.stages):
+                signals[name] = float(scores[row, column])
+            for stage in remaining:
+                if stage.compute_batch is None:
+                    with timer(stage.name, timings):
+                        signals[stage.name] = stage.compute(self, document, inputs)
+            batch_signals.append(signals)
+        
+        # Stages with a batch implementation score all documents in one call
+        for stage in remaining:
+            if stage.compute_batch is not None and documents:
+                with timer(stage.name, timings):
+                    for signals, score in zip(batch_signals, stage.compute_batch(self, documents)):
+                        signals[stage.name] = score
+        return batch_signals
+
+    def _compute_signals_in_pool(self, text, timings=None, signals_future=None, stages=None):
+        """Run compute_signals() in a worker process; falls back to this thread if the pool fails"""
+        try:
+            with self.metrics.timer('process_pool', timings):
+                # Only the text crosses the process boundary; the worker builds its own document
+                future = signals_future or self.rule_pool.submit(as_document(text).text, stages)
+                signals, worker_timings = future.result(timeout=self.config.INFERENCE_TIMEOUT)
+        except Exception as e:
+            logging.warning(f"⚠️ Rule analysis pool failed, analyzing in-process: {str(e)}")
+            return self.compute_signals(text, timings, stages)
+        
+        # Worker stage latencies feed the parent's histograms
+        for stage, seconds in worker_timings.items():
+            if self.metrics.enabled:
+                self.metrics.observe(stage, seconds)
+            if timings is not None:
+                timings[stage] = timings.get(stage, 0.0) + seconds
+        return signals
+
+    def _predict_uncached(self, text, timings=None, signals_future=None, profile=None, stages=None):
+        try:
+            profile = profile or self.config.DEFAULT_PROFILE
+            stages = stages or self._profile_stages(profile)
+            stage_names = tuple(stage.name for stage in stages)
             
-            # Calculate verification score
-            verification_score = (
-                weights['google_search'] * google_verification +
-                weights['fact_checkers'] * fact_check_verification +
-                weights['ai_analysis'] * ai_content_analysis +
-                weights['source_credibility'] * source_credibility
-            )
+            if self.rule_pool:
+                signals = self._compute_signals_in_pool(text, timings, signals_future, stage_names)
+            else:
+                signals = self.compute_signals(text, timings, stage_names)
+            
+            # The transformer runs here, next to the inference server
+            document = as_document(text)
+            for stage in stages:
+                if stage.in_parent:
+                    with self.metrics.timer(stage.name, timings):
+                        signals[stage.name] = stage.compute(self, document, {})
+            
+            return self._assemble_result(signals, stages, timings, profile)
+        
+        except Exception as e:
+            logging.error(f"❌ Error in prediction: {str(e)}")
+            return {
+                'prediction': 'real',
+                'status': 'ERROR - MANUAL VERIFICATION REQUIRED',
+                'confidence': 0.50,
+                'verification_score': 50,
+                'error': str(e)
+            }
+
+    def _assemble_result(self, signals, stages, timings=None, profile=None, decided_by=None, weights=None):
+        """
+        Combine the verification signals into the final prediction result.
+        `weights` (stage name -> weight) overrides the registered stage weights.
+        """
+        if decided_by is None:
+            decided_by = 'model' if self.model_ready and any(stage.in_parent for stage in stages) else 'rules'
+        with self.metrics.timer('assemble', timings):
+            key_claims = signals['key_claims']
+            
+            # Weighted by the stage weights, renormalised over the stages that ran
+            weights = weights or {stage.name: stage.weight for stage in stages}
+            verification_score = 0
+            for stage in stages:
+                verification_score += weights[stage.name] * signals[stage.name]
+            total_weight = sum(weights[stage.name] for stage in stages)
+            if abs(total_weight - 1.0) > 1e-9:
+                verification_score /= total_weight
             
             # Determine authenticity with strict thresholds
             if verification_score >= 0.75:
@@ -176,50 +764,137 @@ class FakeNewsDetector:
                 confidence = 0.65  # Always moderate confidence for suspicious content
                 status = "SUSPICIOUS - REQUIRES VERIFICATION"
             
-            return {
+            result = {
                 'prediction': 'real' if is_authentic else 'fake',
                 'status': status,
                 'confidence': confidence,
                 'verification_score': verification_score * 100,
                 'key_claims': key_claims,
-                'external_verification': {
-                    'google_search_score': google_verification,
-                    'fact_check_score': fact_check_verification,
-                    'ai_analysis_score': ai_content_analysis,
-                    'source_credibility_score': source_credibility
-                },
+                'external_verification': {stage.result_key: signals[stage.name] for stage in stages},
+                'profile': profile,
+                'decided_by': decided_by,
                 'verification_details': self._get_verification_details(key_claims),
                 'recommendations': self._get_verification_recommendations(verification_score)
             }
+            # The profile asked for the transformer but it was not ready (see _profile_stages)
+            if profile in PROFILES and not any(stage.in_parent for stage in stages) and \
+                    any(STAGES[name].in_parent for name in PROFILES[profile]):
+                result['model_unavailable'] = True
+            # Likewise the naive Bayes stage without a trained artifact
+            if profile in PROFILES and 'statistical' in PROFILES[profile] and \
+                    not any(stage.name == 'statistical' for stage in stages):
+                result['statistical_unavailable'] = True
+            return result
+
+    def predict_batch(self, texts, profile=None, cascade=None):
+        """
+        Predict a batch of texts. Results are returned in input order;
+        identical texts are analyzed once and invalid items get a per-item
+        error instead of failing the whole batch. In cascade mode all
+        escalated texts share batched transformer calls.
+        """
+        results = [None] * len(texts)
+        pending = {}
         
-        except Exception as e:
-            logging.error(f"❌ Error in prediction: {str(e)}")
-            return {
-                'prediction': 'real',
-                'status': 'ERROR - MANUAL VERIFICATION REQUIRED',
-                'confidence': 0.50,
-                'verification_score': 50,
-                'error': str(e)
-            }
+        for index, text in enumerate(texts):
+            if not isinstance(text, str) or not text.strip():
+                results[index] = {'error': 'No text provided'}
+                continue
+            pending.setdefault(text, []).append(index)
+        
+        # In process mode every distinct text is dispatched up front so the workers run in parallel;
+        # futures of texts that turn out to be cached are cancelled
+        stages = self._profile_stages(profile or self.config.DEFAULT_PROFILE)
+        futures = {}
+        if self.rule_pool:
+            stage_names = tuple(stage.name for stage in stages)
+            futures = {text: self.rule_pool.submit(text.strip(), stage_names) for text in pending}
+        
+        if self._cascade_active(cascade, profile):
+            distinct = list(pending)
+            try:
+                predictions = self._predict_cascade(distinct, profile=profile,
+                                                    signals_futures=[futures.get(text) for text in distinct])
+            except Exception as e:
+                logging.error(f"❌ Error in batch prediction: {str(e)}")
+                predictions = [{'error': str(e)} for _ in distinct]
+            for text, result in zip(distinct, predictions):
+                for index in pending[text]:
+                    results[index] = dict(result)
+            return results
+        
+        # Thread mode: the rule stages of all uncached texts are scored in one rule-engine pass
+        if not self.rule_pool and self.config.LINEAR_RULE_ENGINE and pending:
+            distinct = list(pending)
+            try:
+                predictions = self._predict_batch_linear(distinct, profile)
+            except Exception as e:
+                logging.warning(f"⚠️ Linear rule engine failed, analyzing per text: {str(e)}")
+            else:
+                for text, result in zip(distinct, predictions):
+                    for index in pending[text]:
+                        results[index] = dict(result)
+                return results
+        
+        for text, indices in pending.items():
+            try:
+                result = self._predict(text, signals_future=futures.get(text), profile=profile)
+            except Exception as e:
+                logging.error(f"❌ Error in batch prediction: {str(e)}")
+                result = {'error': str(e)}
+            
+            for index in indices:
+                results[index] = dict(result)
+        
+        return results
+
+    def _predict_batch_linear(self, texts, profile=None):
+        """Cached texts are answered from the cache; the rest share one compute_signals_batch() call"""
+        profile = profile or self.config.DEFAULT_PROFILE
+        stages = self._profile_stages(profile)
+        documents = [as_document(text).strip() for text in texts]
+        cache_keys = [self._cache_key(profile, stages, document, linear=True) for document in documents]
+        results = [self.cache.get('rules', cache_key) for cache_key in cache_keys]
+        
+        missing = []
+        signatures = {}
+        for index, result in enumerate(results):
+            if result is None:
+                signatures[index], results[index] = self._find_near_duplicate(documents[index], profile)
+                if results[index] is None:
+                    missing.append(index)
+        if missing:
+            batch_signals = self.compute_signals_batch([documents[index] for index in missing],
+                                                       [stage.name for stage in stages])
+            for index, signals in zip(missing, batch_signals):
+                for stage in stages:
+                    if stage.in_parent:
+                        with self.metrics.timer(stage.name):
+                            signals[stage.name] = stage.compute(self, documents[index], {})
+                result = self._assemble_result(signals, stages, profile=profile)
+                self.cache.set('rules', cache_keys[index], result)
+                self._remember_verdict(documents[index], result, signatures[index])
+                results[index] = result
+        return [dict(result) for result in results]
 
     def _extract_key_claims(self, text):
         """Extract key factual claims from the text for verification"""
         claims = []
+        document = as_document(text)
         
         # Extract names, places, dates, numbers
-        import re
         
         # Extract proper nouns (potential names/places)
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', text)
+        proper_nouns = document.findall(CLAIM_PATTERNS['proper_nouns'])
         
         # Extract dates
-        dates = re.findall(r'\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}|\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}|\b\d{4}\b', text)
+        dates = document.findall(CLAIM_PATTERNS['dates'])
         
         # Extract numbers/statistics
-        numbers = re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:million|billion|thousand|percent|%))?', text)
+        numbers = document.findall(CLAIM_PATTERNS['numbers'])
         
         # Extract quoted statements
-        quotes = re.findall(r'"([^"]*)"', text)
+        quotes = document.findall(CLAIM_PATTERNS['quotes'])
         
         # Combine key claims
         claims.extend(proper_nouns[:5])  # Top 5 names/places
@@ -229,131 +904,27 @@ class FakeNewsDetector:
         
         return list(set(claims))  # Remove duplicates
 
-    def _verify_with_google_search(self, key_claims, text):
+    def _verify_with_google_search(self, key_claims, text, hits=None):
         """Verify content using Google Search (simulated - replace with actual API)"""
-        try:
-            # This is a simplified simulation - in production, use Google Custom Search API
-            score = 0.5  # Start neutral
-            
-            # Check for current events keywords that can be verified
-            current_events = [
-                'ukraine war', 'gaza conflict', 'israel palestine', 'russia ukraine',
-                'artificial intelligence', 'climate change', 'covid pandemic',
-                'us election', 'biden administration', 'trump', 'putin', 'zelensky'
-            ]
-            
-            text_lower = text.lower()
-            verifiable_events = sum(1 for event in current_events if event in text_lower)
-            
-            if verifiable_events > 0:
-                score += 0.3  # Boost for verifiable current events
-            
-            # Check for specific verifiable facts
-            if any(claim.isdigit() and len(claim) == 4 and 2020 <= int(claim) <= 2025 for claim in key_claims):
-                score += 0.2  # Recent year mentioned
-                
-            # Penalty for unverifiable sensational claims
-            sensational = ['miracle cure', 'secret revealed', 'shocking truth', 'hidden agenda']
-            if any(phrase in text_lower for phrase in sensational):
-                score -= 0.4
-                
-            return max(0, min(1, score))
-            
-        except Exception as e:
-            logging.warning(f"Google verification error: {str(e)}")
-            return 0.5
+        return self._score_rules('google_search', text, hits, key_claims)
 
-    def _verify_with_fact_checkers(self, key_claims, text):
+    def _verify_with_fact_checkers(self, key_claims, text, hits=None):
         """Verify with fact-checking databases (simulated)"""
-        try:
-            score = 0.5
-            text_lower = text.lower()
-            
-            # Known debunked claims patterns
-            debunked_patterns = [
-                '5g causes covid', 'vaccines cause autism', 'earth is flat',
-                'chemtrails', 'moon landing fake', 'birds aren\'t real',
-                'covid is hoax', 'climate change hoax', 'deep state'
-            ]
-            
-            # Check for debunked claims
-            debunked_count = sum(1 for pattern in debunked_patterns if pattern in text_lower)
-            if debunked_count > 0:
-                score -= 0.6  # Heavy penalty for debunked claims
-            
-            # Check for fact-checker language
-            fact_check_language = [
-                'according to snopes', 'factcheck.org confirms', 'politifact rates',
-                'verified by reuters', 'ap fact check', 'bbc reality check'
-            ]
-            
-            fact_check_mentions = sum(1 for phrase in fact_check_language if phrase in text_lower)
-            if fact_check_mentions > 0:
-                score += 0.4
-            
-            return max(0, min(1, score))
-            
-        except Exception as e:
-            logging.warning(f"Fact-checker verification error: {str(e)}")
-            return 0.5
+        return self._score_rules('fact_checkers', text, hits, key_claims)
 
-    def _analyze_with_ai_patterns(self, text):
+    def _analyze_with_ai_patterns(self, text, hits=None):
         """AI-based content analysis WITHOUT word count bias"""
+        return self._score_rules('ai_analysis', text, hits)
+
+    def _score_rules(self, stage, text, hits=None, key_claims=()):
+        """Score of a rule stage from its feature functions and weight table (src/models/rules.py)"""
         try:
-            score = 0.5
-            text_lower = text.lower()
-            
-            # Focus on CONTENT QUALITY, not quantity
-            
-            # 1. Logical structure analysis
-            has_intro = any(phrase in text_lower[:200] for phrase in ['according to', 'reports indicate', 'breaking'])
-            has_conclusion = any(phrase in text_lower[-200:] for phrase in ['in conclusion', 'officials said', 'investigation continues'])
-            
-            if has_intro and has_conclusion:
-                score += 0.2
-            elif has_intro or has_conclusion:
-                score += 0.1
-            
-            # 2. Credible attribution patterns
-            attribution_patterns = [
-                'according to officials', 'spokesperson said', 'confirmed by',
-                'reported by', 'sources close to', 'government statement'
-            ]
-            attribution_count = sum(1 for pattern in attribution_patterns if pattern in text_lower)
-            score += min(attribution_count * 0.15, 0.3)
-            
-            # 3. Emotional manipulation detection (STRONG PENALTY)
-            manipulation_patterns = [
-                'you won\'t believe', 'shocking truth', 'they don\'t want you to know',
-                'doctors hate', 'one weird trick', 'this will blow your mind',
-                'urgent warning', 'share before deleted', 'going viral'
-            ]
-            manipulation_count = sum(1 for pattern in manipulation_patterns if pattern in text_lower)
-            if manipulation_count > 0:
-                score -= 0.5  # Heavy penalty
-            
-            # 4. Conspiracy theory indicators
-            conspiracy_indicators = [
-                'deep state', 'new world order', 'illuminati', 'false flag',
-                'crisis actor', 'staged event', 'cover up', 'wake up sheeple'
-            ]
-            conspiracy_count = sum(1 for indicator in conspiracy_indicators if indicator in text_lower)
-            if conspiracy_count > 0:
-                score -= 0.6  # Very heavy penalty
-            
-            # 5. Professional journalism indicators
-            journalism_indicators = [
-                'investigation revealed', 'documents show', 'data indicates',
-                'study found', 'research suggests', 'analysis shows',
-                'experts say', 'officials confirm'
-            ]
-            journalism_count = sum(1 for indicator in journalism_indicators if indicator in text_lower)
-            score += min(journalism_count * 0.1, 0.25)
-            
-            return max(0, min(1, score))
-            
+            document = as_document(text)
+            if hits is None:
+                hits = document.scan(self.lexicon)
+            return RULE_SETS[stage].score(self, document, hits, key_claims)
         except Exception as e:
-            logging.warning(f"AI analysis error: {str(e)}")
+            logging.warning(f"⚠️ {stage} analysis error: {str(e)}")
             return 0.5
 
     def _get_verification_details(self, key_claims):
@@ -396,44 +967,41 @@ class FakeNewsDetector:
         Perform online verification using multiple methods
         """
         try:
-            # Create a hash of the text for caching
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-            
-            # Check cache first
-            if text_hash in self.verification_cache:
-                cached_result = self.verification_cache[text_hash]
-                if time.time() - cached_result['timestamp'] < 3600:  # 1 hour cache
-                    return cached_result['score']
+            # Check cache first (entries expire after CACHE_TTL_SECONDS)
+            document = as_document(text)
+            cache_key = (self.ruleset_version, text_key(document.text))
+            cached_score = self.cache.get('verification', cache_key)
+            if cached_score is not None:
+                return cached_score
             
             verification_score = 0.5  # Start neutral
             
             # Method 1: Check for URLs in text and verify domain credibility
-            urls = self.patterns['urls'].findall(text)
+            urls = document.findall(self.patterns['urls'])
             if urls:
                 for url in urls:
                     domain_score = self._check_domain_credibility(url)
                     verification_score += domain_score * 0.3  # Weight domain credibility
             
+            hits = document.scan(self.lexicon)
+            
             # Method 2: Check for factual consistency patterns
-            fact_score = self._check_factual_patterns(text)
+            fact_score = self._check_factual_patterns(document, hits)
             verification_score += fact_score * 0.4
             
             # Method 3: Cross-reference with known misinformation patterns
-            misinformation_score = self._check_misinformation_patterns(text)
+            misinformation_score = self._check_misinformation_patterns(document, hits)
             verification_score -= misinformation_score * 0.3
             
             # Method 4: Check for recent news correlation (simplified)
-            recency_score = self._check_news_recency(text)
+            recency_score = self._check_news_recency(document, hits)
             verification_score += recency_score * 0.2
             
             # Normalize score
             verification_score = max(0, min(1, verification_score))
             
             # Cache the result
-            self.verification_cache[text_hash] = {
-                'score': verification_score,
-                'timestamp': time.time()
-            }
+            self.cache.set('verification', cache_key, verification_score)
             
             return verification_score
             
@@ -467,88 +1035,69 @@ class FakeNewsDetector:
         except Exception:
             return 0.5
 
-    def _check_factual_patterns(self, text):
+    def _check_factual_patterns(self, text, hits=None):
         """Check for patterns that indicate factual reporting"""
         score = 0.0
+        document = as_document(text)
+        if hits is None:
+            hits = document.scan(self.lexicon)
         
         # Check for specific dates
-        if self.patterns['dates'].search(text):
+        if document.search(self.patterns['dates']):
             score += 0.2
         
         # Check for specific locations
-        if self.patterns['locations'].search(text):
+        if document.search(self.patterns['locations']):
             score += 0.2
         
         # Check for numerical data
-        numbers = self.patterns['numbers'].findall(text)
+        numbers = document.findall(self.patterns['numbers'])
         if len(numbers) >= 2:  # Multiple numbers suggest data-driven content
             score += 0.3
         
         # Check for quotes (indicating sources)
-        quotes = self.patterns['quotes'].findall(text)
+        quotes = document.findall(self.patterns['quotes'])
         if len(quotes) >= 1:
             score += 0.2
         
         # Check for official language patterns
-        official_patterns = [
-            'according to officials', 'government statement', 'press conference',
-            'official report', 'published study', 'research findings'
-        ]
-        for pattern in official_patterns:
-            if pattern.lower() in text.lower():
-                score += 0.1
+        score += hits.count('official_patterns') * 0.1
         
         return min(score, 1.0)
 
-    def _check_misinformation_patterns(self, text):
+    def _check_misinformation_patterns(self, text, hits=None):
         """Check for common misinformation patterns"""
         score = 0.0
-        text_lower = text.lower()
+        document = as_document(text)
+        if hits is None:
+            hits = document.scan(self.lexicon)
         
         # Check for conspiracy theory keywords
-        conspiracy_keywords = [
-            'deep state', 'shadow government', 'new world order', 'illuminati',
-            'chemtrails', 'false flag', 'crisis actor', 'hoax', 'staged'
-        ]
-        for keyword in conspiracy_keywords:
-            if keyword in text_lower:
-                score += 0.2
+        score += hits.count('conspiracy_keywords') * 0.2
         
         # Check for emotional manipulation tactics
-        manipulation_patterns = [
-            'they don\'t want you to know', 'hidden truth', 'secret agenda',
-            'wake up sheeple', 'open your eyes', 'mainstream media lies'
-        ]
-        for pattern in manipulation_patterns:
-            if pattern in text_lower:
-                score += 0.15
+        score += hits.count('misinformation_manipulation') * 0.15
         
         # Check for urgency manipulation
-        urgency_patterns = [
-            'urgent', 'breaking exclusive', 'must share', 'before it\'s deleted',
-            'going viral', 'share before', 'time sensitive'
-        ]
-        for pattern in urgency_patterns:
-            if pattern in text_lower:
-                score += 0.1
+        score += hits.count('urgency_patterns') * 0.1
         
         return min(score, 1.0)
 
-    def _check_news_recency(self, text):
+    def _check_news_recency(self, text, hits=None):
         """Check if content appears to be recent and relevant"""
         score = 0.5  # Start neutral
+        document = as_document(text)
+        if hits is None:
+            hits = document.scan(self.lexicon)
         
         # Check for recent date patterns
         current_year = datetime.now().year
-        if str(current_year) in text or str(current_year - 1) in text:
+        if str(current_year) in document.text or str(current_year - 1) in document.text:
             score += 0.3
         
         # Check for time-sensitive language
-        recent_patterns = ['today', 'yesterday', 'this week', 'recently', 'latest']
-        for pattern in recent_patterns:
-            if pattern.lower() in text.lower():
-                score += 0.1
-                break
+        if hits.count('recent_patterns') > 0:
+            score += 0.1
         
         return min(score, 1.0)
 
@@ -591,299 +1140,74 @@ class FakeNewsDetector:
         
         return references
 
-    def _analyze_linguistic_features(self, text):
+    def _analyze_linguistic_features(self, text, hits=None):
         """Analyze linguistic features to determine credibility"""
-        score = 0.5  # Start neutral
-        
-        try:
-            # Enhanced text length analysis
-            word_count = len(text.split())
-            if 100 <= word_count <= 800:  # Optimal length for news articles
-                score += 0.15
-            elif 50 <= word_count < 100:  # Short but acceptable
-                score += 0.08
-            elif word_count < 30:  # Too short, likely incomplete or clickbait
-                score -= 0.20
-            elif word_count > 1200:  # Very long, might be spam or poorly structured
-                score -= 0.15
-            
-            # Enhanced readability analysis
-            try:
-                reading_ease = flesch_reading_ease(text)
-                if 40 <= reading_ease <= 80:  # Good readability for news
-                    score += 0.12
-                elif 20 <= reading_ease < 40:  # Acceptable complexity
-                    score += 0.06
-                elif reading_ease < 10:  # Too complex, might be academic or fake
-                    score -= 0.08
-                elif reading_ease > 90:  # Too simple, might be clickbait
-                    score -= 0.15
-            except:
-                pass
-            
-            # Enhanced capitalization analysis
-            caps_count = len(self.patterns['caps_ratio'].findall(text))
-            caps_ratio = caps_count / max(len(text), 1)
-            
-            if caps_ratio > 0.25:  # Excessive capitalization (fake news indicator)
-                score -= 0.25
-            elif caps_ratio > 0.15:  # High capitalization
-                score -= 0.12
-            elif 0.08 <= caps_ratio <= 0.12:  # Normal capitalization
-                score += 0.12
-            elif caps_ratio < 0.05:  # Too little capitalization
-                score -= 0.08
-            
-            # Enhanced punctuation analysis
-            exclamation_count = len(self.patterns['exclamation'].findall(text))
-            question_count = len(self.patterns['question'].findall(text))
-            
-            # Exclamation marks analysis
-            if exclamation_count > 5:  # Excessive exclamations
-                score -= 0.20
-            elif exclamation_count > 2:  # Many exclamations
-                score -= 0.10
-            elif exclamation_count == 0 and word_count > 100:  # Professional tone
-                score += 0.08
-            
-            # Question marks analysis
-            if question_count > 3:  # Too many questions (clickbait indicator)
-                score -= 0.15
-            elif question_count == 1 and word_count > 50:  # Single question is fine
-                score += 0.05
-            
-            # Enhanced sentiment analysis
-            sentiment = self.sentiment_analyzer.polarity_scores(text)
-            compound_score = sentiment['compound']
-            
-            # News should generally be neutral to slightly negative
-            if abs(compound_score) <= 0.2:  # Very neutral (good for news)
-                score += 0.15
-            elif abs(compound_score) <= 0.4:  # Moderately neutral
-                score += 0.08
-            elif abs(compound_score) > 0.8:  # Very extreme sentiment (red flag)
-                score -= 0.20
-            elif abs(compound_score) > 0.6:  # High sentiment
-                score -= 0.10
-            
-            # Check for balanced emotional language
-            positive_ratio = sentiment['pos']
-            negative_ratio = sentiment['neg']
-            neutral_ratio = sentiment['neu']
-            
-            if neutral_ratio > 0.7:  # High neutrality is good for news
-                score += 0.10
-            elif positive_ratio > 0.6 or negative_ratio > 0.6:  # Too emotional
-                score -= 0.12
-            
-            # Grammar and structure indicators
-            sentence_count = len([s for s in text.split('.') if s.strip()])
-            if sentence_count > 0:
-                avg_sentence_length = word_count / sentence_count
-                if 15 <= avg_sentence_length <= 25:  # Good sentence length
-                    score += 0.08
-                elif avg_sentence_length < 10:  # Too short sentences
-                    score -= 0.05
-                elif avg_sentence_length > 35:  # Too long sentences
-                    score -= 0.08
-            
-            # Check for professional language patterns
-            professional_indicators = [
-                'according to', 'reported that', 'stated that', 'confirmed that',
-                'announced that', 'revealed that', 'indicated that', 'suggested that'
-            ]
-            
-            professional_count = sum(1 for indicator in professional_indicators 
-                                   if indicator in text.lower())
-            if professional_count > 0:
-                score += min(professional_count * 0.06, 0.15)
-            
-            # Check for informal/unprofessional language
-            informal_indicators = [
-                'omg', 'lol', 'wtf', 'gonna', 'wanna', 'gotta', 'kinda',
-                'sorta', 'dunno', 'yeah', 'nah', 'ur', 'u', 'r'
-            ]
-            
-            informal_count = sum(1 for indicator in informal_indicators 
-                               if indicator in text.lower())
-            if informal_count > 0:
-                score -= min(informal_count * 0.08, 0.20)
-                
-        except Exception as e:
-            logging.warning(f"⚠️ Linguistic analysis error: {str(e)}")
-        
-        return max(0, min(1, score))
+        return self._score_rules('linguistic', text, hits)
     
-    def _analyze_content_features(self, text):
+    def _analyze_content_features(self, text, hits=None):
         """Analyze content features for credibility indicators"""
-        score = 0.5  # Start neutral
-        text_lower = text.lower()
-        
-        try:
-            # Check for trusted indicators with enhanced scoring
-            trusted_count = sum(1 for indicator in self.trusted_indicators if indicator in text_lower)
-            if trusted_count > 0:
-                score += min(trusted_count * 0.12, 0.35)  # Increased weight, max 0.35
-            
-            # Check for fake indicators with stronger penalties
-            fake_count = sum(1 for indicator in self.fake_indicators if indicator in text_lower)
-            if fake_count > 0:
-                score -= min(fake_count * 0.15, 0.45)  # Stronger penalty, max 0.45
-            
-            # Check for sensational language with graduated penalties
-            sensational_matches = len(self.patterns['sensational'].findall(text))
-            if sensational_matches > 0:
-                score -= min(sensational_matches * 0.08, 0.25)  # Graduated penalty
-            
-            # Enhanced fact-checking for specific details
-            has_numbers = len(self.patterns['numbers'].findall(text)) > 0
-            has_quotes = len(self.patterns['quotes'].findall(text)) > 0
-            has_dates = bool(self.patterns['dates'].search(text))
-            has_locations = bool(self.patterns['locations'].search(text))
-            
-            # Reward factual content
-            factual_score = 0
-            if has_numbers:
-                factual_score += 0.15
-            if has_quotes:
-                factual_score += 0.12
-            if has_dates:
-                factual_score += 0.10
-            if has_locations:
-                factual_score += 0.08
-            
-            score += min(factual_score, 0.3)  # Max 0.3 boost for factual content
-            
-            # Enhanced URL analysis
-            urls = self.patterns['urls'].findall(text)
-            if len(urls) > 0:
-                # Check if URLs are from credible sources
-                credible_url_count = 0
-                for url in urls:
-                    if any(credible in url.lower() for credible in self.credible_sources):
-                        credible_url_count += 1
-                
-                if credible_url_count > 0:
-                    score += min(credible_url_count * 0.15, 0.3)  # Boost for credible URLs
-                elif len(urls) > 5:  # Too many URLs might be spam
-                    score -= 0.15
-                else:
-                    score += 0.05  # Small boost for having sources
-            
-            # Enhanced current events and news language detection
-            news_language_patterns = [
-                'breaking news', 'developing story', 'latest updates', 'exclusive report',
-                'investigation reveals', 'sources confirm', 'officials announce',
-                'statement released', 'press briefing', 'live coverage',
-                'correspondent reports', 'newsroom', 'editorial board'
-            ]
-            
-            news_language_count = sum(1 for pattern in news_language_patterns if pattern in text_lower)
-            if news_language_count > 0:
-                score += min(news_language_count * 0.08, 0.2)  # Boost for news language
-            
-            # Check for balanced reporting indicators
-            balanced_indicators = [
-                'however', 'on the other hand', 'critics argue', 'supporters claim',
-                'both sides', 'different perspectives', 'varying opinions',
-                'while some', 'others believe', 'alternative view'
-            ]
-            
-            balance_count = sum(1 for indicator in balanced_indicators if indicator in text_lower)
-            if balance_count > 0:
-                score += min(balance_count * 0.06, 0.15)  # Reward balanced reporting
-            
-            # Penalty for emotional manipulation
-            emotional_manipulation = [
-                'you must', 'everyone should', 'never trust', 'always believe',
-                'only way', 'the truth is', 'wake up', 'open your eyes',
-                'they want', 'they control', 'hidden agenda', 'secret plan'
-            ]
-            
-            manipulation_count = sum(1 for pattern in emotional_manipulation if pattern in text_lower)
-            if manipulation_count > 0:
-                score -= min(manipulation_count * 0.12, 0.3)  # Strong penalty for manipulation
-            
-            # Check for specific current events relevance (2024-2025)
-            current_events_keywords = [
-                'ukraine', 'russia', 'gaza', 'israel', 'palestine', 'iran',
-                'artificial intelligence', 'ai technology', 'climate change',
-                'election', 'democracy', 'inflation', 'economy', 'covid',
-                'pandemic', 'vaccination', 'energy crisis', 'renewable energy'
-            ]
-            
-            current_events_count = sum(1 for keyword in current_events_keywords if keyword in text_lower)
-            if current_events_count >= 2:
-                score += 0.15  # Boost for relevant current events
-            elif current_events_count == 1:
-                score += 0.08  # Smaller boost for single keyword
-            
-            # Check for proper attribution and sourcing
-            attribution_quality = [
-                'according to', 'cited by', 'referenced in', 'documented by',
-                'verified by', 'confirmed by', 'reported in', 'published by'
-            ]
-            
-            attribution_count = sum(1 for attr in attribution_quality if attr in text_lower)
-            if attribution_count > 0:
-                score += min(attribution_count * 0.10, 0.25)  # Reward proper attribution
-                
-        except Exception as e:
-            logging.warning(f"⚠️ Content analysis error: {str(e)}")
-        
-        return max(0, min(1, score))
+        return self._score_rules('content', text, hits)
     
-    def _analyze_source_credibility(self, text):
+    def _analyze_source_credibility(self, text, hits=None):
         """Analyze source credibility indicators"""
-        score = 0.5  # Start neutral
-        text_lower = text.lower()
-        
+        return self._score_rules('source_credibility', text, hits)
+    
+    def _get_statistical_predictions(self, texts):
+        """Naive Bayes credibility of each text; neutral 0.5 without a trained artifact"""
+        statistical_model = self.statistical_model
+        if statistical_model is None:
+            return [0.5] * len(texts)
         try:
-            # Check for news organization mentions
-            news_orgs = [
-                'reuters', 'associated press', 'ap news', 'bbc', 'cnn', 'npr', 'pbs',
-                'new york times', 'washington post', 'wall street journal', 'guardian',
-                'times of israel', 'jerusalem post', 'haaretz', 'al jazeera', 'france24'
-            ]
-            
-            org_mentions = sum(1 for org in news_orgs if org in text_lower)
-            score += min(org_mentions * 0.1, 0.3)  # Max 0.3 boost
-            
-            # Check for official sources
-            official_sources = [
-                'government', 'ministry', 'department', 'official statement', 'press release',
-                'spokesperson', 'ambassador', 'diplomat', 'united nations', 'nato'
-            ]
-            
-            official_count = sum(1 for source in official_sources if source in text_lower)
-            score += min(official_count * 0.08, 0.2)  # Max 0.2 boost
-            
-            # Check for attribution
-            attribution_phrases = [
-                'according to', 'sources say', 'reported by', 'confirmed by',
-                'statement from', 'announced by', 'disclosed by'
-            ]
-            
-            attribution_count = sum(1 for phrase in attribution_phrases if phrase in text_lower)
-            score += min(attribution_count * 0.1, 0.2)  # Max 0.2 boost
-            
-            # Penalty for anonymous sources without context
-            if 'anonymous source' in text_lower and attribution_count == 0:
-                score -= 0.1
-                
+            return [float(score) for score in statistical_model.credibility(texts)]
         except Exception as e:
-            logging.warning(f"⚠️ Source analysis error: {str(e)}")
-        
-        return max(0, min(1, score))
+            logging.warning(f"⚠️ Statistical model error: {str(e)}")
+            return [0.5] * len(texts)
     
     def _get_ml_prediction(self, text):
         """Get machine learning model prediction"""
         try:
-            if not self.classifier:
+            if not self.inference_server:
                 return 0.5
             
-            result = self.classifier(text)
+            model_input = self.preprocessor.clean_for_model(text)
+            cache_key = (self.model_name, self.model_backend, text_key(model_input))
+            cached_score = self.cache.get('model', cache_key)
+            if cached_score is not None:
+                return cached_score
             
+            result = self.inference_server.predict(model_input, timeout=self.config.INFERENCE_TIMEOUT)
+            score = self._label_to_credibility(result)
+            self.cache.set('model', cache_key, score)
+            return score
+            
+        except Exception as e:
+            logging.warning(f"⚠️ ML prediction error: {str(e)}")
+            return 0.5
+
+    def _get_ml_predictions(self, texts):
+        """Get model predictions for several texts; they share batched forward passes"""
+        if not self.inference_server:
+            return [0.5] * len(texts)
+        
+        model_inputs = [self.preprocessor.clean_for_model(text) for text in texts]
+        cache_keys = [(self.model_name, self.model_backend, text_key(model_input)) for model_input in model_inputs]
+        scores = [self.cache.get('model', key) for key in cache_keys]
+        
+        # Only uncached inputs are sent to the model
+        missing = [index for index, score in enumerate(scores) if score is None]
+        futures = self.inference_server.submit_many([model_inputs[index] for index in missing])
+        for index, future in zip(missing, futures):
+            try:
+                scores[index] = self._label_to_credibility(future.result(timeout=self.config.INFERENCE_TIMEOUT))
+                self.cache.set('model', cache_keys[index], scores[index])
+            except Exception as e:
+                logging.warning(f"⚠️ ML prediction error: {str(e)}")
+                scores[index] = 0.5
+        return scores
+
+    def _label_to_credibility(self, result):
+        """Map a classifier output to a credibility score"""
+        try:
             # Handle different model outputs
             if isinstance(result, list) and len(result) > 0:
                 result = result[0]
@@ -904,41 +1228,26 @@ class FakeNewsDetector:
             return 0.5
             
         except Exception as e:
-            logging.warning(f"⚠️ ML prediction error: {str(e)}")
+            logging.warning(f"⚠️ ML output mapping error: {str(e)}")
             return 0.5
 
-    def _has_strong_fake_indicators(self, text):
+    def _has_strong_fake_indicators(self, text, hits=None):
         """Check for strong indicators of fake news"""
-        text_lower = text.lower()
-        
-        # Strong fake indicators
-        strong_fake_patterns = [
-            'you won\'t believe', 'doctors hate this', 'this one trick',
-            'mainstream media doesn\'t want', 'they don\'t want you to know',
-            'wake up sheeple', 'false flag', 'crisis actor', 'hoax',
-            'fake news media', 'deep state', 'conspiracy', 'cover up',
-            'click here now', 'share before deleted', 'going viral',
-            'must share immediately', 'breaking exclusive'
-        ]
-        
-        count = sum(1 for pattern in strong_fake_patterns if pattern in text_lower)
+        document = as_document(text)
+        if hits is None:
+            hits = document.scan(self.lexicon)
+        
+        count = hits.count('strong_fake_patterns')
         return count >= 2  # Multiple strong indicators
     
-    def _has_strong_real_indicators(self, text):
+    def _has_strong_real_indicators(self, text, hits=None):
         """Check for strong indicators of real news"""
-        text_lower = text.lower()
-        
-        # Strong real indicators
-        strong_real_patterns = [
-            'according to reuters', 'associated press reports', 'bbc news',
-            'government officials', 'press conference', 'official statement',
-            'published study', 'research shows', 'data indicates',
-            'spokesperson confirmed', 'investigation reveals',
-            'peer-reviewed', 'academic research', 'statistical analysis'
-        ]
+        document = as_document(text)
+        if hits is None:
+            hits = document.scan(self.lexicon)
         
         # Check for multiple credible sources
-        credible_sources_found = sum(1 for source in self.credible_sources if source in text_lower)
-        pattern_count = sum(1 for pattern in strong_real_patterns if pattern in text_lower)
+        credible_sources_found = hits.count('credible_sources')
+        pattern_count = hits.count('strong_real_patterns')
         
         return credible_sources_found >= 1 or pattern_count >= 2 
\ No newline at end of file
@@ -0,0 +1,149 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+
+class BatchingInferenceServer:
+    """
+    Dynamic micro-batching front end for a text classification pipeline.
+
+    Callers from any thread submit single texts and get a Future back. A
+    single worker thread owns the (non thread-safe) pipeline: it collects
+    pending requests until `batch_size` are queued or the max-wait deadline
+    passes, so a full batch runs at once, then also takes whatever else is
+    already queued, up to `window_batches` batches' worth, without waiting.
+
+    The collected window is bucketed by character length (a proxy for token
+    length that needs no extra tokenizer pass): texts up to 128 characters
+    share a bucket, longer ones are bucketed by power of two, so a text is
+    never padded to more than about twice its length. Each bucket runs as
+    forward passes of at most `batch_size` texts.
+    """
+
+    # Texts up to this many characters share the first length bucket
+    MIN_BUCKET_CHARS = 128
+
+    def __init__(self, classifier: Callable, batch_size: int = 16, max_wait_ms: float = 10.0,
+                 window_batches: int = 4, name: str = 'inference-worker'):
+        self.classifier = classifier
+        self.batch_size = max(1, int(batch_size))
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.window = self.batch_size * max(1, int(window_batches))
+
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {'requests': 0, 'batches': 0, 'errors': 0}
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue one text for classification"""
+        future = Future()
+        if self._closed.is_set():
+            future.set_exception(RuntimeError("Inference server is closed"))
+            return future
+        self._queue.put((text, future))
+        return future
+
+    def submit_many(self, texts: List[str]) -> List[Future]:
+        """Queue several texts at once; they are eligible for the same batch"""
+        return [self.submit(text) for text in texts]
+
+    def predict(self, text: str, timeout: Optional[float] = None):
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(text).result(timeout=timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Stop accepting work, finish queued requests and stop the worker"""
+        self._closed.set()
+        self._worker.join(timeout)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['avg_batch_size'] = stats['requests'] / stats['batches'] if stats['batches'] else 0.0
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
+
+    def _collect(self) -> list:
+        """
+        Block for the first request, gather more until a batch is full or the
+        deadline passes, then add what is already queued up to the window
+        """
+        while True:
+            try:
+                first = self._queue.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if self._closed.is_set():
+                    return []
+
+        pending = [first]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(pending) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    pending.append(self._queue.get_nowait())
+                else:
+                    pending.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                return pending
+
+        # Under load more requests are waiting; taking them now gives the buckets something to sort
+        while len(pending) < self.window:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return pending
+
+    def _buckets(self, pending: list) -> List[list]:
+        """Forward passes of at most batch_size texts, grouped by character-length bucket"""
+        buckets = {}
+        for item in sorted(pending, key=lambda item: len(item[0])):
+            buckets.setdefault(max(len(item[0]), self.MIN_BUCKET_CHARS).bit_length(), []).append(item)
+        return [
+            bucket[start:start + self.batch_size]
+            for bucket in buckets.values()
+            for start in range(0, len(bucket), self.batch_size)
+        ]
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            pending = self._collect()
+            if not pending:
+                continue
+
+            # Skip requests whose caller already gave up
+            pending = [item for item in pending if item[1].set_running_or_notify_cancel()]
+
+            for batch in self._buckets(pending):
+                self._run_batch(batch)
+
+    def _run_batch(self, batch: list):
+        texts = [text for text, _ in batch]
+        try:
+            outputs = self.classifier(texts, batch_size=len(texts))
+            if len(outputs) != len(texts):
+                raise RuntimeError(f"Classifier returned {len(outputs)} results for {len(texts)} inputs")
+        except Exception as e:
+            logging.warning(f"⚠️ Batched inference failed: {str(e)}")
+            with self._stats_lock:
+                self._stats['errors'] += len(batch)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        with self._stats_lock:
+            self._stats['requests'] += len(batch)
+            self._stats['batches'] += 1
+
+        for (_, future), output in zip(batch, outputs):
+            future.set_result(output)
@@ -0,0 +1,104 @@
+"""
+The hand-tuned rule stages (src/models/rules.py) as a sparse linear model.
+
+The features of a batch form a CSR matrix (documents x features) and the
+rule sets' weights a block-diagonal table (features x stages), so the stage
+scores of a batch are one sparse product followed by a NumPy clip.
+LinearRuleEngine.validate() compares the result with the detector's scoring
+methods on a corpus.
+
+Only that last step is vectorized: the features themselves (lexicon scan,
+regexes, VADER, textstat) are still computed per document in Python and
+dominate the cost, so a batch is not scored faster than the per-document
+path. The engine is opt-in (Config.LINEAR_RULE_ENGINE) and is mainly useful
+to inspect or refit the weight table as a matrix.
+
+The detector imports this module on the first batch it scores with the
+engine, so NumPy and SciPy stay out of processes that never do.
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from src.models.rules import RULE_SETS
+
+
+class LinearRuleEngine:
+    """
+    Scores batches of documents for the compiled stages. Stages without a
+    rule set (online_verification, the transformer) are not covered; see
+    `stages` for the ones that are.
+    """
+
+    def __init__(self, detector, stages: Optional[Sequence[str]] = None):
+        names = list(RULE_SETS) if stages is None else [name for name in stages if name in RULE_SETS]
+        self.detector = detector
+        self.rule_sets = [RULE_SETS[name] for name in names]
+        self.stages = names
+        self.reads_key_claims = any(rule_set.reads_key_claims for rule_set in self.rule_sets)
+
+        # One column per (stage, feature); the weight table is block diagonal
+        self.feature_names = []
+        self._columns = []
+        rows, cols, values = [], [], []
+        for stage_index, rule_set in enumerate(self.rule_sets):
+            columns = {}
+            for name, weight in rule_set.weights.items():
+                columns[name] = len(self.feature_names)
+                rows.append(len(self.feature_names))
+                cols.append(stage_index)
+                values.append(weight)
+                self.feature_names.append(f"{rule_set.stage}.{name}")
+            self._columns.append(columns)
+        self.weights = sparse.csc_matrix((values, (rows, cols)), shape=(len(self.feature_names), len(names)))
+        self.intercepts = np.array([rule_set.intercept for rule_set in self.rule_sets])
+
+    def featurize(self, documents: Sequence, key_claims: Optional[Sequence] = None) -> sparse.csr_matrix:
+        """
+        CSR feature matrix of AnalyzedDocuments (documents x feature_names).
+        `key_claims` (one list per document) reuses claims the caller already
+        extracted; otherwise they are extracted here when a stage reads them.
+        """
+        detector = self.detector
+        data: List[float] = []
+        indices: List[int] = []
+        indptr = [0]
+        for row, document in enumerate(documents):
+            hits = document.scan(detector.lexicon)
+            if not self.reads_key_claims:
+                claims = ()
+            elif key_claims is not None:
+                claims = key_claims[row]
+            else:
+                claims = detector._extract_key_claims(document)
+            for rule_set, columns in zip(self.rule_sets, self._columns):
+                for name, value in rule_set.feature_values(detector, document, hits, claims).items():
+                    indices.append(columns[name])
+                    data.append(value)
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.array(data, dtype=np.float64), indices, indptr),
+                                 shape=(len(documents), len(self.feature_names)))
+
+    def score_features(self, features: sparse.csr_matrix) -> np.ndarray:
+        """Stage scores (documents x stages): one sparse product, then a clip"""
+        scores = (features @ self.weights).toarray()
+        scores += self.intercepts
+        return np.clip(scores, 0.0, 1.0, out=scores)
+
+    def score(self, documents: Sequence, key_claims: Optional[Sequence] = None) -> np.ndarray:
+        return self.score_features(self.featurize(documents, key_claims))
+
+    def validate(self, documents: Sequence) -> Dict[str, float]:
+        """Largest absolute deviation per stage from the detector's scoring methods"""
+        from src.models.stages import INPUTS, STAGES, required_inputs
+
+        scores = self.score(documents)
+        deviations = {name: 0.0 for name in self.stages}
+        for row, document in enumerate(documents):
+            stages = [STAGES[name] for name in self.stages]
+            inputs = {name: INPUTS[name][1](self.detector, document) for name in required_inputs(stages)}
+            for column, stage in enumerate(stages):
+                expected = stage.compute(self.detector, document, inputs)
+                deviations[stage.name] = max(deviations[stage.name], float(abs(scores[row, column] - expected)))
+        return deviations
@@ -0,0 +1,94 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+# Detector owned by each worker process, built once by the initializer
+_worker_detector = None
+
+
+def _init_worker():
+    global _worker_detector
+    from src.models.fake_news_detector import FakeNewsDetector
+    _worker_detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+    # Spawned workers share nothing with the parent: seed this worker's lemma cache from the table now
+    _worker_detector.preprocessor.warm()
+    # Latencies are reported back to the parent, which owns the histograms
+    _worker_detector.metrics.enabled = False
+
+
+def _compute_signals(text: str, stages: Optional[Tuple[str, ...]] = None) -> Tuple[Dict, Dict[str, float]]:
+    timings = {}
+    signals = _worker_detector.compute_signals(text, timings, stages=stages)
+    return signals, timings
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class RuleAnalysisPool:
+    """
+    Pool of warm worker processes that run the CPU-bound rule analyzers.
+
+    Each worker builds its own rules-only FakeNewsDetector (KMPMatcher,
+    TextPreprocessor, lexicon scanner, VADER) once at startup. Only the
+    text goes in and only the compact signal dict plus stage timings come
+    back, so request threads in the parent are no longer serialised by
+    the GIL while the analyzers run.
+    """
+
+    def __init__(self, workers: Optional[int] = None, start_method: str = 'spawn', warm: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            self.workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker
+        )
+        self._stats_lock = threading.Lock()
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+
+        if warm:
+            self.warm()
+
+    def warm(self):
+        """Start every worker now instead of on the first requests"""
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+    def submit(self, text: str, stages: Optional[Tuple[str, ...]] = None) -> Future:
+        """Analyze one text with the named rule stages (default: the worker's default profile)"""
+        with self._stats_lock:
+            self._stats['submitted'] += 1
+        future = self._executor.submit(_compute_signals, text, stages)
+        future.add_done_callback(self._record)
+        return future
+
+    def analyze(self, text: str, timeout: Optional[float] = None,
+                stages: Optional[Tuple[str, ...]] = None) -> Tuple[Dict, Dict[str, float]]:
+        """Blocking convenience wrapper around submit()"""
+        return self.submit(text, stages).result(timeout=timeout)
+
+    def _record(self, future: Future):
+        with self._stats_lock:
+            if future.cancelled():
+                self._stats['cancelled'] += 1
+            elif future.exception() is None:
+                self._stats['completed'] += 1
+            else:
+                self._stats['failed'] += 1
+
+    def close(self):
+        try:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        except Exception as e:
+            logging.warning(f"⚠️ Error shutting down rule analysis pool: {str(e)}")
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['workers'] = self.workers
+        stats['in_flight'] = stats['submitted'] - stats['completed'] - stats['failed'] - stats['cancelled']
+        return stats
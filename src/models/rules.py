@@ -0,0 +1,335 @@
+"""
+The hand-tuned rule stages as feature functions and weight tables.
+
+Each rule adds a fixed amount to a neutral 0.5 when a condition holds, or a
+fixed amount per occurrence up to a cap. Both forms are one feature each:
+
+    if count > 0: score += w                ->  feature 1.0,   weight w
+    score += min(count * |w|, cap)          ->  feature count, weight w, cap
+
+and a stage score is clip(0.5 + sum(feature * weight), 0, 1). Mutually
+exclusive `elif` branches are separate indicator features; the few
+conditions that are not linear in any count, like the capped sum of
+factual-detail rewards, are computed inside their feature.
+
+These tables are the only copy of the rules: FakeNewsDetector's
+_analyze_* and _verify_* methods score documents with RuleSet.score(), and
+the sparse LinearRuleEngine (src/models/rule_engine.py) builds its weight
+matrix from the same tables. Unlike the engine, this module needs no NumPy.
+"""
+from typing import Callable, Dict, Optional
+
+
+class RuleSet:
+    """
+    Weight table of one stage. features(detector, document, hits, key_claims)
+    returns the raw feature values by name; `caps` bounds the contribution
+    of per-occurrence features (in score units).
+    """
+
+    def __init__(self, stage: str, weights: Dict[str, float], features: Callable,
+                 caps: Optional[Dict[str, float]] = None, intercept: float = 0.5,
+                 reads_key_claims: bool = False):
+        self.stage = stage
+        self.weights = weights
+        self.features = features
+        self.caps = caps or {}
+        self.intercept = intercept
+        self.reads_key_claims = reads_key_claims
+        # Largest feature value of each capped feature
+        self._limits = {name: cap / abs(weights[name]) for name, cap in self.caps.items()}
+
+    def feature_values(self, detector, document, hits, key_claims=()) -> Dict[str, float]:
+        """Non-zero feature values of a document, caps applied"""
+        values = self.features(detector, document, hits, key_claims)
+        for name, limit in self._limits.items():
+            value = values.get(name)
+            if value:
+                values[name] = min(value, limit)
+        return {name: value for name, value in values.items() if value}
+
+    def score(self, detector, document, hits, key_claims=()) -> float:
+        """Stage score in [0, 1]"""
+        score = self.intercept
+        for name, value in self.feature_values(detector, document, hits, key_claims).items():
+            score += self.weights[name] * value
+        return max(0.0, min(1.0, score))
+
+
+def _google_search_features(detector, document, hits, key_claims):
+    features = {}
+    if hits.count('verifiable_events') > 0:
+        features['verifiable_events'] = 1.0
+    if any(claim.isdigit() and len(claim) == 4 and 2020 <= int(claim) <= 2025 for claim in key_claims):
+        features['recent_year'] = 1.0
+    if hits.count('sensational_claims') > 0:
+        features['sensational_claims'] = 1.0
+    return features
+
+
+def _fact_checkers_features(detector, document, hits, key_claims):
+    features = {}
+    if hits.count('debunked_claims') > 0:
+        features['debunked_claims'] = 1.0
+    if hits.count('fact_check_language') > 0:
+        features['fact_check_language'] = 1.0
+    return features
+
+
+def _ai_analysis_features(detector, document, hits, key_claims):
+    features = {}
+    has_intro = hits.any_within('intro_phrases', 0, 200)
+    has_conclusion = hits.any_within('conclusion_phrases', -200)
+    if has_intro and has_conclusion:
+        features['intro_and_conclusion'] = 1.0
+    elif has_intro or has_conclusion:
+        features['intro_or_conclusion'] = 1.0
+    features['attribution_patterns'] = hits.count('attribution_patterns')
+    if hits.count('manipulation_patterns') > 0:
+        features['manipulation_patterns'] = 1.0
+    if hits.count('conspiracy_indicators') > 0:
+        features['conspiracy_indicators'] = 1.0
+    features['journalism_indicators'] = hits.count('journalism_indicators')
+    return features
+
+
+def _source_credibility_features(detector, document, hits, key_claims):
+    attribution_count = hits.count('attribution_phrases')
+    features = {
+        'news_organizations': hits.count('news_organizations'),
+        'official_sources': hits.count('official_sources'),
+        'attribution_phrases': attribution_count
+    }
+    if hits.count('anonymous_sources') > 0 and attribution_count == 0:
+        features['unattributed_anonymous_sources'] = 1.0
+    return features
+
+
+# Reward for each kind of specific detail (content stage, feature factual_details)
+FACTUAL_DETAIL_REWARDS = {'numbers': 0.15, 'quotes': 0.12, 'dates': 0.10, 'locations': 0.08}
+
+
+def _content_features(detector, document, hits, key_claims):
+    patterns = detector.patterns
+    features = {
+        'trusted_indicators': hits.count('trusted_indicators'),
+        'fake_indicators': hits.count('fake_indicators'),
+        'sensational_words': document.count(patterns['sensational']),
+        'news_language_patterns': hits.count('news_language_patterns'),
+        'balanced_indicators': hits.count('balanced_indicators'),
+        'emotional_manipulation': hits.count('emotional_manipulation'),
+        'attribution_quality': hits.count('attribution_quality')
+    }
+
+    # Saturating reward for specific details: the cap applies to the sum, so it is one feature
+    features['factual_details'] = sum(
+        reward for pattern, reward in FACTUAL_DETAIL_REWARDS.items() if document.search(patterns[pattern])
+    )
+
+    urls = document.findall(patterns['urls'])
+    if urls:
+        credible_url_count = sum(
+            1 for url in urls if any(credible in url.lower() for credible in detector.credible_sources)
+        )
+        if credible_url_count > 0:
+            features['credible_urls'] = credible_url_count
+        elif len(urls) > 5:
+            features['many_urls'] = 1.0
+        else:
+            features['some_urls'] = 1.0
+
+    current_events_count = hits.count('current_events_keywords')
+    if current_events_count >= 2:
+        features['current_events_several'] = 1.0
+    elif current_events_count == 1:
+        features['current_events_one'] = 1.0
+    return features
+
+
+def _linguistic_features(detector, document, hits, key_claims):
+    patterns = detector.patterns
+    features = {}
+
+    word_count = document.word_count
+    if 100 <= word_count <= 800:  # Optimal length for news articles
+        features['length_optimal'] = 1.0
+    elif 50 <= word_count < 100:  # Short but acceptable
+        features['length_short'] = 1.0
+    elif word_count < 30:  # Too short, likely incomplete or clickbait
+        features['length_too_short'] = 1.0
+    elif word_count > 1200:  # Very long, might be spam or poorly structured
+        features['length_too_long'] = 1.0
+
+    try:
+        from textstat import flesch_reading_ease
+        reading_ease = flesch_reading_ease(document.text)
+        if 40 <= reading_ease <= 80:  # Good readability for news
+            features['readability_good'] = 1.0
+        elif 20 <= reading_ease < 40:  # Acceptable complexity
+            features['readability_complex'] = 1.0
+        elif reading_ease < 10:  # Too complex, might be academic or fake
+            features['readability_too_complex'] = 1.0
+        elif reading_ease > 90:  # Too simple, might be clickbait
+            features['readability_too_simple'] = 1.0
+    except Exception:
+        pass
+
+    caps_ratio = document.uppercase_count / max(len(document), 1)
+    if caps_ratio > 0.25:  # Excessive capitalization (fake news indicator)
+        features['caps_excessive'] = 1.0
+    elif caps_ratio > 0.15:
+        features['caps_high'] = 1.0
+    elif 0.08 <= caps_ratio <= 0.12:
+        features['caps_normal'] = 1.0
+    elif caps_ratio < 0.05:
+        features['caps_low'] = 1.0
+
+    exclamation_count = document.count(patterns['exclamation'])
+    if exclamation_count > 5:
+        features['exclamations_excessive'] = 1.0
+    elif exclamation_count > 2:
+        features['exclamations_many'] = 1.0
+    elif exclamation_count == 0 and word_count > 100:
+        features['exclamations_none'] = 1.0
+
+    question_count = document.count(patterns['question'])
+    if question_count > 3:  # Too many questions (clickbait indicator)
+        features['questions_many'] = 1.0
+    elif question_count == 1 and word_count > 50:
+        features['question_single'] = 1.0
+
+    sentiment_analyzer = detector.sentiment_analyzer
+    if sentiment_analyzer is not None:
+        sentiment = sentiment_analyzer.polarity_scores(document.text)
+        compound = abs(sentiment['compound'])
+        # News should generally be neutral to slightly negative
+        if compound <= 0.2:
+            features['sentiment_neutral'] = 1.0
+        elif compound <= 0.4:
+            features['sentiment_moderate'] = 1.0
+        elif compound > 0.8:
+            features['sentiment_extreme'] = 1.0
+        elif compound > 0.6:
+            features['sentiment_high'] = 1.0
+
+        if sentiment['neu'] > 0.7:
+            features['tone_neutral'] = 1.0
+        elif sentiment['pos'] > 0.6 or sentiment['neg'] > 0.6:
+            features['tone_emotional'] = 1.0
+
+    sentence_count = document.sentence_count
+    if sentence_count > 0:
+        avg_sentence_length = word_count / sentence_count
+        if 15 <= avg_sentence_length <= 25:
+            features['sentences_good'] = 1.0
+        elif avg_sentence_length < 10:
+            features['sentences_short'] = 1.0
+        elif avg_sentence_length > 35:
+            features['sentences_long'] = 1.0
+
+    features['professional_indicators'] = hits.count('professional_indicators')
+    features['informal_indicators'] = hits.count('informal_indicators')
+    return features
+
+
+RULE_SETS: Dict[str, RuleSet] = {}
+
+
+def register_rule_set(rule_set: RuleSet) -> RuleSet:
+    RULE_SETS[rule_set.stage] = rule_set
+    return rule_set
+
+
+register_rule_set(RuleSet('google_search', {
+    'verifiable_events': 0.3,
+    'recent_year': 0.2,
+    'sensational_claims': -0.4
+}, _google_search_features, reads_key_claims=True))
+
+register_rule_set(RuleSet('fact_checkers', {
+    'debunked_claims': -0.6,
+    'fact_check_language': 0.4
+}, _fact_checkers_features))
+
+register_rule_set(RuleSet('ai_analysis', {
+    'intro_and_conclusion': 0.2,
+    'intro_or_conclusion': 0.1,
+    'attribution_patterns': 0.15,
+    'manipulation_patterns': -0.5,
+    'conspiracy_indicators': -0.6,
+    'journalism_indicators': 0.1
+}, _ai_analysis_features, caps={
+    'attribution_patterns': 0.3,
+    'journalism_indicators': 0.25
+}))
+
+register_rule_set(RuleSet('source_credibility', {
+    'news_organizations': 0.1,
+    'official_sources': 0.08,
+    'attribution_phrases': 0.1,
+    'unattributed_anonymous_sources': -0.1
+}, _source_credibility_features, caps={
+    'news_organizations': 0.3,
+    'official_sources': 0.2,
+    'attribution_phrases': 0.2
+}))
+
+register_rule_set(RuleSet('content', {
+    'trusted_indicators': 0.12,
+    'fake_indicators': -0.15,
+    'sensational_words': -0.08,
+    'factual_details': 1.0,
+    'credible_urls': 0.15,
+    'many_urls': -0.15,
+    'some_urls': 0.05,
+    'news_language_patterns': 0.08,
+    'balanced_indicators': 0.06,
+    'emotional_manipulation': -0.12,
+    'current_events_several': 0.15,
+    'current_events_one': 0.08,
+    'attribution_quality': 0.10
+}, _content_features, caps={
+    'trusted_indicators': 0.35,
+    'fake_indicators': 0.45,
+    'sensational_words': 0.25,
+    'factual_details': 0.3,
+    'credible_urls': 0.3,
+    'news_language_patterns': 0.2,
+    'balanced_indicators': 0.15,
+    'emotional_manipulation': 0.3,
+    'attribution_quality': 0.25
+}))
+
+register_rule_set(RuleSet('linguistic', {
+    'length_optimal': 0.15,
+    'length_short': 0.08,
+    'length_too_short': -0.20,
+    'length_too_long': -0.15,
+    'readability_good': 0.12,
+    'readability_complex': 0.06,
+    'readability_too_complex': -0.08,
+    'readability_too_simple': -0.15,
+    'caps_excessive': -0.25,
+    'caps_high': -0.12,
+    'caps_normal': 0.12,
+    'caps_low': -0.08,
+    'exclamations_excessive': -0.20,
+    'exclamations_many': -0.10,
+    'exclamations_none': 0.08,
+    'questions_many': -0.15,
+    'question_single': 0.05,
+    'sentiment_neutral': 0.15,
+    'sentiment_moderate': 0.08,
+    'sentiment_extreme': -0.20,
+    'sentiment_high': -0.10,
+    'tone_neutral': 0.10,
+    'tone_emotional': -0.12,
+    'sentences_good': 0.08,
+    'sentences_short': -0.05,
+    'sentences_long': -0.08,
+    'professional_indicators': 0.06,
+    'informal_indicators': -0.08
+}, _linguistic_features, caps={
+    'professional_indicators': 0.15,
+    'informal_indicators': 0.20
+}))
@@ -0,0 +1,135 @@
+"""
+Registry of the signals FakeNewsDetector.predict can combine.
+
+Every Stage declares the shared inputs it reads, its weight in the
+verification score, a cost tier and where it runs. Rule stages run
+wherever rule analysis runs (request thread or worker process); stages
+with in_parent=True (the transformer) always run in the serving process,
+next to the inference server. A profile selects stages by name: only the
+inputs and stages of the selected profile are computed, and the weights of
+the selected stages are renormalised to sum to one.
+
+Measured cost comes from the per-stage latency histograms, which are
+recorded under the stage names (see describe_stages()).
+"""
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+COST_TIERS = ('cheap', 'moderate', 'expensive')
+
+
+class Stage:
+    """One weighted signal: compute(detector, document, inputs) -> score in [0, 1]"""
+
+    def __init__(self, name: str, weight: float, compute: Callable, inputs: Sequence[str] = (),
+                 cost: str = 'cheap', result_key: Optional[str] = None, in_parent: bool = False,
+                 compute_batch: Optional[Callable] = None):
+        if cost not in COST_TIERS:
+            raise ValueError(f"Unknown cost tier '{cost}'")
+        self.name = name
+        self.weight = weight
+        self.compute = compute
+        self.inputs = tuple(inputs)
+        self.cost = cost
+        self.result_key = result_key or f"{name}_score"
+        self.in_parent = in_parent
+        # Optional compute_batch(detector, documents) -> scores, used when a batch is scored together
+        self.compute_batch = compute_batch
+
+
+# Shared inputs: name -> (timer stage, builder). Built once per request, only if a selected stage reads them
+INPUTS = {
+    'key_claims': ('extract_claims', lambda detector, document: detector._extract_key_claims(document)),
+    'hits': ('lexicon_scan', lambda detector, document: document.scan(detector.lexicon))
+}
+
+STAGES: Dict[str, Stage] = {}
+
+
+def register_stage(stage: Stage) -> Stage:
+    for name in stage.inputs:
+        if name not in INPUTS:
+            raise ValueError(f"Stage '{stage.name}' reads unknown input '{name}'")
+    STAGES[stage.name] = stage
+    return stage
+
+
+register_stage(Stage(
+    'google_search', 0.35, lambda d, doc, inputs: d._verify_with_google_search(inputs['key_claims'], doc, inputs['hits']),
+    inputs=('key_claims', 'hits')
+))
+register_stage(Stage(
+    'fact_checkers', 0.30, lambda d, doc, inputs: d._verify_with_fact_checkers((), doc, inputs['hits']),
+    inputs=('hits',), result_key='fact_check_score'
+))
+register_stage(Stage(
+    'ai_analysis', 0.20, lambda d, doc, inputs: d._analyze_with_ai_patterns(doc, inputs['hits']),
+    inputs=('hits',)
+))
+register_stage(Stage(
+    'source_credibility', 0.15, lambda d, doc, inputs: d._analyze_source_credibility(doc, inputs['hits']),
+    inputs=('hits',)
+))
+register_stage(Stage(
+    'linguistic', 0.10, lambda d, doc, inputs: d._analyze_linguistic_features(doc, inputs['hits']),
+    inputs=('hits',), cost='moderate'
+))
+register_stage(Stage(
+    'content', 0.15, lambda d, doc, inputs: d._analyze_content_features(doc, inputs['hits']),
+    inputs=('hits',), cost='moderate'
+))
+register_stage(Stage(
+    'online_verification', 0.10, lambda d, doc, inputs: d._verify_online(doc),
+    cost='moderate'
+))
+register_stage(Stage(
+    'statistical', 0.25, lambda d, doc, inputs: d._get_statistical_predictions([doc.text])[0],
+    cost='cheap', compute_batch=lambda d, docs: d._get_statistical_predictions([doc.text for doc in docs])
+))
+register_stage(Stage(
+    'model', 0.25, lambda d, doc, inputs: d._get_ml_prediction(doc.text),
+    cost='expensive', in_parent=True
+))
+
+PROFILES: Dict[str, Tuple[str, ...]] = {
+    # Lexicon-only signals; no key-claim extraction
+    'fast': ('fact_checkers', 'ai_analysis', 'source_credibility'),
+    # The default four-signal verification score
+    'balanced': ('google_search', 'fact_checkers', 'ai_analysis', 'source_credibility'),
+    # The default signals plus the naive Bayes classifier (see src/models/statistical.py)
+    'statistical': ('google_search', 'fact_checkers', 'ai_analysis', 'source_credibility', 'statistical'),
+    # Every rule signal and the transformer
+    'full': ('google_search', 'fact_checkers', 'ai_analysis', 'source_credibility',
+             'linguistic', 'content', 'online_verification', 'model')
+}
+
+
+def resolve_profile(profile: str) -> List[Stage]:
+    """Stages of a profile, in registry order; ValueError for unknown names"""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown profile '{profile}' (expected one of: {', '.join(PROFILES)})")
+    return [STAGES[name] for name in PROFILES[profile]]
+
+
+def required_inputs(stages: Sequence[Stage]) -> List[str]:
+    """Inputs read by any of the stages, in INPUTS order"""
+    needed = {name for stage in stages for name in stage.inputs}
+    return [name for name in INPUTS if name in needed]
+
+
+def describe_stages(latency_summary: Optional[Dict[str, Dict]] = None) -> Dict:
+    """Stages with their declared and measured cost, plus the profiles"""
+    latency_summary = latency_summary or {}
+    return {
+        'stages': {
+            name: {
+                'weight': stage.weight,
+                'inputs': list(stage.inputs),
+                'cost': stage.cost,
+                'runs_in': 'parent' if stage.in_parent else 'rules',
+                'measured_mean_ms': latency_summary.get(name, {}).get('mean_ms'),
+                'measured_p99_ms': latency_summary.get(name, {}).get('p99_ms')
+            }
+            for name, stage in STAGES.items()
+        },
+        'profiles': {name: list(stages) for name, stages in PROFILES.items()}
+    }
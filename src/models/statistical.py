@@ -0,0 +1,307 @@
+"""
+Statistical classifier tier: bag-of-words features and multinomial naive Bayes.
+
+Two feature extractors are supported:
+
+- 'hashing' (default): HashingVectorizer term counts. There is no
+  vocabulary, so memory is bounded by n_features regardless of corpus size,
+  and training streams over the corpus with MultinomialNB.partial_fit.
+- 'tfidf': TfidfVectorizer over a learned vocabulary. The training texts are
+  held in memory and the vocabulary is stored with the model.
+
+A trained model is saved as a directory artifact: plain .npy arrays (class
+log priors, per-class feature log probabilities and the raw counts that
+later incremental updates continue from) plus a model.json manifest. The
+arrays are loaded with mmap_mode='r', so worker processes share the same
+pages and nothing is unpickled. Array files carry the artifact id in their
+name and the manifest is replaced last, so a reader never sees a mix of two
+versions. Inference is one sparse product: log P(c|x) ~ x . log P(w|c) + log P(c).
+The log-probability table is stored features-major (n_features x classes)
+as float64, so the product reads the mapped file in place; a transposed or
+float32 table would be copied on every call.
+"""
+import json
+import logging
+import os
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MANIFEST_FILE = 'model.json'
+FORMAT_VERSION = 1
+VECTORIZERS = ('hashing', 'tfidf')
+ARRAYS = ('class_log_prior', 'feature_log_prob', 'class_count', 'feature_count')
+
+
+def _build_vectorizer(manifest: Dict, vocabulary: Optional[Dict[str, int]] = None):
+    params = manifest['vectorizer_params']
+    ngram_range = tuple(params['ngram_range'])
+    if manifest['vectorizer'] == 'hashing':
+        from sklearn.feature_extraction.text import HashingVectorizer
+        # Naive Bayes needs non-negative features: no sign flipping, raw counts
+        return HashingVectorizer(n_features=params['n_features'], ngram_range=ngram_range,
+                                 alternate_sign=False, norm=None)
+    from sklearn.feature_extraction.text import CountVectorizer
+    return CountVectorizer(ngram_range=ngram_range, vocabulary=vocabulary)
+
+
+class StatisticalClassifier:
+    """A trained naive Bayes model; `arrays` may be memory-mapped"""
+
+    def __init__(self, manifest: Dict, arrays: Dict[str, np.ndarray], vocabulary: Optional[Dict[str, int]] = None,
+                 idf: Optional[np.ndarray] = None):
+        if manifest['vectorizer'] not in VECTORIZERS:
+            raise ValueError(f"Unknown vectorizer '{manifest['vectorizer']}'")
+        self.manifest = manifest
+        self.arrays = arrays
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.classes = list(manifest['classes'])
+        self.credible_index = self.classes.index(manifest['credible_label'])
+        self._vectorizer = _build_vectorizer(manifest, vocabulary)
+
+    @property
+    def model_id(self) -> str:
+        return self.manifest.get('artifact_id', 'unsaved')
+
+    @property
+    def n_features(self) -> int:
+        return self.arrays['feature_log_prob'].shape[0]
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'StatisticalClassifier':
+        """Load an artifact directory written by save()"""
+        mmap_mode = 'r' if mmap else None
+        for attempt in range(2):
+            with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('format_version') != FORMAT_VERSION:
+                raise ValueError(f"Unsupported statistical model format: {manifest.get('format_version')}")
+            files = manifest['files']
+            try:
+                arrays = {name: np.load(os.path.join(path, files[name]), mmap_mode=mmap_mode) for name in ARRAYS}
+                idf = vocabulary = None
+                if manifest['vectorizer'] == 'tfidf':
+                    idf = np.load(os.path.join(path, files['idf']), mmap_mode=mmap_mode)
+                    with open(os.path.join(path, files['vocabulary']), encoding='utf-8') as f:
+                        vocabulary = json.load(f)
+                return cls(manifest, arrays, vocabulary, idf)
+            except FileNotFoundError:
+                # A newer version replaced the manifest between our two reads; read it again
+                if attempt:
+                    raise
+
+    def save(self, path: str) -> str:
+        """
+        Write the artifact into `path` and return its id. Existing readers
+        keep their mappings; files of replaced versions are removed.
+        """
+        os.makedirs(path, exist_ok=True)
+        artifact_id = uuid.uuid4().hex[:12]
+        files = {}
+        to_write = dict(self.arrays)
+        if self.idf is not None:
+            to_write['idf'] = self.idf
+        for name, array in to_write.items():
+            files[name] = f"{name}.{artifact_id}.npy"
+            temp_path = os.path.join(path, files[name] + '.tmp')
+            with open(temp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(temp_path, os.path.join(path, files[name]))
+        if self.vocabulary is not None:
+            files['vocabulary'] = f"vocabulary.{artifact_id}.json"
+            with open(os.path.join(path, files['vocabulary']), 'w', encoding='utf-8') as f:
+                json.dump(self.vocabulary, f)
+
+        manifest = dict(self.manifest, artifact_id=artifact_id, files=files,
+                        saved_at=datetime.now().isoformat())
+        temp_path = os.path.join(path, MANIFEST_FILE + '.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_path, os.path.join(path, MANIFEST_FILE))
+        self.manifest = manifest
+
+        # Old versions are unreferenced now; open memory maps of them stay valid after unlinking
+        referenced = set(files.values()) | {MANIFEST_FILE}
+        for entry in os.listdir(path):
+            if entry not in referenced and (entry.endswith('.npy') or entry.startswith('vocabulary.')):
+                try:
+                    os.remove(os.path.join(path, entry))
+                except OSError:
+                    pass
+        return artifact_id
+
+    def updated(self, texts: Sequence[str], labels: Sequence[object]) -> 'StatisticalClassifier':
+        """
+        A new classifier with the labeled examples added through
+        MultinomialNB.partial_fit on copies of the stored counts. This one
+        (and any memory maps it holds) is untouched and keeps serving while
+        the update runs. Only hashed models can be updated in place of a
+        retrain; a TF-IDF vocabulary and idf are fixed at training time.
+        """
+        from sklearn.naive_bayes import MultinomialNB
+
+        if self.manifest['vectorizer'] != 'hashing':
+            raise ValueError("Only hashing-vectorizer models can be updated incrementally; retrain TF-IDF models")
+        labels = [str(label).strip().lower() for label in labels]
+        unknown = sorted(set(labels) - set(self.classes))
+        if unknown:
+            raise ValueError(f"Unknown labels {unknown} (expected one of: {', '.join(self.classes)})")
+        if len(labels) != len(texts):
+            raise ValueError("Expected one label per text")
+        if not texts:
+            return self
+
+        model = MultinomialNB(alpha=self.manifest['alpha'])
+        model.classes_ = np.array(self.classes)
+        model.class_count_ = np.array(self.arrays['class_count'], dtype=np.float64)
+        model.feature_count_ = np.array(self.arrays['feature_count'], dtype=np.float64)
+        model.n_features_in_ = self.n_features
+        model.partial_fit(self.transform(texts), labels)
+
+        manifest = dict(self.manifest, artifact_id=uuid.uuid4().hex[:12],
+                        updates=self.manifest.get('updates', 0) + 1,
+                        updated_examples=self.manifest.get('updated_examples', 0) + len(texts),
+                        updated_at=datetime.now().isoformat())
+        return StatisticalClassifier(manifest, _naive_bayes_arrays(model))
+
+    def transform(self, texts: Sequence[str]):
+        """Sparse (CSR) feature matrix of a batch"""
+        features = self._vectorizer.transform(texts)
+        if self.idf is not None:
+            from sklearn.preprocessing import normalize
+            features = features.tocsr().astype(np.float64)
+            features.data *= self.idf[features.indices]
+            features = normalize(features, norm='l2', copy=False)
+        return features
+
+    def predict_log_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """Log posterior per class (texts x classes)"""
+        joint = self.transform(texts) @ self.arrays['feature_log_prob']
+        joint = np.asarray(joint) + self.arrays['class_log_prior']
+        return joint - np.logaddexp.reduce(joint, axis=1, keepdims=True)
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        return np.exp(self.predict_log_proba(texts))
+
+    def credibility(self, texts: Sequence[str]) -> np.ndarray:
+        """Probability of the credible label for every text"""
+        return self.predict_proba(texts)[:, self.credible_index]
+
+    def predict(self, texts: Sequence[str]) -> List[str]:
+        return [self.classes[index] for index in self.predict_log_proba(texts).argmax(axis=1)]
+
+
+def _naive_bayes_arrays(model) -> Dict[str, np.ndarray]:
+    return {
+        'class_log_prior': model.class_log_prior_.astype(np.float64),
+        'feature_log_prob': np.ascontiguousarray(model.feature_log_prob_.T, dtype=np.float64),
+        'class_count': model.class_count_.astype(np.float64),
+        'feature_count': model.feature_count_.astype(np.float64)
+    }
+
+
+def train(records: Iterable[Tuple[str, object]], vectorizer: str = 'hashing', labels: Sequence[str] = ('fake', 'real'),
+          credible_label: str = 'real', n_features: int = 2 ** 18, ngram_range: Tuple[int, int] = (1, 2),
+          alpha: float = 0.1, chunk_size: int = 5000, holdout: float = 0.1,
+          max_holdout: int = 20000) -> Tuple[StatisticalClassifier, Dict]:
+    """
+    Train on (text, label) pairs. Labels are compared as lowercased strings;
+    records with other labels or without text are skipped. Every
+    round(1 / holdout)-th usable record (at most max_holdout) is held out
+    for the accuracy reported in the returned metrics.
+    """
+    from sklearn.naive_bayes import MultinomialNB
+
+    if vectorizer not in VECTORIZERS:
+        raise ValueError(f"Unknown vectorizer '{vectorizer}' (expected one of: {', '.join(VECTORIZERS)})")
+    labels = [str(label).lower() for label in labels]
+    if credible_label not in labels:
+        raise ValueError(f"Credible label '{credible_label}' is not one of the labels {labels}")
+
+    holdout_every = round(1 / holdout) if holdout else 0
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'vectorizer': vectorizer,
+        'vectorizer_params': {'n_features': n_features, 'ngram_range': list(ngram_range)},
+        'alpha': alpha,
+        'classes': sorted(labels),
+        'credible_label': credible_label,
+        'trained_at': datetime.now().isoformat()
+    }
+    model = MultinomialNB(alpha=alpha)
+    held_texts, held_labels = [], []
+    skipped = 0
+    used = 0
+
+    def usable():
+        nonlocal skipped, used
+        for text, label in records:
+            label = str(label).strip().lower() if label is not None else None
+            if not isinstance(text, str) or not text.strip() or label not in labels:
+                skipped += 1
+                continue
+            used += 1
+            if holdout_every and used % holdout_every == 0 and len(held_texts) < max_holdout:
+                held_texts.append(text)
+                held_labels.append(label)
+                continue
+            yield text, label
+
+    vocabulary = idf = None
+    if vectorizer == 'hashing':
+        classifier_vectorizer = _build_vectorizer(manifest)
+        chunk_texts, chunk_labels = [], []
+        trained = 0
+
+        def fit_chunk():
+            model.partial_fit(classifier_vectorizer.transform(chunk_texts), chunk_labels, classes=manifest['classes'])
+
+        for text, label in usable():
+            chunk_texts.append(text)
+            chunk_labels.append(label)
+            if len(chunk_texts) >= chunk_size:
+                fit_chunk()
+                trained += len(chunk_texts)
+                chunk_texts, chunk_labels = [], []
+        if chunk_texts:
+            fit_chunk()
+            trained += len(chunk_texts)
+    else:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        pairs = list(usable())
+        trained = len(pairs)
+        if pairs:
+            tfidf = TfidfVectorizer(ngram_range=ngram_range, max_features=n_features)
+            model.fit(tfidf.fit_transform([text for text, _ in pairs]), [label for _, label in pairs])
+            vocabulary = {term: int(index) for term, index in tfidf.vocabulary_.items()}
+            idf = tfidf.idf_.astype(np.float64)
+            manifest['vectorizer_params']['n_features'] = len(vocabulary)
+
+    if not trained:
+        raise ValueError("No usable training records")
+    # partial_fit and fit both order classes_ like the sorted label list
+    manifest['classes'] = [str(label) for label in model.classes_]
+
+    classifier = StatisticalClassifier(manifest, _naive_bayes_arrays(model), vocabulary, idf)
+    metrics = {'trained': trained, 'holdout': len(held_texts), 'skipped': skipped}
+    if held_texts:
+        predicted = classifier.predict(held_texts)
+        metrics['holdout_accuracy'] = sum(p == l for p, l in zip(predicted, held_labels)) / len(held_labels)
+    classifier.manifest['metrics'] = metrics
+    return classifier, metrics
+
+
+def load_if_present(path: Optional[str]) -> Optional[StatisticalClassifier]:
+    """The artifact in `path`, or None (with a log line) if there is none or it cannot be read"""
+    if not path or not os.path.exists(os.path.join(path, MANIFEST_FILE)):
+        return None
+    try:
+        classifier = StatisticalClassifier.load(path)
+        logging.info(f"✅ Loaded statistical model {classifier.model_id} from {path}")
+        return classifier
+    except Exception as e:
+        logging.warning(f"⚠️ Could not load statistical model from {path}: {str(e)}")
+        return None
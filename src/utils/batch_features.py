@@ -0,0 +1,174 @@
+"""
+Columnar, vectorized version of TextPreprocessor.extract_features.
+
+A chunk of texts is joined and encoded once as UTF-32, so the buffer holds
+exactly one code point per character and character offsets are array
+offsets; chunks that are pure ASCII use a one-byte buffer instead.
+Character classes come from range checks (ASCII) and one Python check per
+distinct non-ASCII code point in the chunk, and per-document counts are
+segment sums (np.add.reduceat) between the document boundaries. Only the
+keyword flags still search strings, bounded to each document's span.
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.utils.text_preprocessor import CLICKBAIT_WORDS, URGENCY_WORDS
+
+FEATURE_COLUMNS = (
+    'length', 'word_count', 'sentence_count', 'avg_word_length',
+    'exclamation_count', 'question_count', 'caps_ratio',
+    'has_clickbait_words', 'has_urgency_words'
+)
+INTEGER_COLUMNS = frozenset({'length', 'word_count', 'sentence_count', 'exclamation_count', 'question_count'})
+BOOLEAN_COLUMNS = frozenset({'has_clickbait_words', 'has_urgency_words'})
+
+# ASCII members of the character classes as code point ranges; str.split() splits on str.isspace()
+_SPACE_RANGES = ((9, 13), (28, 32))
+_UPPER_RANGES = ((65, 90),)
+
+class FeatureMatrix:
+    """Feature values of a batch: one row per text, one float64 column per name in `columns`"""
+
+    def __init__(self, values: np.ndarray, columns: Sequence[str] = FEATURE_COLUMNS):
+        self.values = values
+        self.columns = tuple(columns)
+        self._index = {name: position for position, name in enumerate(self.columns)}
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """One column as a view"""
+        return self.values[:, self._index[name]]
+
+    def to_dicts(self) -> List[Dict]:
+        """Rows as extract_features() dictionaries"""
+        converters = [
+            int if name in INTEGER_COLUMNS else bool if name in BOOLEAN_COLUMNS else float
+            for name in self.columns
+        ]
+        return [
+            {name: convert(value) for name, convert, value in zip(self.columns, converters, row)}
+            for row in self.values.tolist()
+        ]
+
+
+def _classify(codes: np.ndarray, ranges, predicate) -> np.ndarray:
+    """
+    Boolean class of each code point: range checks for ASCII, plus one
+    predicate call per distinct non-ASCII code point in a UTF-32 buffer
+    """
+    flags = np.zeros(codes.size, dtype=bool)
+    for low, high in ranges:
+        flags |= (codes >= low) & (codes <= high)
+    if codes.dtype == np.uint32:
+        high = np.unique(codes[codes >= 128])
+        members = [code for code in high.tolist() if predicate(chr(code))]
+        if members:
+            flags |= np.isin(codes, members)
+    return flags
+
+
+def _run_starts(flags: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Positions where a run of set flags begins; runs never continue across documents"""
+    previous = np.zeros_like(flags)
+    previous[1:] = flags[:-1]
+    previous[starts] = False
+    return flags & ~previous
+
+
+def _contains_any(lowered: str, bounds: np.ndarray, words) -> np.ndarray:
+    """
+    Whether any word occurs inside each document's span of the lowered,
+    joined text. Each word is searched through the whole buffer, skipping
+    to the next document after a hit, so the Python work is per match
+    rather than per document.
+    """
+    ends = bounds[1:].tolist()
+    found = np.zeros(len(ends), dtype=bool)
+    for word in words:
+        position = lowered.find(word)
+        while position >= 0:
+            document = bisect_right(ends, position)
+            if position + len(word) <= ends[document]:
+                found[document] = True
+                position = lowered.find(word, ends[document])
+            else:
+                # Straddles a document boundary
+                position = lowered.find(word, position + 1)
+    return found
+
+
+def _extract_chunk(texts: List[str]) -> np.ndarray:
+    count = len(texts)
+    values = np.zeros((count, len(FEATURE_COLUMNS)))
+    if not count:
+        return values
+
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=count)
+    bounds = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=bounds[1:])
+    nonempty = lengths > 0
+    starts = bounds[:-1][nonempty]
+
+    # ASCII chunks (the common case) are one byte per character; anything else is UTF-32
+    joined = ''.join(texts)
+    if joined.isascii():
+        codes = np.frombuffer(joined.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(joined.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+    def per_document(flags):
+        counts = np.zeros(count, dtype=np.int64)
+        if starts.size:
+            # Empty documents add no characters, so each start's segment ends at its own document's end
+            counts[nonempty] = np.add.reduceat(flags.view(np.uint8), starts, dtype=np.int64)
+        return counts
+
+    nonspace = ~_classify(codes, _SPACE_RANGES, str.isspace)
+    terminators = (codes == ord('.')) | (codes == ord('!')) | (codes == ord('?'))
+    uppercase = per_document(_classify(codes, _UPPER_RANGES, str.isupper))
+    word_count = per_document(_run_starts(nonspace, starts))
+    word_chars = per_document(nonspace)
+
+    column = {name: position for position, name in enumerate(FEATURE_COLUMNS)}
+    values[:, column['length']] = lengths
+    values[:, column['word_count']] = word_count
+    # re.split(r'[.!?]+', text) yields one more piece than there are runs of terminators
+    values[:, column['sentence_count']] = per_document(_run_starts(terminators, starts)) + 1
+    values[:, column['avg_word_length']] = np.divide(word_chars, word_count, out=np.zeros(count),
+                                                     where=word_count > 0)
+    values[:, column['exclamation_count']] = per_document(codes == ord('!'))
+    values[:, column['question_count']] = per_document(codes == ord('?'))
+    values[:, column['caps_ratio']] = np.divide(uppercase, lengths, out=np.zeros(count), where=lengths > 0)
+
+    # Lowercasing can change the length of non-ASCII text, so only ASCII chunks are searched joined
+    if codes.dtype == np.uint8:
+        lowered = joined.lower()
+        values[:, column['has_clickbait_words']] = _contains_any(lowered, bounds, CLICKBAIT_WORDS)
+        values[:, column['has_urgency_words']] = _contains_any(lowered, bounds, URGENCY_WORDS)
+    else:
+        lowered = [text.lower() for text in texts]
+        values[:, column['has_clickbait_words']] = [any(word in text for word in CLICKBAIT_WORDS) for text in lowered]
+        values[:, column['has_urgency_words']] = [any(word in text for word in URGENCY_WORDS) for text in lowered]
+    return values
+
+
+def extract_features_batch(texts: Iterable[str], chunk_size: Optional[int] = 10000) -> FeatureMatrix:
+    """
+    FeatureMatrix of extract_features() values for every text. Texts are
+    encoded `chunk_size` at a time, which bounds the temporary buffers when
+    streaming large stored collections through.
+    """
+    chunks = []
+    chunk = []
+    for text in texts:
+        chunk.append(text or '')
+        if chunk_size and len(chunk) >= chunk_size:
+            chunks.append(_extract_chunk(chunk))
+            chunk = []
+    if chunk or not chunks:
+        chunks.append(_extract_chunk(chunk))
+    return FeatureMatrix(np.vstack(chunks) if len(chunks) > 1 else chunks[0])
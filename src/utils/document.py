@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import List, Pattern, Union
+
+_UPPERCASE = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+
+class AnalyzedDocument:
+    """
+    One request's text with lazily computed, cached views.
+
+    The detector's analyzers and the creative-analysis layer in app.py all
+    read from the same document, so the text is lowercased, split and
+    scanned at most once per view no matter how many consumers ask. The
+    document is immutable: views are derived from `text` and never change.
+    """
+
+    def __init__(self, text: str):
+        object.__setattr__(self, 'text', text)
+        object.__setattr__(self, '_matches', {})
+        object.__setattr__(self, '_hits', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        preview = self.text[:40] + ('...' if len(self.text) > 40 else '')
+        return f"{type(self).__name__}({preview!r})"
+
+    def strip(self) -> 'AnalyzedDocument':
+        """This document, or a new one over the stripped text if it has surrounding whitespace"""
+        stripped = self.text.strip()
+        return self if stripped == self.text else AnalyzedDocument(stripped)
+
+    # Text views
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace-separated words, as text.split()"""
+        return self.text.split()
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Non-empty fragments between full stops"""
+        return [sentence for sentence in self.text.split('.') if sentence.strip()]
+
+    @cached_property
+    def sentence_count(self) -> int:
+        return len(self.sentences)
+
+    @cached_property
+    def avg_word_length(self) -> float:
+        return sum(len(word) for word in self.words) / max(self.word_count, 1)
+
+    # Character classes
+
+    @cached_property
+    def uppercase_count(self) -> int:
+        """Number of ASCII capital letters"""
+        return sum(1 for char in self.text if char in _UPPERCASE)
+
+    @cached_property
+    def has_digit(self) -> bool:
+        return any(char.isdigit() for char in self.text)
+
+    @cached_property
+    def has_uppercase_word(self) -> bool:
+        return any(word.isupper() for word in self.words)
+
+    # Regex and lexicon matches
+
+    def findall(self, pattern: Pattern) -> List:
+        """pattern.findall(text), computed once per pattern"""
+        matches = self._matches.get(pattern)
+        if matches is None:
+            matches = pattern.findall(self.text)
+            self._matches[pattern] = matches
+        return matches
+
+    def count(self, pattern: Pattern) -> int:
+        return len(self.findall(pattern))
+
+    def search(self, pattern: Pattern) -> bool:
+        """Whether the pattern occurs; reuses findall() results when they exist"""
+        matches = self._matches.get(pattern)
+        if matches is not None:
+            return bool(matches)
+        return pattern.search(self.text) is not None
+
+    def scan(self, lexicon):
+        """LexiconHits of a LexiconScanner over the shared lowercased text"""
+        hits = self._hits.get(id(lexicon))
+        if hits is None or hits[0] is not lexicon:
+            hits = (lexicon, lexicon.scan_lower(self.lower))
+            self._hits[id(lexicon)] = hits
+        return hits[1]
+
+
+def as_document(text: Union[str, AnalyzedDocument]) -> AnalyzedDocument:
+    """Wrap a plain string; documents are returned unchanged"""
+    if isinstance(text, AnalyzedDocument):
+        return text
+    return AnalyzedDocument(text or '')
@@ -0,0 +1,173 @@
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def load_lemma_table(path: str) -> List[Tuple[str, str]]:
+    """Read a token<TAB>lemma table (most frequent tokens first)"""
+    pairs = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) >= 2 and fields[0]:
+                pairs.append((fields[0], fields[1]))
+    return pairs
+
+
+def save_lemma_table(path: str, pairs: Iterable[Tuple[str, str]]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        for token, lemma in pairs:
+            f.write(f"{token}\t{lemma}\n")
+    os.replace(temp_path, path)
+
+
+class LemmaCache:
+    """
+    Bounded memo of token -> final preprocessing output.
+
+    One dictionary lookup answers the stopword check, the lemma and the
+    minimum-length filter together: the stored value is the interned lemma,
+    or '' when the token is dropped. The cache can be seeded from a
+    precomputed table of frequent tokens; seeded entries are pinned. Tokens
+    learned at runtime fill the remaining room and, once the cache is full,
+    the least recently used of them is evicted for each new token, so a
+    shift in vocabulary (a new story, a new name) is picked up.
+
+    The cache lives in one process. Rule pool workers are spawned by
+    default and share nothing with the parent; each builds its own cache
+    and seeds it from the table in the pool initializer. Within a process the
+    cache is shared by the detector's analysis threads: the LRU tier is only
+    touched under a lock, while the pinned tier is read without one.
+    """
+
+    def __init__(self, lemmatize: Callable[[str], str], stop_words: Iterable[str] = (),
+                 max_entries: int = 100000, min_length: int = 3):
+        self._lemmatize = lemmatize
+        self.stop_words = frozenset(stop_words)
+        self.max_entries = max_entries
+        self.min_length = min_length
+        self._seeded: Dict[str, str] = {}
+        self._recent: OrderedDict = OrderedDict()
+        # Guards _recent: a lookup's move_to_end must not race an eviction's popitem
+        self._lock = threading.Lock()
+        self.seeded = 0
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+    def _output(self, token: str, lemma: str) -> str:
+        if token in self.stop_words:
+            return ''
+        lemma = sys.intern(lemma)
+        return lemma if len(lemma) >= self.min_length else ''
+
+    def seed(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """Pre-populate (and pin) from (token, lemma) pairs, most frequent first"""
+        added = 0
+        with self._lock:
+            for token, lemma in pairs:
+                if len(self._seeded) + len(self._recent) >= self.max_entries:
+                    break
+                if token not in self._seeded and token not in self._recent:
+                    self._seeded[sys.intern(token)] = self._output(token, lemma)
+                    added += 1
+        self.seeded += added
+        return added
+
+    def seed_from_file(self, path: Optional[str]) -> int:
+        if not path or not os.path.exists(path):
+            return 0
+        try:
+            added = self.seed(load_lemma_table(path))
+            logging.info(f"✅ Seeded lemma cache with {added} entries from {path}")
+            return added
+        except Exception as e:
+            logging.warning(f"⚠️ Could not load lemma table {path}: {str(e)}")
+            return 0
+
+    def _lookup(self, token: str) -> Optional[str]:
+        output = self._seeded.get(token)
+        if output is None:
+            with self._lock:
+                output = self._recent.get(token)
+                if output is not None:
+                    self._recent.move_to_end(token)
+        return output
+
+    def _resolve_miss(self, token: str) -> str:
+        if token in self.stop_words:
+            output = ''
+        else:
+            output = self._output(token, self._lemmatize(token))
+        if len(self._seeded) >= self.max_entries:
+            return output
+        with self._lock:
+            # Another thread may have learned the token while it was lemmatized
+            if token in self._recent:
+                self._recent.move_to_end(token)
+                return output
+            if self._recent and len(self._seeded) + len(self._recent) >= self.max_entries:
+                self._recent.popitem(last=False)
+                self.evicted += 1
+            self._recent[sys.intern(token)] = output
+        return output
+
+    def resolve(self, token: str) -> str:
+        """Final output for one token: its lemma, or '' if it is dropped"""
+        output = self._lookup(token)
+        if output is None:
+            self.misses += 1
+            return self._resolve_miss(token)
+        self.hits += 1
+        return output
+
+    def resolve_all(self, tokens: Iterable[str]) -> List[str]:
+        """Lemmas of the kept tokens, in order"""
+        get_seeded = self._seeded.get
+        recent = self._recent
+        get_recent = recent.get
+        touch = recent.move_to_end
+        lock = self._lock
+        resolve_miss = self._resolve_miss
+        result = []
+        total = 0
+        misses = 0
+        for token in tokens:
+            total += 1
+            # Seeded (frequent) tokens are answered by the first lookup
+            output = get_seeded(token)
+            if output is None:
+                with lock:
+                    output = get_recent(token)
+                    if output is not None:
+                        touch(token)
+                if output is None:
+                    misses += 1
+                    output = resolve_miss(token)
+            if output:
+                result.append(output)
+        self.hits += total - misses
+        self.misses += misses
+        return result
+
+    def __len__(self) -> int:
+        return len(self._seeded) + len(self._recent)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'seeded': self.seeded,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evicted': self.evicted
+        }
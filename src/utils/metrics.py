@@ -0,0 +1,158 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; observe() is O(log buckets) under a short lock"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float):
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += seconds
+            self._count += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+            count = self._count
+        return {'counts': counts, 'sum': total, 'count': count}
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile (seconds) by linear interpolation inside the bucket"""
+        snapshot = self.snapshot()
+        if not snapshot['count']:
+            return 0.0
+
+        rank = q * snapshot['count']
+        cumulative = 0
+        lower = 0.0
+        for index, count in enumerate(snapshot['counts']):
+            upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+            if count and cumulative + count >= rank:
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+            lower = upper
+        return self.buckets[-1]
+
+
+class _StageTimer:
+    __slots__ = ('registry', 'stage', 'timings', 'start')
+
+    def __init__(self, registry, stage, timings):
+        self.registry = registry
+        self.stage = stage
+        self.timings = timings
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        if self.registry.enabled:
+            self.registry.observe(self.stage, elapsed)
+        if self.timings is not None:
+            self.timings[self.stage] = self.timings.get(self.stage, 0.0) + elapsed
+        return False
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+class StageMetrics:
+    """
+    Per-stage latency histograms that can be switched on and off at runtime.
+    When disabled and no per-call timings are requested, timer() returns a
+    shared no-op context manager so instrumentation costs almost nothing.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def timer(self, stage: str, timings: Optional[Dict[str, float]] = None):
+        """Context manager timing one stage; also records into `timings` if given"""
+        if not self.enabled and timings is None:
+            return _NOOP_TIMER
+        return _StageTimer(self, stage, timings)
+
+    def observe(self, stage: str, seconds: float):
+        histogram = self._histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(stage, LatencyHistogram(self.buckets))
+        histogram.observe(seconds)
+
+    def histogram(self, stage: str) -> Optional[LatencyHistogram]:
+        return self._histograms.get(stage)
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+    def summary(self) -> Dict[str, Dict]:
+        """Count, mean and p50/p90/p99 (milliseconds) per stage"""
+        summary = {}
+        for stage, histogram in sorted(self._histograms.items()):
+            snapshot = histogram.snapshot()
+            summary[stage] = {
+                'count': snapshot['count'],
+                'mean_ms': 1000 * snapshot['sum'] / snapshot['count'] if snapshot['count'] else 0.0,
+                'p50_ms': 1000 * histogram.quantile(0.50),
+                'p90_ms': 1000 * histogram.quantile(0.90),
+                'p99_ms': 1000 * histogram.quantile(0.99)
+            }
+        return summary
+
+    def render_prometheus(self, name: str = 'fnd_stage_latency_seconds',
+                          help_text: str = 'Latency of FakeNewsDetector.predict stages') -> str:
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for stage, histogram in sorted(self._histograms.items()):
+            snapshot = histogram.snapshot()
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, snapshot['counts']):
+                cumulative += count
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {snapshot["count"]}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {snapshot["sum"]}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {snapshot["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def render_samples(name: str, help_text: str, samples: Iterable[Tuple[Dict[str, str], float]],
+                   metric_type: str = 'gauge') -> str:
+    """Render plain gauge/counter samples in Prometheus text format"""
+    lines: List[str] = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        if labels:
+            label_text = ','.join(f'{key}="{val}"' for key, val in sorted(labels.items()))
+            lines.append(f"{name}{{{label_text}}} {value}")
+        else:
+            lines.append(f"{name} {value}")
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,316 @@
+"""
+Near-duplicate index over past verdicts: MinHash signatures and LSH banding.
+
+Re-posted articles are rarely byte-identical: a new headline, trailing
+hashtags or tracking URLs are enough to miss the exact-text result cache.
+Each text is reduced to the word shingles (n-grams) of its
+TextPreprocessor.preprocess_tokens() output, which already drops URLs,
+punctuation and stopwords, and summarized by a MinHash signature: for each
+of `num_perm` hash functions, the minimum hash over the shingles. The
+fraction of equal positions in two signatures estimates the Jaccard
+similarity of their shingle sets.
+
+Signatures are split into bands; two texts become candidates when any band
+is identical, so a lookup is `bands` dictionary probes plus one comparison
+per candidate, independent of the index size. Candidates are accepted when
+their estimated similarity reaches `threshold`.
+
+Tokens are hashed with CRC-32, which is stable across processes, so a saved
+index stays valid for every process that preprocesses text the same way.
+"""
+import json
+import logging
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FORMAT_VERSION = 1
+# Stored with each entry; prediction and confidence are the ones MongoDB history always has
+VERDICT_FIELDS = ('prediction', 'confidence', 'status', 'verification_score')
+
+_MASK = np.uint64(0xFFFFFFFF)
+_SHIFT = np.uint64(32)
+# Odd multipliers combining the token hashes of a shingle
+_SHINGLE_MULTIPLIERS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F, 0x165667B1)
+
+
+def verdict_of(result: Dict) -> Dict:
+    """The fields of a prediction result (or stored prediction) kept in the index"""
+    return {field: result[field] for field in VERDICT_FIELDS if result.get(field) is not None}
+
+
+def _bands_for(threshold: float, num_perm: int) -> int:
+    """
+    Number of bands. A pair with similarity s becomes a candidate with
+    probability 1 - (1 - s**rows)**bands, which rises steeply around
+    (1/bands)**(1/rows); the most rows whose rise starts comfortably below
+    the threshold keeps candidates few without missing true matches.
+    """
+    bands = num_perm
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        if (rows / num_perm) ** (1 / rows) <= 0.9 * threshold:
+            bands = num_perm // rows
+    return bands
+
+
+class NearDuplicateIndex:
+    """
+    Bounded MinHash/LSH index from text signatures to verdicts. When full,
+    the oldest entries are evicted first. Adding a text that is already
+    indexed (same `key`) replaces its verdict. Thread-safe.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 3,
+                 min_tokens: int = 8, max_entries: int = 100000, seed: int = 1, preprocessing: str = ''):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # Shorter texts are left to the exact cache: a few shingles cannot tell a claim from its negation
+        self.min_tokens = max(min_tokens, shingle_size)
+        self.max_entries = max(1, int(max_entries))
+        self.seed = seed
+        # Describes the tokenization the signatures were built with; see load()
+        self.preprocessing = preprocessing
+        self.bands = _bands_for(threshold, num_perm)
+        self.rows = num_perm // self.bands
+
+        generator = np.random.default_rng(seed)
+        # Multiply-shift hashing: the high half of (a * x + b) mod 2**64, with odd 64-bit a
+        self._a = generator.integers(0, 2 ** 64, num_perm, dtype=np.uint64, endpoint=False) | np.uint64(1)
+        self._b = generator.integers(0, 2 ** 64, num_perm, dtype=np.uint64, endpoint=False)
+        # Each band is bucketed by one 64-bit hash of its rows
+        self._band_multipliers = generator.integers(0, 2 ** 64, self.rows, dtype=np.uint64,
+                                                    endpoint=False) | np.uint64(1)
+
+        self._lock = threading.Lock()
+        self._signatures = np.zeros((min(self.max_entries, 1024), num_perm), dtype=np.uint32)
+        self._keys: List[Optional[bytes]] = []
+        self._verdicts: List[Optional[Dict]] = []
+        self._slots: Dict[bytes, int] = {}
+        self._buckets = [dict() for _ in range(self.bands)]
+        self._next = 0
+        self.modified = False
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def signature(self, tokens: Sequence[str]) -> Optional[np.ndarray]:
+        """MinHash signature of preprocessed tokens, or None for texts shorter than min_tokens"""
+        if len(tokens) < self.min_tokens:
+            return None
+        hashes = np.array([zlib.crc32(token.encode('utf-8', 'surrogatepass')) for token in tokens], dtype=np.uint64)
+        count = len(tokens) - self.shingle_size + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for offset in range(self.shingle_size):
+            multiplier = np.uint64(_SHINGLE_MULTIPLIERS[offset % len(_SHINGLE_MULTIPLIERS)])
+            shingles += hashes[offset:offset + count] * multiplier
+        shingles &= _MASK
+        # Repeated shingles do not change a minimum, so they are not deduplicated
+        permuted = shingles[:, None] * self._a
+        permuted += self._b
+        permuted >>= _SHIFT
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signatures: np.ndarray) -> List:
+        """Band hashes of a signature, or one list of them per row of a stack of signatures"""
+        bands = signatures.reshape(signatures.shape[:-1] + (self.bands, self.rows)).astype(np.uint64)
+        return (bands * self._band_multipliers).sum(axis=-1).tolist()
+
+    def query(self, signature: Optional[np.ndarray]) -> Optional[Tuple[float, Dict]]:
+        """(estimated similarity, verdict) of the most similar entry at or above the threshold, or None"""
+        if signature is None:
+            return None
+        band_keys = self._band_keys(signature)
+        with self._lock:
+            candidates = set()
+            for bucket, band_key in zip(self._buckets, band_keys):
+                candidates.update(bucket.get(band_key, ()))
+            best = None
+            if candidates:
+                slots = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                similarities = (self._signatures[slots] == signature).mean(axis=1)
+                position = int(similarities.argmax())
+                if similarities[position] >= self.threshold:
+                    best = (float(similarities[position]), dict(self._verdicts[slots[position]]))
+            if best is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return best
+
+    def add(self, key: bytes, signature: Optional[np.ndarray], verdict: Dict) -> bool:
+        """Index a text's signature under its exact-text key; False if the text is too short"""
+        if signature is None:
+            return False
+        band_keys = self._band_keys(signature)
+        with self._lock:
+            self._insert(key, signature, verdict, band_keys)
+        return True
+
+    def _insert(self, key: bytes, signature: np.ndarray, verdict: Dict, band_keys: List[int]):
+        self.modified = True
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._verdicts[slot] = verdict
+            return
+
+        if len(self._keys) < self.max_entries:
+            slot = len(self._keys)
+            self._keys.append(None)
+            self._verdicts.append(None)
+            if slot >= len(self._signatures):
+                grown = np.zeros((min(self.max_entries, 2 * len(self._signatures)), self.num_perm),
+                                 dtype=np.uint32)
+                grown[:slot] = self._signatures[:slot]
+                self._signatures = grown
+        else:
+            # Full: reuse the oldest slot
+            slot = self._next % self.max_entries
+            self._evict(slot)
+        self._next = slot + 1
+
+        self._signatures[slot] = signature
+        self._keys[slot] = key
+        self._verdicts[slot] = verdict
+        self._slots[key] = slot
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket.setdefault(band_key, []).append(slot)
+
+    def update(self, key: bytes, verdict: Dict) -> bool:
+        """Replace the verdict of an indexed text; False if it is not indexed"""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                return False
+            self._verdicts[slot] = verdict
+            self.modified = True
+        return True
+
+    def _evict(self, slot: int):
+        del self._slots[self._keys[slot]]
+        for bucket, band_key in zip(self._buckets, self._band_keys(self._signatures[slot])):
+            members = bucket[band_key]
+            members.remove(slot)
+            if not members:
+                del bucket[band_key]
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'threshold': self.threshold,
+            'bands': self.bands,
+            'rows': self.rows,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def _ordered_slots(self) -> List[int]:
+        """Occupied slots, oldest first"""
+        count = len(self._keys)
+        start = self._next % count if count == self.max_entries else 0
+        order = list(range(start, count)) + list(range(start))
+        return [slot for slot in order if self._keys[slot] is not None]
+
+    def save(self, path: str):
+        """Write the index to an .npz file; the previous file is replaced only once the new one is complete"""
+        with self._lock:
+            slots = self._ordered_slots()
+            meta = {
+                'format_version': FORMAT_VERSION,
+                'num_perm': self.num_perm,
+                'shingle_size': self.shingle_size,
+                'min_tokens': self.min_tokens,
+                'seed': self.seed,
+                'preprocessing': self.preprocessing,
+                'verdicts': [self._verdicts[slot] for slot in slots]
+            }
+            signatures = self._signatures[slots]
+            keys = np.frombuffer(b''.join(self._keys[slot] for slot in slots), dtype=np.uint8)
+            keys = keys.reshape(len(slots), -1) if slots else keys.reshape(0, 0)
+            self.modified = False
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            np.savez(f, signatures=signatures, keys=keys, meta=np.array(json.dumps(meta)))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str, threshold: float = 0.8, max_entries: int = 100000,
+             preprocessing: Optional[str] = None) -> 'NearDuplicateIndex':
+        """
+        Index saved by save(). Hashing parameters come from the file, the
+        threshold and bound from the caller. ValueError if the file was built
+        with different preprocessing than `preprocessing`, since its
+        signatures would not match those of new texts.
+        """
+        with np.load(path, allow_pickle=False) as archive:
+            meta = json.loads(str(archive['meta']))
+            signatures = archive['signatures']
+            keys = archive['keys']
+        if meta.get('format_version') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported near-duplicate index format {meta.get('format_version')}")
+        if preprocessing is not None and meta['preprocessing'] != preprocessing:
+            raise ValueError(f"Index was built with '{meta['preprocessing']}' preprocessing, "
+                             f"this process uses '{preprocessing}'; rebuild it")
+
+        index = cls(threshold, meta['num_perm'], meta['shingle_size'], meta['min_tokens'],
+                    max_entries, meta['seed'], meta['preprocessing'])
+        # Keep the newest entries if the bound shrank
+        start = max(0, len(signatures) - index.max_entries)
+        signatures = signatures[start:]
+        with index._lock:
+            for key, signature, verdict, band_keys in zip(keys[start:], signatures, meta['verdicts'][start:],
+                                                          index._band_keys(signatures)):
+                index._insert(key.tobytes(), signature, verdict, band_keys)
+            index.modified = False
+        return index
+
+
+def load_if_present(path: Optional[str], threshold: float, max_entries: int,
+                    preprocessing: str) -> Optional[NearDuplicateIndex]:
+    """The index saved at `path`, or None (with a log line) if there is none or it cannot be used"""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        index = NearDuplicateIndex.load(path, threshold, max_entries, preprocessing)
+        logging.info(f"✅ Loaded near-duplicate index with {len(index)} entries from {path}")
+        return index
+    except Exception as e:
+        logging.warning(f"⚠️ Could not load near-duplicate index from {path}: {str(e)}")
+        return None
+
+
+def build_index(records: Iterable[Dict], preprocessor, threshold: float = 0.8,
+                max_entries: int = 100000) -> Tuple[NearDuplicateIndex, int]:
+    """
+    (index, records indexed) of stored predictions, oldest first, e.g.
+    MongoDB history. Records need a text and a prediction; texts too short
+    to index are skipped. Keys match the detector's (stripped text).
+    """
+    from src.utils.result_cache import text_key
+
+    index = NearDuplicateIndex(threshold, max_entries=max_entries, preprocessing=preprocessor.mode)
+    indexed = 0
+    for record in records:
+        text = record.get('text') if isinstance(record, dict) else None
+        if not isinstance(text, str) or record.get('prediction') is None:
+            continue
+        text = text.strip()
+        if index.add(text_key(text), index.signature(preprocessor.preprocess_tokens(text)), verdict_of(record)):
+            indexed += 1
+    return index, indexed
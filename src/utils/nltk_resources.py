@@ -0,0 +1,144 @@
+"""
+Lazy, offline-first access to NLTK data.
+
+Nothing is downloaded at import time. The first component that needs a
+resource calls ensure_resource(), which looks in the configured local
+data directory (Config.NLTK_DATA_DIR) and NLTK's default search path,
+and only downloads when Config.NLTK_AUTO_DOWNLOAD allows it. Air-gapped
+workers are provisioned ahead of time with
+
+    python -m src.cli nltk-data --archive nltk_data.tar.gz   (online machine)
+    python -m src.cli nltk-data --from-archive nltk_data.tar.gz   (worker)
+"""
+import logging
+import os
+import tarfile
+import threading
+from typing import Dict, Iterable, Optional
+
+from src.config.config import Config
+
+# Resource name -> path checked with nltk.data.find()
+RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',  # used by word_tokenize from NLTK 3.8.2 on
+    'stopwords': 'corpora/stopwords',
+    'wordnet': 'corpora/wordnet',
+    'vader_lexicon': 'sentiment/vader_lexicon.zip'
+}
+
+_lock = threading.Lock()
+_available: Dict[str, bool] = {}
+_configured_dirs = set()
+
+
+def configure_data_dir(data_dir: Optional[str] = None) -> Optional[str]:
+    """Put the local data directory first on NLTK's search path"""
+    import nltk
+
+    data_dir = data_dir or Config.NLTK_DATA_DIR
+    if not data_dir:
+        return None
+    data_dir = os.path.abspath(data_dir)
+    if data_dir not in _configured_dirs:
+        if data_dir not in nltk.data.path:
+            nltk.data.path.insert(0, data_dir)
+        _configured_dirs.add(data_dir)
+    return data_dir
+
+
+def _find(name: str) -> bool:
+    import nltk
+
+    path = RESOURCES.get(name, name)
+    candidates = [path, path[:-4]] if path.endswith('.zip') else [path, path + '.zip']
+    for candidate in candidates:
+        try:
+            nltk.data.find(candidate)
+            return True
+        except LookupError:
+            continue
+    return False
+
+
+def tokenizer_resource() -> str:
+    """The Punkt data word_tokenize loads in the installed NLTK version"""
+    from nltk.tokenize import punkt
+    return 'punkt_tab' if hasattr(punkt, 'PunktTokenizer') else 'punkt'
+
+
+def ensure_resource(name: str, download: Optional[bool] = None) -> bool:
+    """
+    True if the NLTK resource can be loaded. Checked once per process; a
+    missing resource is downloaded into the local data directory only when
+    `download` (default Config.NLTK_AUTO_DOWNLOAD) is set.
+    """
+    if name in _available:
+        return _available[name]
+
+    with _lock:
+        if name in _available:
+            return _available[name]
+
+        data_dir = configure_data_dir()
+        found = _find(name)
+        if not found and (Config.NLTK_AUTO_DOWNLOAD if download is None else download):
+            import nltk
+            try:
+                nltk.download(name, download_dir=data_dir, quiet=True, raise_on_error=True)
+                found = _find(name)
+            except Exception as e:
+                logging.warning(f"⚠️ Could not download NLTK resource '{name}': {str(e)}")
+
+        if not found:
+            logging.warning(f"⚠️ NLTK resource '{name}' not available; "
+                            f"provision it with `python -m src.cli nltk-data`")
+        _available[name] = found
+        return found
+
+
+def status(names: Iterable[str] = RESOURCES, data_dir: Optional[str] = None) -> Dict[str, bool]:
+    """Availability of each resource on the local search path (never downloads)"""
+    configure_data_dir(data_dir)
+    return {name: _find(name) for name in names}
+
+
+def provision(data_dir: str, names: Iterable[str] = RESOURCES) -> Dict[str, bool]:
+    """Download resources into data_dir; returns which ones are now available there"""
+    import nltk
+
+    os.makedirs(data_dir, exist_ok=True)
+    results = {}
+    for name in names:
+        try:
+            results[name] = bool(nltk.download(name, download_dir=data_dir, quiet=True))
+        except Exception as e:
+            logging.warning(f"⚠️ Could not download NLTK resource '{name}': {str(e)}")
+            results[name] = False
+    return results
+
+
+def pack(data_dir: str, archive_path: str):
+    """Pack a provisioned data directory into a .tar.gz artifact"""
+    directory = os.path.dirname(archive_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = archive_path + '.tmp'
+    with tarfile.open(temp_path, 'w:gz') as archive:
+        for entry in sorted(os.listdir(data_dir)):
+            archive.add(os.path.join(data_dir, entry), arcname=entry)
+    os.replace(temp_path, archive_path)
+
+
+def unpack(archive_path: str, data_dir: str):
+    """Install an artifact made by pack() into data_dir, without network access"""
+    os.makedirs(data_dir, exist_ok=True)
+    target = os.path.realpath(data_dir)
+    with tarfile.open(archive_path, 'r:gz') as archive:
+        for member in archive.getmembers():
+            destination = os.path.realpath(os.path.join(target, member.name))
+            if os.path.commonpath([target, destination]) != target or member.issym() or member.islnk():
+                raise ValueError(f"Unsafe path in archive: {member.name}")
+        archive.extractall(target)
+    # Resources that were missing before may be present now
+    _available.clear()
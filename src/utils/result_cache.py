@@ -0,0 +1,128 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+
+def text_key(text: str) -> bytes:
+    """Fast 128-bit digest of a text, used as cache key"""
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class _CacheShard:
+    """One LRU/TTL shard guarded by its own lock"""
+
+    def __init__(self, max_entries: int, ttl: Optional[float]):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class ShardedLRUCache:
+    """
+    Size-bounded, thread-safe LRU cache with optional TTL.
+    Keys are spread over independently locked shards so concurrent
+    request threads rarely contend on the same lock.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: Optional[float] = None, shards: int = 16):
+        shards = max(1, int(shards))
+        per_shard = max(1, -(-int(max_entries) // shards))
+        self.max_entries = per_shard * shards
+        self._shards = [_CacheShard(per_shard, ttl) for _ in range(shards)]
+
+    def _shard(self, key: Hashable) -> _CacheShard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._shard(key).get(key, default)
+
+    def set(self, key: Hashable, value: Any):
+        self._shard(key).set(key, value)
+
+    def clear(self):
+        for shard in self._shards:
+            shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def stats(self) -> Dict:
+        hits = sum(shard.hits for shard in self._shards)
+        misses = sum(shard.misses for shard in self._shards)
+        return {
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'evictions': sum(shard.evictions for shard in self._shards),
+            'expirations': sum(shard.expirations for shard in self._shards)
+        }
+
+
+class TieredResultCache:
+    """
+    Named cache tiers with independent bounds and statistics, e.g. a
+    'model' tier for classifier outputs and a 'rules' tier for full
+    rule-based results, so invalidating one never flushes the other.
+    """
+
+    def __init__(self, tiers: Iterable[str], max_entries: int = 10000, ttl: Optional[float] = None,
+                 shards: int = 16, enabled: bool = True):
+        self.enabled = enabled
+        self.tiers = {name: ShardedLRUCache(max_entries, ttl, shards) for name in tiers}
+
+    def get(self, tier: str, key: Hashable, default: Any = None) -> Any:
+        if not self.enabled:
+            return default
+        return self.tiers[tier].get(key, default)
+
+    def set(self, tier: str, key: Hashable, value: Any):
+        if self.enabled:
+            self.tiers[tier].set(key, value)
+
+    def clear(self, tier: Optional[str] = None):
+        for name, cache in self.tiers.items():
+            if tier is None or name == tier:
+                cache.clear()
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: cache.stats() for name, cache in self.tiers.items()}
@@ -1,108 +1,256 @@
 import re
 import string
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
 import logging
+import threading
+from src.utils.lemma_cache import LemmaCache
+from src.utils.nltk_resources import ensure_resource, tokenizer_resource
 
-# Download required NLTK data
-try:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-    nltk.download('wordnet', quiet=True)
-except:
-    logging.warning("Could not download NLTK data")
+_URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_HTML_PATTERN = re.compile(r'<[^>]+>')
+_DIGIT_PATTERN = re.compile(r'\d+')
+
+# General path: one scan in which URLs, e-mail addresses and HTML tags are skipped and
+# everything else that survives is a word. Only the word alternative captures, so findall()
+# yields '' for skipped spans. Digits inside a word are dropped afterwards, as the old
+# pipeline deleted them without inserting a space.
+_TOKEN_PATTERN = re.compile(
+    r'(?:' + _URL_PATTERN.pattern + r'|\S+@\S+|<[^>]+>)'
+    r'|([^\W\d]+(?:\d+[^\W\d]+)*)'
+)
+
+# ASCII fast path: punctuation becomes a space and digits disappear in one translate() call
+_ASCII_TABLE = str.maketrans({
+    code: (None if chr(code).isdigit() else ' ')
+    for code in range(128)
+    if chr(code).isdigit() or not (chr(code).isalnum() or chr(code) == '_' or chr(code).isspace())
+})
+
+# Words NLTK's Treebank tokenizer splits in two; mirrored so tokens match the word_tokenize pipeline
+_TREEBANK_SPLITS = {
+    'cannot': ('can', 'not'),
+    'gimme': ('gim', 'me'),
+    'gonna': ('gon', 'na'),
+    'gotta': ('got', 'ta'),
+    'lemme': ('lem', 'me'),
+    'wanna': ('wan', 'na')
+}
+
+# NLTK's English stopword list, used by the lightweight mode which never touches NLTK
+ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours yourself yourselves
+he him his himself she she's her hers herself it it's its itself they them their theirs themselves
+what which who whom this that that'll these those am is are was were be been being have has had
+having do does did doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down in out on off over
+under again further then once here there when where why how all any both each few more most other
+some such no nor not only own same so than too very s t can will just don don't should should've
+now d ll m o re ve y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn
+hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't needn needn't shan shan't shouldn
+shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+""".split())
+
+# Substrings flagged by extract_features()
+CLICKBAIT_WORDS = ('shocking', 'unbelievable', 'amazing', 'incredible', 'you won\'t believe')
+URGENCY_WORDS = ('urgent', 'breaking', 'alert', 'immediately', 'now')
 
 class TextPreprocessor:
     """
     Text preprocessing utility for NLP operations
     """
     
-    def __init__(self):
-        try:
-            self.stop_words = set(stopwords.words('english'))
-            self.lemmatizer = WordNetLemmatizer()
-        except:
-            self.stop_words = set()
-            self.lemmatizer = None
-            logging.warning("NLTK components not available, using basic preprocessing")
+    def __init__(self, lightweight: bool = False, lemma_table: str = None, lemma_cache_size: int = 100000):
+        """
+        With lightweight=True NLTK is never used: stopwords come from the
+        built-in list and tokens are not lemmatized. Otherwise NLTK's
+        stopwords, WordNet and tokenizer data are resolved on first use, and
+        lemmas are memoized in a LemmaCache, optionally seeded from
+        `lemma_table` (see `python -m src.cli build-lemmas`).
+        """
+        self.lightweight = lightweight
+        self.lemma_table = lemma_table
+        self.lemma_cache_size = lemma_cache_size
+        self._stop_words = ENGLISH_STOPWORDS if lightweight else None
+        self._lemmatizer = None
+        self._lemma_cache = None
+        self._treebank_splits = False
+        self._resolved = lightweight
+        self._resolve_lock = threading.Lock()
     
-    def preprocess(self, text: str, remove_stopwords: bool = True, lemmatize: bool = True) -> str:
+    def _resolve(self):
+        """Load the NLTK components once; NLTK data is checked (and, if allowed, fetched) here"""
+        with self._resolve_lock:
+            if self._resolved:
+                return
+            try:
+                # Imported here: loading NLTK costs about a second, which lightweight mode never pays
+                from nltk.corpus import stopwords
+                from nltk.stem import WordNetLemmatizer
+                ensure_resource('stopwords')
+                self._stop_words = set(stopwords.words('english'))
+                self._lemmatizer = WordNetLemmatizer() if ensure_resource('wordnet') else None
+            except:
+                self._stop_words = set()
+                self._lemmatizer = None
+                logging.warning("NLTK components not available, using basic preprocessing")
+            
+            if self._lemmatizer:
+                self._lemma_cache = LemmaCache(self._lemmatizer.lemmatize, self._stop_words, self.lemma_cache_size)
+                self._lemma_cache.seed_from_file(self.lemma_table)
+            
+            # Only apply Treebank splits when word_tokenize itself would have been usable
+            try:
+                from nltk.tokenize import word_tokenize
+                ensure_resource(tokenizer_resource())
+                word_tokenize('test')
+                self._treebank_splits = True
+            except:
+                pass
+            self._resolved = True
+    
+    def warm(self):
+        """Resolve the NLTK components (and seed the lemma cache) now instead of on first use"""
+        if not self._resolved:
+            self._resolve()
+    
+    @property
+    def stop_words(self):
+        if not self._resolved:
+            self._resolve()
+        return self._stop_words
+    
+    @stop_words.setter
+    def stop_words(self, value):
+        if not self._resolved:
+            self._resolve()
+        self._stop_words = value
+    
+    @property
+    def lemmatizer(self):
+        if not self._resolved:
+            self._resolve()
+        return self._lemmatizer
+    
+    @lemmatizer.setter
+    def lemmatizer(self, value):
+        if not self._resolved:
+            self._resolve()
+        self._lemmatizer = value
+    
+    @property
+    def lemma_cache(self):
+        if not self._resolved:
+            self._resolve()
+        return self._lemma_cache
+    
+    @lemma_cache.setter
+    def lemma_cache(self, value):
+        if not self._resolved:
+            self._resolve()
+        self._lemma_cache = value
+    
+    @property
+    def treebank_splits(self) -> bool:
+        if not self._resolved:
+            self._resolve()
+        return self._treebank_splits
+    
+    @treebank_splits.setter
+    def treebank_splits(self, value: bool):
+        if not self._resolved:
+            self._resolve()
+        self._treebank_splits = value
+    
+    @property
+    def mode(self) -> str:
+        """'lightweight', 'lemmatized' or 'basic' (NLTK unavailable); tokens are only comparable within one mode"""
+        if self.lightweight:
+            return 'lightweight'
+        return 'lemmatized' if self.lemmatizer else 'basic'
+    
+    def preprocess_tokens(self, text: str, remove_stopwords: bool = True, lemmatize: bool = True) -> list:
         """
-        Comprehensive text preprocessing
+        Lowercase, strip URLs/e-mails/HTML, drop punctuation and digits,
+        tokenize, remove stopwords, lemmatize and drop tokens of two
+        characters or less, returning the tokens without intermediate
+        joined strings.
         """
         if not text:
-            return ""
+            return []
         
-        # Convert to lowercase
-        text = text.lower()
+        if not self._resolved:
+            self._resolve()
+        stop_words = self._stop_words if remove_stopwords else ()
+        lemmatizer = self._lemmatizer if lemmatize else None
         
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        tokens = self._scan(text.lower())
+        if self._treebank_splits:
+            tokens = [part for token in tokens for part in _TREEBANK_SPLITS.get(token, (token,))]
         
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        # Default settings: stopword check, lemma and length filter are one memoized lookup
+        if lemmatizer and remove_stopwords and self._lemma_cache is not None:
+            return self._lemma_cache.resolve_all(tokens)
         
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove punctuation but keep sentence structure
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Remove numbers (optional - might want to keep them for some analyses)
-        text = re.sub(r'\d+', '', text)
-        
-        # Tokenize
-        try:
-            tokens = word_tokenize(text)
-        except:
-            tokens = text.split()
-        
-        # Remove stopwords
-        if remove_stopwords and self.stop_words:
-            tokens = [token for token in tokens if token not in self.stop_words]
-        
-        # Lemmatize
-        if lemmatize and self.lemmatizer:
-            tokens = [self.lemmatizer.lemmatize(token) for token in tokens]
-        
-        # Remove very short tokens
-        tokens = [token for token in tokens if len(token) > 2]
+        if lemmatizer:
+            lemmas = (lemmatizer.lemmatize(token) for token in tokens if token not in stop_words)
+            return [lemma for lemma in lemmas if len(lemma) > 2]
+        return [token for token in tokens if len(token) > 2 and token not in stop_words]
+    
+    @staticmethod
+    def _scan(text: str) -> list:
+        """Raw tokens of already lowercased text"""
+        if text.isascii() and '@' not in text:
+            # Fast path: URL/HTML passes only when they can match, then a C-level translate and split
+            if 'http' in text:
+                text = _URL_PATTERN.sub('', text)
+            if '<' in text:
+                text = _HTML_PATTERN.sub('', text)
+            return text.translate(_ASCII_TABLE).split()
         
-        return ' '.join(tokens)
+        tokens = []
+        for token in _TOKEN_PATTERN.findall(text):
+            if token:
+                tokens.append(token if token.isalpha() else _DIGIT_PATTERN.sub('', token))
+        return tokens
+    
+    def preprocess(self, text: str, remove_stopwords: bool = True, lemmatize: bool = True) -> str:
+        """
+        Comprehensive text preprocessing; the tokens of preprocess_tokens() joined by spaces
+        """
+        return ' '.join(self.preprocess_tokens(text, remove_stopwords, lemmatize))
     
     def extract_features(self, text: str) -> dict:
         """
         Extract various text features for analysis
         """
         features = {}
+        words = text.split()
         
         # Basic statistics
         features['length'] = len(text)
-        features['word_count'] = len(text.split())
+        features['word_count'] = len(words)
         features['sentence_count'] = len(re.split(r'[.!?]+', text))
-        features['avg_word_length'] = sum(len(word) for word in text.split()) / len(text.split()) if text.split() else 0
+        features['avg_word_length'] = sum(map(len, words)) / len(words) if words else 0
         
         # Punctuation analysis
         features['exclamation_count'] = text.count('!')
         features['question_count'] = text.count('?')
-        features['caps_ratio'] = sum(1 for c in text if c.isupper()) / len(text) if text else 0
+        features['caps_ratio'] = sum(map(str.isupper, text)) / len(text) if text else 0
         
         # Suspicious patterns
-        features['has_clickbait_words'] = any(word in text.lower() for word in [
-            'shocking', 'unbelievable', 'amazing', 'incredible', 'you won\'t believe'
-        ])
-        
-        features['has_urgency_words'] = any(word in text.lower() for word in [
-            'urgent', 'breaking', 'alert', 'immediately', 'now'
-        ])
+        lowered = text.lower()
+        features['has_clickbait_words'] = any(word in lowered for word in CLICKBAIT_WORDS)
+        features['has_urgency_words'] = any(word in lowered for word in URGENCY_WORDS)
         
         return features
     
+    def extract_features_batch(self, texts, chunk_size: int = 10000):
+        """
+        extract_features() for many texts at once, as a FeatureMatrix with
+        one named float64 column per feature (see src/utils/batch_features.py)
+        """
+        from src.utils.batch_features import extract_features_batch
+        return extract_features_batch(texts, chunk_size)
+    
     def clean_for_model(self, text: str) -> str:
         """
         Light preprocessing specifically for transformer models
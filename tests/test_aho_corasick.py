@@ -0,0 +1,109 @@
+import unittest
+import random
+import string
+import sys
+import os
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from algorithms.aho_corasick import AhoCorasickAutomaton
+from algorithms.kmp_matcher import KMPMatcher
+
+class TestAhoCorasick(unittest.TestCase):
+
+    def setUp(self):
+        self.kmp_matcher = KMPMatcher()
+        self.rng = random.Random(1234)
+
+    def _kmp_reference(self, text, patterns):
+        """Expected matches computed with one kmp_search per pattern"""
+        expected = {}
+        for pattern in patterns:
+            matches = self.kmp_matcher.kmp_search(text, pattern)
+            if matches:
+                expected[pattern.lower()] = matches
+        return expected
+
+    def test_overlapping_matches(self):
+        """Test overlapping and nested patterns"""
+        automaton = AhoCorasickAutomaton(["he", "she", "his", "hers", "aa"])
+        result = automaton.search("ushers aaaa HIS")
+        self.assertEqual(result["she"], [1])
+        self.assertEqual(result["he"], [2])
+        self.assertEqual(result["hers"], [2])
+        self.assertEqual(result["aa"], [7, 8, 9])
+        self.assertEqual(result["his"], [12])
+
+    def test_no_patterns(self):
+        """Test automaton without patterns"""
+        automaton = AhoCorasickAutomaton(["", ""])
+        self.assertEqual(len(automaton), 0)
+        self.assertEqual(automaton.search("anything"), {})
+
+    def test_differential_random_alphabet(self):
+        """Compare against kmp_search on random texts over a small alphabet"""
+        for _ in range(50):
+            patterns = [''.join(self.rng.choice('abAB') for _ in range(self.rng.randint(1, 5)))
+                        for _ in range(self.rng.randint(1, 15))]
+            text = ''.join(self.rng.choice('abAB ') for _ in range(self.rng.randint(0, 300)))
+            automaton = AhoCorasickAutomaton(patterns)
+            self.assertEqual(automaton.search(text), self._kmp_reference(text, patterns))
+
+    def test_differential_source_lists(self):
+        """Compare against kmp_search using the real source and pattern lists"""
+        patterns = (self.kmp_matcher.trusted_sources + self.kmp_matcher.unreliable_sources
+                    + self.kmp_matcher.fake_news_patterns)
+        vocabulary = patterns + ["the", "report", "said", "officials", "news", "!"]
+        for _ in range(20):
+            text = ' '.join(self.rng.choice(vocabulary) for _ in range(200)).title()
+            self.assertEqual(self.kmp_matcher.find_all(text), self._kmp_reference(text, patterns))
+
+    def test_verify_sources_matches_kmp(self):
+        """verify_sources and detect_fake_patterns keep the KMP result structures"""
+        text = ("BREAKING NEWS: Reuters and the BBC say InfoWars leaked an exclusive. "
+                "Click here, you won't believe it! Reuters confirmed.")
+        result = self.kmp_matcher.verify_sources(text)
+
+        expected_trusted = []
+        for source in self.kmp_matcher.trusted_sources:
+            matches = self.kmp_matcher.kmp_search(text, source)
+            if matches:
+                expected_trusted.append({'source': source, 'positions': matches, 'count': len(matches)})
+        self.assertEqual(result['matched_sources']['trusted'], expected_trusted)
+
+        patterns = self.kmp_matcher.detect_fake_patterns(text)
+        expected_patterns = []
+        for pattern in self.kmp_matcher.fake_news_patterns:
+            matches = self.kmp_matcher.kmp_search(text, pattern)
+            if matches:
+                expected_patterns.append({'pattern': pattern, 'positions': matches, 'count': len(matches)})
+        self.assertEqual(patterns['pattern_matches'], expected_patterns)
+
+    def test_large_pattern_set(self):
+        """Scan cost stays near-constant as the pattern list grows"""
+        text = ' '.join(''.join(self.rng.choice(string.ascii_lowercase) for _ in range(6))
+                        for _ in range(3000))
+
+        def make_patterns(n):
+            return [''.join(self.rng.choice(string.ascii_lowercase) for _ in range(8)) for _ in range(n)]
+
+        small = AhoCorasickAutomaton(make_patterns(10))
+        large_patterns = make_patterns(5000) + ["abc"]
+        large = AhoCorasickAutomaton(large_patterns)
+
+        start = time.perf_counter()
+        small.search(text)
+        small_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        large_result = large.search(text)
+        large_time = time.perf_counter() - start
+
+        # 500x more patterns must not cost anywhere near 500x more
+        self.assertLess(large_time, max(small_time, 0.001) * 20)
+        self.assertEqual(large_result.get("abc", []), self.kmp_matcher.kmp_search(text, "abc"))
+
+if __name__ == '__main__':
+    unittest.main()
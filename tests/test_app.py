@@ -0,0 +1,257 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+from unittest import mock
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+from src.config.config import Config
+from src.models.fake_news_detector import FakeNewsDetector
+from tests.test_near_duplicates import article, repost
+
+TEXT = ("According to Reuters, officials confirmed on March 3, 2024 that 120 residents were evacuated. "
+        "\"We acted quickly,\" the mayor said in a statement.")
+
+class AppTestCase(unittest.TestCase):
+    """Flask test client over a rules-only detector, without the background initialization"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+
+    def setUp(self):
+        # Without background initialization, which would replace the detector set below
+        with mock.patch.object(Config, 'AUTO_INITIALIZE', False):
+            import app as app_module
+        self.app_module = app_module
+        for name in ('detector', 'db_handler'):
+            self.addCleanup(setattr, app_module, name, getattr(app_module, name))
+        app_module.detector = self.detector
+        app_module.db_handler = None
+        patcher = mock.patch.object(Config, 'RESPONSE_DELAY_SECONDS', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = app_module.app.test_client()
+
+class TestProfileValidation(AppTestCase):
+
+    def test_unknown_or_non_string_profile_is_rejected(self):
+        for profile in ('thorough', ['fast'], {'name': 'fast'}, 3):
+            response = self.client.post('/api/detect', json={'text': TEXT, 'profile': profile})
+            self.assertEqual(response.status_code, 400, profile)
+            response = self.client.post('/api/detect/batch', json={'texts': [TEXT], 'profile': profile})
+            self.assertEqual(response.status_code, 400, profile)
+
+    def test_known_profile(self):
+        with mock.patch.object(self.detector, 'predict', wraps=self.detector.predict) as predict:
+            response = self.client.post('/api/detect', json={'text': TEXT, 'profile': 'fast'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(predict.call_args.kwargs['profile'], 'fast')
+
+class TestHealth(AppTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(self.app_module.component_status,
+                                  {'detector': 'starting', 'model': 'starting', 'database': 'starting'})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app_module.detector = None
+
+    def test_healthz_answers_while_starting(self):
+        response = self.client.get('/healthz')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['components']['detector'], 'starting')
+
+    def test_readyz_follows_detector_warm_up(self):
+        response = self.client.get('/readyz')
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.get_json()['ready'])
+
+        # The model keeps loading after the rule-based detector is ready
+        model_loading = threading.Event()
+        release_model = threading.Event()
+        instance = FakeNewsDetector(load_model=False, executor_mode='thread')
+
+        def load_model():
+            model_loading.set()
+            release_model.wait(5)
+
+        instance.load_model = load_model
+        with mock.patch.object(self.app_module, 'FakeNewsDetector', return_value=instance):
+            thread = threading.Thread(target=self.app_module.initialize_detector, daemon=True)
+            thread.start()
+            self.assertTrue(model_loading.wait(5))
+
+            response = self.client.get('/readyz')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['components']['model'], 'starting')
+            self.assertIs(self.app_module.detector, instance)
+
+            release_model.set()
+            thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertNotEqual(self.app_module.component_status['model'], 'starting')
+        self.assertEqual(self.client.get('/readyz').status_code, 200)
+
+    def test_detect_during_warm_up_uses_fallback_analysis(self):
+        response = self.client.post('/api/detect', json={'text': TEXT})
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertIn(body['prediction'], ('fake', 'real'))
+        self.assertIn('note', body['creative_analysis'])
+
+        self.app_module.detector = self.detector
+        body = self.client.post('/api/detect', json={'text': TEXT}).get_json()
+        self.assertNotIn('note', body['creative_analysis'])
+
+FAKE_TEXT = ("SHOCKING!!! You won't believe what THEY don't want you to know!!! Doctors hate this secret cure!!! "
+             "Share before it gets deleted!!!")
+
+class TestBatchEndpoint(AppTestCase):
+
+    def test_results_follow_input_order(self):
+        texts = [FAKE_TEXT, TEXT, {'text': FAKE_TEXT}, TEXT + " Officials will publish the report."]
+        response = self.client.post('/api/detect/batch', json=texts)
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual((body['count'], body['errors']), (4, 0))
+        self.assertEqual([item['index'] for item in body['results']], [0, 1, 2, 3])
+        for text, item in zip([FAKE_TEXT, TEXT, FAKE_TEXT, texts[3]], body['results']):
+            self.assertEqual(item['prediction'], self.detector.predict(text)['prediction'])
+        self.assertEqual(body['results'][0]['prediction'], 'fake')
+        self.assertEqual(body['results'][1]['prediction'], 'real')
+
+    def test_invalid_items_get_per_item_errors(self):
+        response = self.client.post('/api/detect/batch', json={'texts': [TEXT, 3, None, '  ', ['x'], {'text': 7}]})
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body['errors'], 5)
+        self.assertNotIn('error', body['results'][0])
+        for item in body['results'][1:]:
+            self.assertEqual(item['error'], 'No text provided')
+        self.assertEqual([item['index'] for item in body['results']], list(range(6)))
+
+    def test_non_list_input_is_rejected(self):
+        for payload in ({'texts': TEXT}, {'text': TEXT}, TEXT, [], {'texts': []}, 3):
+            response = self.client.post('/api/detect/batch', json=payload)
+            self.assertEqual(response.status_code, 400, payload)
+        response = self.client.post('/api/detect/batch', data='not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_too_many_items(self):
+        with mock.patch.object(Config, 'MAX_BATCH_ITEMS', 3):
+            response = self.client.post('/api/detect/batch', json=[TEXT] * 4)
+            self.assertEqual(response.status_code, 413)
+            self.assertEqual(self.client.post('/api/detect/batch', json=[TEXT] * 3).status_code, 200)
+
+class TestDecisionFields(AppTestCase):
+
+    def test_detect_reports_profile_and_deciding_tier(self):
+        body = self.client.post('/api/detect', json={'text': TEXT, 'profile': 'fast'}).get_json()
+        self.assertEqual((body['profile'], body['decided_by']), ('fast', 'rules'))
+        self.assertNotIn('cascade', body)
+
+        body = self.client.post('/api/detect', json={'text': TEXT, 'cascade': True}).get_json()
+        self.assertEqual(body['decided_by'], 'rules')
+        self.assertIn('rule_score', body['cascade'])
+
+        body = self.client.post('/api/detect', json={'text': TEXT, 'profile': 'full'}).get_json()
+        self.assertTrue(body['model_unavailable'])
+
+    def test_detect_reports_missing_statistical_model(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        detector.config.STATISTICAL_MODEL_DIR = os.path.join(directory.name, 'statistical')
+        self.app_module.detector = detector
+
+        body = self.client.post('/api/detect', json={'text': TEXT, 'profile': 'statistical'}).get_json()
+        self.assertTrue(body['statistical_unavailable'])
+        body = self.client.post('/api/detect', json={'text': TEXT}).get_json()
+        self.assertNotIn('statistical_unavailable', body)
+
+    def test_batch_reports_near_duplicates(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        detector.config.NEAR_DUPLICATE_ENABLED = True
+        detector.config.NEAR_DUPLICATE_INDEX_PATH = os.path.join(directory.name, 'index.npz')
+        self.app_module.detector = detector
+
+        self.client.post('/api/detect', json={'text': article(1)})
+        body = self.client.post('/api/detect/batch', json=[repost(article(1)), article(2)]).get_json()
+        first, second = body['results']
+        self.assertEqual(first['decided_by'], 'near_duplicate')
+        self.assertGreaterEqual(first['near_duplicate']['similarity'], 0.8)
+        self.assertEqual(second['decided_by'], 'rules')
+        self.assertNotIn('near_duplicate', second)
+
+class TestAdminEndpoints(AppTestCase):
+
+    def post_feedback(self, **headers):
+        return self.client.post('/api/feedback', json={'text': TEXT, 'label': 'fake'}, headers=headers)
+
+    def test_feedback_disabled_by_default(self):
+        with mock.patch.object(Config, 'ADMIN_TOKEN', 'secret'):
+            self.assertEqual(self.post_feedback(**{'X-Admin-Token': 'secret'}).status_code, 403)
+
+    def test_feedback_requires_the_shared_secret(self):
+        with mock.patch.object(self.detector, 'update_statistical_model', return_value={'examples': 1}) as update, \
+                mock.patch.object(Config, 'FEEDBACK_ENABLED', True):
+            # No secret configured: nothing gets through
+            self.assertEqual(self.post_feedback(**{'X-Admin-Token': ''}).status_code, 401)
+            with mock.patch.object(Config, 'ADMIN_TOKEN', 'secret'):
+                self.assertEqual(self.post_feedback().status_code, 401)
+                self.assertEqual(self.post_feedback(**{'X-Admin-Token': 'guess'}).status_code, 401)
+                update.assert_not_called()
+                self.assertEqual(self.post_feedback(**{'X-Admin-Token': 'secret'}).status_code, 200)
+                update.assert_called_once()
+
+    def test_metrics_config_is_read_only_by_default(self):
+        enabled = self.detector.metrics.enabled
+        self.addCleanup(setattr, self.detector.metrics, 'enabled', enabled)
+        with mock.patch.object(Config, 'ADMIN_TOKEN', 'secret'):
+            response = self.client.post('/metrics/config', json={'enabled': not enabled},
+                                        headers={'X-Admin-Token': 'secret'})
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(self.detector.metrics.enabled, enabled)
+            self.assertEqual(self.client.get('/metrics/config').get_json()['enabled'], enabled)
+
+    def test_metrics_config_requires_the_shared_secret(self):
+        enabled = self.detector.metrics.enabled
+        self.addCleanup(setattr, self.detector.metrics, 'enabled', enabled)
+        with mock.patch.object(Config, 'METRICS_CONFIG_WRITABLE', True), \
+                mock.patch.object(Config, 'ADMIN_TOKEN', 'secret'):
+            for headers in ({}, {'X-Admin-Token': 'guess'}):
+                response = self.client.post('/metrics/config', json={'enabled': not enabled}, headers=headers)
+                self.assertEqual(response.status_code, 401)
+            self.assertEqual(self.detector.metrics.enabled, enabled)
+            response = self.client.post('/metrics/config', json={'enabled': not enabled},
+                                        headers={'X-Admin-Token': 'secret'})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['enabled'], not enabled)
+
+class TestTimings(AppTestCase):
+
+    def test_timings_block(self):
+        self.detector.cache.clear()
+        response = self.client.post('/api/detect', json={'text': TEXT, 'timings': True})
+        self.assertEqual(response.status_code, 200)
+        timings = response.get_json()['timings']
+        self.assertFalse(timings['cache_hit'])
+        for stage in ('total', 'cache_lookup', 'assemble', 'google_search'):
+            self.assertGreaterEqual(timings[stage], 0.0, stage)
+
+        response = self.client.post('/api/detect?timings=1', json={'text': TEXT})
+        self.assertTrue(response.get_json()['timings']['cache_hit'])
+
+        response = self.client.post('/api/detect', json={'text': TEXT})
+        self.assertNotIn('timings', response.get_json())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.backends import ClassifierBackend, WindowPolicy, check_parity, create_backend
+
+class FixedLogitsBackend(ClassifierBackend):
+    """Backend whose logits depend only on text length; no tokenizer needed"""
+
+    def __init__(self, activation='softmax', flip_long=False):
+        super().__init__(None, {0: 'NEGATIVE', 1: 'POSITIVE'}, activation)
+        self.flip_long = flip_long
+        self.batches = []
+
+    def logits(self, texts):
+        self.batches.append(len(texts))
+        rows = []
+        for text in texts:
+            positive = len(text) % 2 == 0
+            if self.flip_long and len(text) > 10:
+                positive = not positive
+            rows.append([0.0, 2.0] if positive else [2.0, 0.0])
+        return np.array(rows)
+
+class CharTokenizer:
+    """One token per character; 1 and 2 act as CLS/SEP"""
+
+    def __call__(self, texts, add_special_tokens=True, truncation=False):
+        return {'input_ids': [[ord(char) for char in text] for text in texts]}
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 2
+
+    def build_inputs_with_special_tokens(self, ids):
+        return [1] + list(ids) + [2]
+
+    def pad(self, encoded, return_tensors=None):
+        rows = encoded['input_ids']
+        width = max(len(row) for row in rows)
+        return {'input_ids': np.array([row + [0] * (width - len(row)) for row in rows])}
+
+class WindowedBackend(ClassifierBackend):
+    """Confidently positive for windows containing an 'x'; records window batches"""
+
+    def __init__(self, policy, max_length=12):
+        super().__init__(CharTokenizer(), {0: 'NEGATIVE', 1: 'POSITIVE'}, 'softmax', max_length, policy)
+        self.window_batches = []
+
+    def forward(self, encoded):
+        ids = encoded['input_ids']
+        self.window_batches.append(ids.shape)
+        return np.array([[0.0, 8.0] if ord('x') in row else [2.0, 0.0] for row in ids])
+
+class TestClassifierBackend(unittest.TestCase):
+
+    def test_pipeline_compatible_output(self):
+        """Labels and softmax scores in the transformers pipeline format"""
+        backend = FixedLogitsBackend()
+        predictions = backend(['ab', 'abc', 'abcd'], batch_size=2)
+        self.assertEqual([p['label'] for p in predictions], ['POSITIVE', 'NEGATIVE', 'POSITIVE'])
+        self.assertAlmostEqual(predictions[0]['score'], 1 / (1 + np.exp(-2.0)))
+        self.assertEqual(backend.batches, [2, 1])
+
+    def test_sigmoid_activation(self):
+        predictions = FixedLogitsBackend('sigmoid')(['ab'])
+        self.assertAlmostEqual(predictions[0]['score'], 1 / (1 + np.exp(-2.0)))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            create_backend('tensorrt', 'model')
+
+class TestWindowPolicy(unittest.TestCase):
+
+    def test_spans_cover_text_with_overlap(self):
+        self.assertEqual(WindowPolicy(overlap=2).spans(26, 10), [(0, 10), (8, 18), (16, 26)])
+        self.assertEqual(WindowPolicy(overlap=2).spans(5, 10), [(0, 5)])
+
+    def test_budget_selection(self):
+        """head_tail keeps lede and conclusion, even spreads the budget"""
+        self.assertEqual(WindowPolicy(overlap=2, max_windows=3).spans(40, 10), [(0, 10), (8, 18), (30, 40)])
+        self.assertEqual(WindowPolicy(overlap=2, max_windows=3, selection='even').spans(40, 10),
+                         [(0, 10), (16, 26), (30, 40)])
+
+    def test_windows_of_all_texts_share_a_batch(self):
+        backend = WindowedBackend(WindowPolicy(overlap=0, max_windows=4, aggregation='max'))
+        texts = ['a' * 50 + 'x', 'short', 'a' * 30]
+        predictions = backend(texts)
+        self.assertEqual([p['label'] for p in predictions], ['POSITIVE', 'NEGATIVE', 'NEGATIVE'])
+        # 4 (budget) + 1 + 3 windows of at most 10 content tokens each, one forward pass
+        self.assertEqual(backend.window_batches, [(8, 12)])
+
+    def test_tail_beyond_max_length_is_seen(self):
+        """Plain truncation would miss the marker at the end of the text"""
+        text = 'a' * 100 + 'x'
+        chunked = WindowedBackend(WindowPolicy(max_windows=2, aggregation='max'))
+        self.assertEqual(chunked([text])[0]['label'], 'POSITIVE')
+
+class TestParity(unittest.TestCase):
+
+    def test_agreement(self):
+        texts = ['a' * length for length in range(1, 21)]
+        report = check_parity(FixedLogitsBackend(), FixedLogitsBackend(flip_long=True), texts, batch_size=4)
+        self.assertEqual(report['samples'], 20)
+        self.assertEqual(report['mismatches'], list(range(10, 20)))
+        self.assertAlmostEqual(report['agreement'], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import sys
+import os
+
+# Add repository root to path so the benchmarks package and src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.corpus import SIZE_CLASSES, generate_corpus
+from benchmarks.run_benchmarks import compare, measure
+
+class TestBenchmarkCorpus(unittest.TestCase):
+
+    def test_corpus_is_deterministic(self):
+        """Same seed and size class always produce the same documents"""
+        self.assertEqual(generate_corpus('short', 5, seed=7), generate_corpus('short', 5, seed=7))
+        self.assertNotEqual(generate_corpus('short', 5, seed=7), generate_corpus('short', 5, seed=8))
+
+    def test_document_sizes(self):
+        """Documents are close to the requested size class"""
+        for size_class in ('tweet', 'article'):
+            for document in generate_corpus(size_class, 3):
+                self.assertLessEqual(len(document), SIZE_CLASSES[size_class])
+                self.assertGreater(len(document), SIZE_CLASSES[size_class] * 0.8)
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_measure_reports_percentiles(self):
+        stats = measure(len, ['a', 'bb'], min_iterations=10, min_time=0, warmup=1)
+        self.assertEqual(stats['iterations'], 10)
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+        self.assertGreater(stats['docs_per_sec'], 0)
+
+    def test_compare_flags_regressions(self):
+        """Only changes beyond the threshold are reported"""
+        baseline = {'results': {'bench': {'tweet': {'p50_ms': 1.0, 'p99_ms': 2.0, 'docs_per_sec': 1000.0}}}}
+        unchanged = {'results': {'bench': {'tweet': {'p50_ms': 1.1, 'p99_ms': 2.1, 'docs_per_sec': 950.0}}}}
+        slower = {'results': {'bench': {'tweet': {'p50_ms': 1.5, 'p99_ms': 2.0, 'docs_per_sec': 700.0}}}}
+
+        self.assertEqual(compare(unchanged, baseline, threshold=0.15), [])
+        metrics = {item['metric'] for item in compare(slower, baseline, threshold=0.15)}
+        self.assertEqual(metrics, {'p50_ms', 'docs_per_sec'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+from src.models.fake_news_detector import FakeNewsDetector
+from src.models.inference_server import BatchingInferenceServer
+
+DECISIVE = ("According to Reuters, officials confirmed on March 3, 2024 that 120 residents were evacuated. "
+            "\"We acted quickly,\" the mayor said in a statement.")
+UNCERTAIN = "plain words without any signal"
+
+class RecordingClassifier:
+    """Gives every text the same label (POSITIVE, score 0.9 by default) and records the batches it receives"""
+
+    def __init__(self, label='POSITIVE', score=0.9):
+        self.batches = []
+        self.output = {'label': label, 'score': score}
+
+    def __call__(self, texts, batch_size=None, **kwargs):
+        self.batches.append(list(texts))
+        return [dict(self.output) for _ in texts]
+
+class TestCascade(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        self.detector.cache.enabled = False
+        # Narrow band around the neutral 0.5 rule score of UNCERTAIN
+        self.detector.config.CASCADE_LOWER = 0.49
+        self.detector.config.CASCADE_UPPER = 0.51
+
+    def attach_model(self, **kwargs):
+        self.classifier = RecordingClassifier(**kwargs)
+        self.detector.inference_server = BatchingInferenceServer(self.classifier, batch_size=8, max_wait_ms=0)
+        self.addCleanup(self.detector.inference_server.close)
+        self.detector.model_name = 'recording'
+        self.detector.model_status = 'ready'
+
+    def test_decisive_rule_score_skips_model(self):
+        self.attach_model()
+        result = self.detector.predict(DECISIVE, cascade=True)
+        self.assertEqual(result['decided_by'], 'rules')
+        self.assertFalse(result['cascade']['escalated'])
+        self.assertEqual(self.classifier.batches, [])
+
+    def test_uncertain_rule_score_escalates(self):
+        self.attach_model()
+        result = self.detector.predict(UNCERTAIN, cascade=True, include_timings=True)
+        self.assertEqual(result['decided_by'], 'model')
+        self.assertTrue(result['cascade']['escalated'])
+        self.assertEqual(result['external_verification']['model_score'], 0.9)
+        self.assertIn('model', result['timings'])
+        # The model carries CASCADE_MODEL_WEIGHT of the score: 0.25 * 0.5 + 0.75 * 0.9
+        self.assertAlmostEqual(result['verification_score'], 80.0)
+
+    def test_model_score_decides_escalated_texts(self):
+        rules_only = self.detector.predict(UNCERTAIN, cascade=True)
+        self.assertEqual((rules_only['prediction'], rules_only['status']),
+                         ('fake', 'SUSPICIOUS - REQUIRES VERIFICATION'))
+
+        self.attach_model(label='POSITIVE', score=0.95)
+        result = self.detector.predict(UNCERTAIN, cascade=True)
+        self.assertEqual((result['prediction'], result['status']), ('real', 'AUTHENTIC'))
+
+        self.attach_model(label='NEGATIVE', score=0.95)
+        result = self.detector.predict(UNCERTAIN + ' again', cascade=True)
+        self.assertEqual((result['prediction'], result['status']), ('fake', 'FAKE'))
+
+    def test_batch_escalations_share_one_call(self):
+        self.attach_model()
+        results = self.detector.predict_batch([UNCERTAIN, DECISIVE, UNCERTAIN + ' too'], cascade=True)
+        self.assertEqual([result['decided_by'] for result in results], ['model', 'rules', 'model'])
+        self.assertEqual(len(self.classifier.batches), 1)
+        stats = self.detector.cascade_stats()
+        self.assertEqual(stats['decisions'], {'rules': 1, 'model': 2, 'model_unavailable': 0})
+        self.assertAlmostEqual(stats['escalation_rate'], 2 / 3)
+
+    def test_without_model_rules_decide(self):
+        result = self.detector.predict(UNCERTAIN, cascade=True)
+        self.assertEqual(result['decided_by'], 'rules')
+        self.assertTrue(result['cascade']['model_unavailable'])
+        self.assertEqual(self.detector.cascade_stats()['decisions']['model_unavailable'], 1)
+
+    def test_disabled_by_default(self):
+        result = self.detector.predict(UNCERTAIN)
+        self.assertNotIn('cascade', result)
+        self.assertEqual(result['decided_by'], 'rules')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sys
+import os
+import re
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from algorithms.lexicon_scanner import LexiconScanner
+from utils.document import AnalyzedDocument, as_document
+
+class CountingPattern:
+    """Wraps a compiled pattern and counts findall() calls"""
+
+    def __init__(self, pattern):
+        self.pattern = re.compile(pattern)
+        self.calls = 0
+
+    def findall(self, text):
+        self.calls += 1
+        return self.pattern.findall(text)
+
+    def search(self, text):
+        return self.pattern.search(text)
+
+class TestAnalyzedDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.text = "BREAKING: Officials said 42 people were evacuated. According to Reuters, it was calm!!! Really?"
+        self.document = AnalyzedDocument(self.text)
+
+    def test_views_match_plain_string_operations(self):
+        document = self.document
+        self.assertEqual(document.lower, self.text.lower())
+        self.assertEqual(document.words, self.text.split())
+        self.assertEqual(document.word_count, len(self.text.split()))
+        self.assertEqual(document.sentence_count, len([s for s in self.text.split('.') if s.strip()]))
+        self.assertEqual(document.uppercase_count, len(re.findall(r'[A-Z]', self.text)))
+        self.assertTrue(document.has_digit)
+        self.assertTrue(document.has_uppercase_word)
+
+    def test_views_are_computed_once(self):
+        self.assertIs(self.document.words, self.document.words)
+        pattern = CountingPattern(r'\d+')
+        self.assertEqual(self.document.findall(pattern), ['42'])
+        self.assertEqual(self.document.count(pattern), 1)
+        self.assertTrue(self.document.search(pattern))
+        self.assertEqual(pattern.calls, 1)
+
+    def test_lexicon_scan_is_shared(self):
+        scanner = LexiconScanner({'attribution': ['according to'], 'outlets': ['reuters']})
+        hits = self.document.scan(scanner)
+        self.assertIs(self.document.scan(scanner), hits)
+        self.assertEqual(hits.to_dict(), scanner.scan(self.text).to_dict())
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.document.text = 'changed'
+
+    def test_as_document_and_strip(self):
+        self.assertIs(as_document(self.document), self.document)
+        self.assertEqual(as_document(None).text, '')
+        self.assertIs(self.document.strip(), self.document)
+        self.assertEqual(AnalyzedDocument('  padded  ').strip().text, 'padded')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Cumulative import time allowed for app.py; override on slow CI machines
+IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_TIME_BUDGET_MS', 2000))
+
+# Dependencies that must only be imported by the code paths that use them
+DEFERRED_MODULES = ('torch', 'transformers', 'sklearn', 'textstat', 'nltk', 'numpy', 'scipy')
+
+def run_python(code):
+    env = dict(os.environ, AUTO_INITIALIZE='false', RULES_ONLY='true', NLTK_AUTO_DOWNLOAD='false')
+    return subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+
+def cumulative_import_ms(importtime_output, module):
+    """Cumulative time of a top-level import from `python -X importtime` output"""
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) == 3 and fields[2].strip() == module and fields[1].strip().isdigit():
+            return int(fields[1]) / 1000
+    return None
+
+class TestImportTime(unittest.TestCase):
+
+    def test_app_import_budget(self):
+        result = run_python(
+            "import sys, app\n"
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(result.stdout.strip(), '', 'heavy modules imported by app.py')
+
+        elapsed = cumulative_import_ms(result.stderr, 'app')
+        self.assertIsNotNone(elapsed)
+        self.assertLess(elapsed, IMPORT_BUDGET_MS)
+
+    def test_rules_only_never_imports_torch(self):
+        result = run_python(
+            "import sys\n"
+            "from src.models.fake_news_detector import FakeNewsDetector\n"
+            "detector = FakeNewsDetector()\n"
+            "result = detector.predict('Officials confirmed the report in a statement on Monday. ' * 10)\n"
+            "assert detector.model_status == 'disabled' and 'prediction' in result, result\n"
+            "print(','.join(m for m in ('torch', 'transformers') if m in sys.modules))"
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(result.stdout.strip(), '')
+
+if __name__ == '__main__':
+    unittest.main()
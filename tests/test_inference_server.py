@@ -0,0 +1,145 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from models.inference_server import BatchingInferenceServer
+
+class FakeClassifier:
+    """Records batch sizes and echoes the input text as the label"""
+
+    def __init__(self, delay=0.0, fail_on=None):
+        self.batches = []
+        self.delay = delay
+        self.fail_on = fail_on
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, texts, batch_size=None):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self.batches.append(list(texts))
+            if self.fail_on and self.fail_on in texts:
+                raise ValueError("boom")
+            time.sleep(self.delay)
+            return [{'label': text, 'score': 1.0} for text in texts]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+class TestBatchingInferenceServer(unittest.TestCase):
+
+    def test_results_return_to_callers(self):
+        """Each future receives the output for its own text"""
+        classifier = FakeClassifier()
+        server = BatchingInferenceServer(classifier, batch_size=4, max_wait_ms=20)
+        futures = server.submit_many([f"text {i}" for i in range(10)])
+        self.assertEqual([f.result(timeout=5)['label'] for f in futures],
+                         [f"text {i}" for i in range(10)])
+        self.assertTrue(all(len(batch) <= 4 for batch in classifier.batches))
+        server.close()
+
+    def test_concurrent_callers_are_batched(self):
+        """Concurrent calls share forward passes and never run them in parallel"""
+        classifier = FakeClassifier(delay=0.01)
+        server = BatchingInferenceServer(classifier, batch_size=8, max_wait_ms=50)
+        results = {}
+
+        def call(i):
+            results[i] = server.predict(f"item {i}", timeout=5)['label']
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {i: f"item {i}" for i in range(32)})
+        self.assertLess(len(classifier.batches), 32)
+        self.assertEqual(classifier.max_active, 1)
+        self.assertEqual(server.stats()['requests'], 32)
+        server.close()
+
+    def test_length_bucketing(self):
+        """Texts of one batch are sorted by length before the forward pass"""
+        classifier = FakeClassifier()
+        server = BatchingInferenceServer(classifier, batch_size=4, max_wait_ms=100)
+        texts = ["a b c d e f", "a", "a b c d e", "a b"]
+        futures = server.submit_many(texts)
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(classifier.batches, [["a", "a b", "a b c d e", "a b c d e f"]])
+        server.close()
+
+    def test_buckets_reduce_padding(self):
+        """A queued window is split into length buckets, each its own forward pass"""
+        entered, gate = threading.Event(), threading.Event()
+        classifier = FakeClassifier()
+        original = classifier.__call__
+
+        def call(texts, batch_size=None):
+            entered.set()
+            gate.wait(5)
+            return original(texts, batch_size)
+
+        server = BatchingInferenceServer(call, batch_size=4, max_wait_ms=0)
+        # The worker is held in the first forward pass while the mixed workload queues up
+        first = server.submit("warm up")
+        self.assertTrue(entered.wait(5))
+        lengths = [40, 1500, 60, 1800, 30, 2000, 50, 1900]
+        texts = [("w" * length)[:length] for length in lengths]
+        futures = server.submit_many(texts)
+        gate.set()
+        first.result(timeout=5)
+        self.assertEqual([f.result(timeout=5)['label'] for f in futures], texts)
+
+        def padding(batches):
+            return sum(max(map(len, batch)) * len(batch) - sum(map(len, batch)) for batch in batches)
+
+        batches = classifier.batches[1:]
+        self.assertEqual(sorted(map(len, batches)), [4, 4])
+        self.assertEqual({max(map(len, batch)) for batch in batches}, {60, 2000})
+        # Arrival order in batches of four pads every short text to ~2000 characters
+        arrival = [texts[:4], texts[4:]]
+        self.assertLess(padding(batches), padding(arrival) / 5)
+        server.close()
+
+    def test_full_batch_runs_before_deadline(self):
+        """A full batch does not wait for the max-wait deadline"""
+        classifier = FakeClassifier()
+        server = BatchingInferenceServer(classifier, batch_size=4, max_wait_ms=5000)
+        started = time.monotonic()
+        futures = server.submit_many([f"text {i}" for i in range(8)])
+        for future in futures:
+            future.result(timeout=5)
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual([len(batch) for batch in classifier.batches], [4, 4])
+        server.close()
+
+    def test_errors_propagate_per_batch(self):
+        """A failing batch fails only its own futures"""
+        classifier = FakeClassifier(fail_on="bad")
+        server = BatchingInferenceServer(classifier, batch_size=1, max_wait_ms=0)
+        bad = server.submit("bad")
+        good = server.submit("good")
+        with self.assertRaises(ValueError):
+            bad.result(timeout=5)
+        self.assertEqual(good.result(timeout=5)['label'], "good")
+        server.close()
+
+    def test_closed_server_rejects_work(self):
+        """Submitting after close fails immediately"""
+        server = BatchingInferenceServer(FakeClassifier())
+        server.close()
+        with self.assertRaises(RuntimeError):
+            server.predict("late", timeout=1)
+
+if __name__ == '__main__':
+    unittest.main()
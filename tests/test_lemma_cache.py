@@ -0,0 +1,111 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.lemma_cache import LemmaCache, load_lemma_table, save_lemma_table
+from utils.text_preprocessor import TextPreprocessor
+
+class CountingLemmatizer:
+    """Strips a plural 's' and counts how often it is called"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def lemmatize(self, token):
+        self.calls += 1
+        return token[:-1] if token.endswith('s') else token
+
+class TestLemmaCache(unittest.TestCase):
+
+    def setUp(self):
+        self.lemmatizer = CountingLemmatizer()
+        self.cache = LemmaCache(self.lemmatizer.lemmatize, stop_words={'the', 'was'}, max_entries=4)
+
+    def test_memoized_lookup(self):
+        """Repeated tokens hit the cache; stopwords and short lemmas resolve to ''"""
+        self.assertEqual(self.cache.resolve_all(['reports', 'the', 'reports', 'its', 'report']),
+                         ['report', 'report', 'report'])
+        self.assertEqual(self.lemmatizer.calls, 3)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 4))
+
+    def test_bounded(self):
+        """A full cache evicts its least recently used learned token"""
+        self.cache.resolve_all(['alpha', 'bravo', 'charlie', 'delta', 'alpha', 'echos', 'echos'])
+        self.assertEqual(len(self.cache), 4)
+        self.assertEqual(self.cache.stats()['evicted'], 1)
+        calls = self.lemmatizer.calls
+        self.assertEqual(self.cache.resolve_all(['alpha', 'echos']), ['alpha', 'echo'])
+        self.assertEqual(self.lemmatizer.calls, calls)
+        self.cache.resolve('bravo')
+        self.assertEqual(self.lemmatizer.calls, calls + 1)
+
+    def test_seeded_entries_are_pinned(self):
+        self.cache.seed([('officials', 'official'), ('reports', 'report')])
+        self.cache.resolve_all(['alpha', 'bravo', 'charlie', 'delta'])
+        self.assertEqual(len(self.cache), 4)
+        calls = self.lemmatizer.calls
+        self.assertEqual(self.cache.resolve_all(['officials', 'reports']), ['official', 'report'])
+        self.assertEqual(self.lemmatizer.calls, calls)
+
+    def test_seeded_entries_are_interned(self):
+        self.cache.seed([('officials', 'official'), ('the', 'the')])
+        self.assertEqual(self.cache.resolve('officials'), 'official')
+        self.assertEqual(self.cache.resolve('the'), '')
+        self.assertEqual(self.lemmatizer.calls, 0)
+        self.assertIs(self.cache.resolve('officials'), sys.intern('official'))
+
+    def test_table_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lemmas.tsv')
+            save_lemma_table(path, [('reports', 'report'), ('geese', 'goose')])
+            self.assertEqual(load_lemma_table(path), [('reports', 'report'), ('geese', 'goose')])
+
+    def test_concurrent_resolution(self):
+        """Threads hitting and evicting the same small cache never lose an entry mid-update"""
+        cache = LemmaCache(self.lemmatizer.lemmatize, max_entries=8)
+        tokens = [f"token{i % 24}s" for i in range(240)]
+        expected = [token[:-1] for token in tokens]
+        errors = []
+
+        def work(offset):
+            try:
+                for _ in range(100):
+                    batch = tokens[offset:] + tokens[:offset]
+                    if cache.resolve_all(batch) != expected[offset:] + expected[:offset]:
+                        errors.append('wrong lemmas')
+                    cache.resolve(batch[0])
+            except Exception as e:
+                errors.append(repr(e))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        threads = [threading.Thread(target=work, args=(i * 7,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 8)
+
+class TestPreprocessorLemmaCache(unittest.TestCase):
+
+    def test_matches_uncached_pipeline(self):
+        preprocessor = TextPreprocessor(lightweight=True)
+        lemmatizer = CountingLemmatizer()
+        preprocessor.lemmatizer = lemmatizer
+        text = "The officials said reports of the reports were false as officials confirmed"
+
+        uncached = preprocessor.preprocess_tokens(text)
+        preprocessor.lemma_cache = LemmaCache(lemmatizer.lemmatize, preprocessor.stop_words)
+        self.assertEqual(preprocessor.preprocess_tokens(text), uncached)
+        self.assertGreater(preprocessor.lemma_cache.stats()['hit_rate'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
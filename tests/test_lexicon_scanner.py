@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from algorithms.lexicon_scanner import LexiconScanner
+from data.indicator_lexicons import INDICATOR_LEXICONS
+
+class TestLexiconScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.scanner = LexiconScanner({
+            'informal': ['u', 'r', 'gonna'],
+            'attribution': ['according to', 'reported by'],
+            'domains': ['reuters.com']
+        })
+
+    def test_word_boundaries(self):
+        """Short entries do not match inside other words"""
+        hits = self.scanner.scan("Your report is truly useful")
+        self.assertEqual(hits.count('informal'), 0)
+
+        hits = self.scanner.scan("u r gonna love it")
+        self.assertEqual(hits.count('informal'), 3)
+
+    def test_inflected_forms_match(self):
+        """Longer phrases match as substrings, so plurals and suffixes still count"""
+        scanner = LexiconScanner({'keywords': ['government', 'election', 'hoax', 'urgent']})
+        hits = scanner.scan("Elections and governments: hoaxes everywhere, urgently.")
+        self.assertEqual(hits.count('keywords'), 4)
+
+    def test_matches_baseline_substring_checks(self):
+        """Except for abbreviations, counts equal the `phrase in text` checks they replace"""
+        scanner = LexiconScanner(INDICATOR_LEXICONS)
+        text = "elections and governments: hoaxes everywhere, urgently. officials reported the pandemics"
+        hits = scanner.scan(text)
+        for category, phrases in INDICATOR_LEXICONS.items():
+            expected = sum(1 for phrase in phrases if phrase in text and len(phrase) > 2)
+            self.assertEqual(hits.count(category), expected, category)
+
+    def test_counts_and_offsets(self):
+        """Counts are distinct phrases, totals are occurrences"""
+        text = "According to Reuters.com, as reported by AP and according to BBC"
+        hits = self.scanner.scan(text)
+        self.assertEqual(hits.count('attribution'), 2)
+        self.assertEqual(hits.total('attribution'), 3)
+        self.assertEqual(hits.offsets('attribution')['according to'], [0, 48])
+        self.assertTrue(hits.has('reuters.com'))
+        self.assertEqual(hits.to_dict()['attribution']['occurrences'], 3)
+
+    def test_any_within(self):
+        """Window checks mirror slicing of the lowercased text"""
+        text = "According to officials " + "x " * 200 + "as reported by staff"
+        hits = self.scanner.scan(text)
+        self.assertTrue(hits.any_within('attribution', 0, 200))
+        self.assertTrue(hits.any_within('attribution', -30))
+        self.assertFalse(hits.any_within('attribution', 30, 300))
+
+    def test_matches_substring_semantics_on_whole_words(self):
+        """On whole-word text, counts agree with plain substring checks"""
+        scanner = LexiconScanner(INDICATOR_LEXICONS)
+        text = ("according to officials the deep state hoax is going viral today ; "
+                "however reuters and bbc news reported by the government disagree")
+        hits = scanner.scan(text)
+        for category, phrases in INDICATOR_LEXICONS.items():
+            expected = sum(1 for phrase in phrases if f' {phrase} ' in f' {text} ')
+            self.assertEqual(hits.count(category), expected, category)
+
+if __name__ == '__main__':
+    unittest.main()
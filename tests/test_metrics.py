@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.metrics import _NOOP_TIMER, LatencyHistogram, StageMetrics
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def setUp(self):
+        self.histogram = LatencyHistogram(buckets=(2.0, 1.0))
+        for seconds in (0.5, 0.5, 1.5, 3.0):
+            self.histogram.observe(seconds)
+
+    def test_bucket_placement(self):
+        """Bounds are sorted and inclusive (Prometheus 'le'); values above the last go to overflow"""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 1.0, 5.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.buckets, (0.1, 1.0))
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['counts'], [2, 2, 1])
+        self.assertEqual(snapshot['count'], 5)
+        self.assertAlmostEqual(snapshot['sum'], 6.65)
+
+    def test_quantile_interpolates_inside_bucket(self):
+        self.assertAlmostEqual(self.histogram.quantile(0.25), 0.5)
+        self.assertAlmostEqual(self.histogram.quantile(0.5), 1.0)
+        self.assertAlmostEqual(self.histogram.quantile(0.625), 1.5)
+
+    def test_quantile_in_overflow_bucket_is_last_bound(self):
+        self.assertEqual(self.histogram.quantile(0.9), 2.0)
+        self.assertEqual(self.histogram.quantile(1.0), 2.0)
+
+    def test_empty_quantile(self):
+        self.assertEqual(LatencyHistogram().quantile(0.99), 0.0)
+
+class TestStageMetrics(unittest.TestCase):
+
+    def test_disabled_returns_noop_timer(self):
+        metrics = StageMetrics(enabled=False)
+        self.assertIs(metrics.timer('rules'), _NOOP_TIMER)
+        with metrics.timer('rules'):
+            pass
+        self.assertIsNone(metrics.histogram('rules'))
+
+        # Per-call timings are still recorded, without touching the histograms
+        timings = {}
+        with metrics.timer('rules', timings):
+            pass
+        self.assertIn('rules', timings)
+        self.assertIsNone(metrics.histogram('rules'))
+
+        metrics.enabled = True
+        self.assertIsNot(metrics.timer('rules'), _NOOP_TIMER)
+        with metrics.timer('rules'):
+            pass
+        self.assertEqual(metrics.histogram('rules').snapshot()['count'], 1)
+        self.assertEqual(metrics.summary()['rules']['count'], 1)
+
+    def test_prometheus_format(self):
+        metrics = StageMetrics(buckets=(0.1, 1.0))
+        metrics.observe('model', 0.05)
+        metrics.observe('model', 0.5)
+        metrics.observe('model', 2.0)
+        metrics.observe('assemble', 0.01)
+        lines = metrics.render_prometheus().splitlines()
+        self.assertEqual(lines[:2], ['# HELP fnd_stage_latency_seconds Latency of FakeNewsDetector.predict stages',
+                                     '# TYPE fnd_stage_latency_seconds histogram'])
+        # Stages in name order; bucket counts are cumulative
+        self.assertEqual(lines[7:], [
+            'fnd_stage_latency_seconds_bucket{stage="model",le="0.1"} 1',
+            'fnd_stage_latency_seconds_bucket{stage="model",le="1.0"} 2',
+            'fnd_stage_latency_seconds_bucket{stage="model",le="+Inf"} 3',
+            'fnd_stage_latency_seconds_sum{stage="model"} 2.55',
+            'fnd_stage_latency_seconds_count{stage="model"} 3'
+        ])
+        self.assertTrue(lines[2].startswith('fnd_stage_latency_seconds_bucket{stage="assemble"'))
+
+if __name__ == '__main__':
+    unittest.main()
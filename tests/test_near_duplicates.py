@@ -0,0 +1,156 @@
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+from src.cli.__main__ import main as cli_main
+from src.models.fake_news_detector import FakeNewsDetector
+from src.utils.near_duplicates import NearDuplicateIndex, build_index
+from src.utils.result_cache import text_key
+from src.utils.text_preprocessor import TextPreprocessor
+
+WORDS = ("senate vaccine budget minister election protest climate report border market "
+         "hospital court police energy school river airport factory farmer union").split()
+
+def article(seed, length=120):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(WORDS) + rng.choice(['', 's', 'ed', 'ing']) for _ in range(length)) + '.'
+
+def repost(text):
+    """A lightly edited copy: new headline, hashtags and a tracking URL"""
+    return "SHOCKING: you need to read this!\n" + text + " #viral #share https://t.co/x1?utm_source=feed"
+
+class TestNearDuplicateIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.preprocessor = TextPreprocessor(lightweight=True)
+        self.index = NearDuplicateIndex(threshold=0.8, preprocessing='lightweight')
+
+    def add(self, text, prediction='fake'):
+        signature = self.index.signature(self.preprocessor.preprocess_tokens(text))
+        return self.index.add(text_key(text), signature, {'prediction': prediction, 'confidence': 0.9})
+
+    def query(self, text):
+        return self.index.query(self.index.signature(self.preprocessor.preprocess_tokens(text)))
+
+    def test_reposts_match_and_unrelated_texts_do_not(self):
+        for seed in range(50):
+            self.add(article(seed), 'fake' if seed % 2 else 'real')
+        similarity, verdict = self.query(repost(article(7)))
+        self.assertGreaterEqual(similarity, 0.8)
+        self.assertEqual(verdict['prediction'], 'fake')
+        self.assertIsNone(self.query(article(1000)))
+        # Two halves of different articles share too few shingles with either
+        self.assertIsNone(self.query(article(3)[:400] + ' ' + article(4)[400:]))
+        self.assertEqual(self.index.stats()['hits'], 1)
+
+    def test_short_texts_are_not_indexed(self):
+        self.assertFalse(self.add("vaccines cause autism"))
+        self.assertIsNone(self.query("vaccines cause autism"))
+        self.assertEqual(len(self.index), 0)
+
+    def test_same_key_replaces_verdict_and_oldest_entries_are_evicted(self):
+        index = NearDuplicateIndex(max_entries=3)
+        self.index = index
+        self.add(article(0), 'fake')
+        self.add(article(0), 'real')
+        self.assertEqual(len(index), 1)
+        self.assertEqual(self.query(article(0))[1]['prediction'], 'real')
+        for seed in range(1, 4):
+            self.add(article(seed))
+        self.assertEqual(len(index), 3)
+        self.assertIsNone(self.query(article(0)))
+        self.assertIsNotNone(self.query(article(3)))
+
+    def test_save_and_load(self):
+        for seed in range(20):
+            self.add(article(seed), 'fake' if seed % 2 else 'real')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.npz')
+            self.index.save(path)
+            loaded = NearDuplicateIndex.load(path, threshold=0.8, max_entries=10, preprocessing='lightweight')
+            with self.assertRaises(ValueError):
+                NearDuplicateIndex.load(path, preprocessing='lemmatized')
+        # A smaller bound keeps the newest entries
+        self.assertEqual(len(loaded), 10)
+        self.index = loaded
+        self.assertEqual(self.query(repost(article(13)))[1]['prediction'], 'fake')
+        self.assertIsNone(self.query(article(5)))
+
+    def test_build_index_from_stored_predictions(self):
+        records = [{'text': article(seed), 'prediction': 'fake', 'confidence': 0.8} for seed in range(5)]
+        records += [{'text': 'too short', 'prediction': 'real'}, {'text': article(9)}]
+        index, indexed = build_index(records, self.preprocessor)
+        self.assertEqual(indexed, 5)
+        self.index = index
+        self.assertEqual(self.query(repost(article(2)))[1], {'prediction': 'fake', 'confidence': 0.8})
+
+class TestNearDuplicateDetector(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'near_duplicates.npz')
+        self.detector = self.make_detector()
+
+    def make_detector(self):
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        detector.config.NEAR_DUPLICATE_ENABLED = True
+        detector.config.NEAR_DUPLICATE_INDEX_PATH = self.path
+        return detector
+
+    def test_repost_reuses_verdict(self):
+        original = self.detector.predict(article(1))
+        self.assertEqual(original['decided_by'], 'rules')
+
+        result = self.detector.predict(repost(article(1)), include_timings=True)
+        self.assertEqual(result['decided_by'], 'near_duplicate')
+        self.assertEqual(result['prediction'], original['prediction'])
+        self.assertEqual(result['verification_score'], original['verification_score'])
+        self.assertGreaterEqual(result['near_duplicate']['similarity'], 0.8)
+        self.assertIn('near_duplicate_lookup', result['timings'])
+
+        # Exact repeats still come from the result cache with the full result
+        self.assertEqual(self.detector.predict(article(1))['decided_by'], 'rules')
+        self.assertEqual(self.detector.predict(article(2))['decided_by'], 'rules')
+
+    def test_batch_and_cascade_reuse_verdicts(self):
+        self.detector.predict(article(1))
+        results = self.detector.predict_batch([repost(article(1)), article(2)])
+        self.assertEqual([result['decided_by'] for result in results], ['near_duplicate', 'rules'])
+        result = self.detector.predict(repost(article(2)), cascade=True)
+        self.assertEqual(result['decided_by'], 'near_duplicate')
+
+    def test_disabled_by_default_and_saved_on_close(self):
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        self.assertIsNone(detector.near_duplicates)
+        detector.predict(article(1))
+        self.assertEqual(detector.predict(repost(article(1)))['decided_by'], 'rules')
+
+        self.detector.predict(article(1))
+        self.detector.close()
+        restarted = self.make_detector()
+        self.assertEqual(len(restarted.near_duplicates), 1)
+        self.assertEqual(restarted.predict(repost(article(1)))['decided_by'], 'near_duplicate')
+
+    def test_build_command(self):
+        history = os.path.join(os.path.dirname(self.path), 'predictions.jsonl')
+        with open(history, 'w') as f:
+            for seed in range(3):
+                f.write(json.dumps({'text': article(seed), 'prediction': 'fake', 'confidence': 0.9}) + '\n')
+            f.write('not json\n')
+        self.assertEqual(cli_main(['build-duplicate-index', '--input', history, '--output', self.path]), 0)
+
+        # The command preprocesses like a detector built from the same Config
+        result = self.detector.predict(repost(article(2)))
+        self.assertEqual(result['decided_by'], 'near_duplicate')
+        self.assertEqual(result['prediction'], 'fake')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+# Add the repository root to path for src.* imports
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+
+from src.utils import nltk_resources
+
+class TestNltkResources(unittest.TestCase):
+
+    def test_no_download_at_import(self):
+        """Importing the NLTK users must not reach for the network"""
+        code = (
+            "import nltk\n"
+            "def fail(*args, **kwargs): raise SystemExit('nltk.download called at import')\n"
+            "nltk.download = fail\n"
+            "import src.utils.text_preprocessor\n"
+            "import src.models.fake_news_detector\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+
+    def test_pack_and_unpack_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source')
+            os.makedirs(os.path.join(source, 'corpora', 'stopwords'))
+            with open(os.path.join(source, 'corpora', 'stopwords', 'english'), 'w') as f:
+                f.write('the\nand\n')
+
+            archive = os.path.join(directory, 'dist', 'nltk_data.tar.gz')
+            nltk_resources.pack(source, archive)
+            target = os.path.join(directory, 'target')
+            nltk_resources.unpack(archive, target)
+
+            self.assertTrue(os.path.exists(os.path.join(target, 'corpora', 'stopwords', 'english')))
+            self.assertTrue(nltk_resources.status(['stopwords'], data_dir=target)['stopwords'])
+
+    def test_missing_resource_without_download(self):
+        self.assertFalse(nltk_resources.ensure_resource('no_such_resource', download=False))
+
+if __name__ == '__main__':
+    unittest.main()
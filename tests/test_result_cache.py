@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.result_cache import ShardedLRUCache, TieredResultCache, text_key
+
+class TestResultCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first"""
+        cache = ShardedLRUCache(max_entries=2, shards=1)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        stats = cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_ttl_expiry(self):
+        """Expired entries count as misses"""
+        cache = ShardedLRUCache(max_entries=10, ttl=0.05, shards=2)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        time.sleep(0.1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['expirations'], 1)
+
+    def test_bounded_under_concurrency(self):
+        """Concurrent writers never grow the cache past its bound"""
+        cache = ShardedLRUCache(max_entries=64, shards=8)
+
+        def writer(offset):
+            for i in range(2000):
+                cache.set(text_key(f"{offset}-{i}"), i)
+                cache.get(text_key(f"{offset}-{i // 2}"))
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(len(cache), cache.max_entries)
+
+    def test_tiers_are_independent(self):
+        """Clearing one tier keeps the others"""
+        cache = TieredResultCache(['rules', 'model'], max_entries=10)
+        cache.set('rules', ('v1', 'x'), {'prediction': 'fake'})
+        cache.set('model', ('m', 'x'), 0.3)
+        cache.clear('rules')
+        self.assertIsNone(cache.get('rules', ('v1', 'x')))
+        self.assertEqual(cache.get('model', ('m', 'x')), 0.3)
+        self.assertEqual(set(cache.stats()), {'rules', 'model'})
+
+    def test_disabled_cache(self):
+        """A disabled cache stores nothing"""
+        cache = TieredResultCache(['rules'], enabled=False)
+        cache.set('rules', 'k', 1)
+        self.assertIsNone(cache.get('rules', 'k'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+import sys
+import os
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+import random
+from unittest import mock
+
+import numpy as np
+from scipy import sparse
+
+from src.models.fake_news_detector import FakeNewsDetector
+from src.models.rule_engine import RULE_SETS, LinearRuleEngine
+from src.data.indicator_lexicons import INDICATOR_LEXICONS
+from src.utils.document import AnalyzedDocument
+
+TEXTS = [
+    "According to Reuters, officials confirmed on March 3, 2024 that 120 residents were evacuated. "
+    "\"We acted quickly,\" the mayor said in a statement. https://www.reuters.com/world/evacuation",
+    "SHOCKING!!! You won't believe what THEY don't want you to know!!! Doctors hate this secret cure!!! "
+    "Share before it gets deleted!!! Wake up people???? Is this real???? http://bit.ly/x",
+    "In conclusion, the study published in Nature found a 3.2 percent increase. Researchers at Oxford "
+    "University said the results were peer-reviewed, while critics argued the sample was small. "
+    "Fact check: the viral claim has been debunked by Snopes and PolitiFact.",
+    "lol omg this is sooo crazy u guys, anonymous sources say the election was rigged",
+    "x y z"
+]
+
+FILLER = "the a report said people city on in today new and of officials week".split()
+EXTRAS = ["!!!", "?", "???", "WAKE UP", "\"We will respond,\" she said.", "https://example.com/a",
+          "http://bit.ly/x", "on March 3, 2024", "in 2023", "42 percent", "$1.5 million", "...", "BREAKING"]
+
+def generated_corpus(count=200, seed=0):
+    """Random mixes of lexicon phrases, filler, punctuation, URLs, numbers, dates and quotes"""
+    rng = random.Random(seed)
+    phrases = [phrase for lexicon in INDICATOR_LEXICONS.values() for phrase in lexicon]
+    texts = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 60)):
+            roll = rng.random()
+            if roll < 0.3:
+                parts.append(rng.choice(phrases))
+            elif roll < 0.45:
+                parts.append(rng.choice(EXTRAS))
+            else:
+                parts.append(rng.choice(FILLER))
+            if rng.random() < 0.15:
+                parts[-1] = parts[-1].upper()
+            if rng.random() < 0.1:
+                parts[-1] += '.'
+        texts.append(' '.join(parts))
+    return texts
+
+class TestLinearRuleEngine(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        cls.engine = LinearRuleEngine(cls.detector)
+
+    def documents(self):
+        return [AnalyzedDocument(text) for text in TEXTS]
+
+    def test_reproduces_rule_methods(self):
+        deviations = self.engine.validate(self.documents())
+        self.assertEqual(set(deviations), set(RULE_SETS))
+        for stage, deviation in deviations.items():
+            self.assertLess(deviation, 1e-9, stage)
+
+    def test_reproduces_rule_methods_on_generated_corpus(self):
+        documents = [AnalyzedDocument(text) for text in generated_corpus()]
+        for stage, deviation in self.engine.validate(documents).items():
+            self.assertLess(deviation, 1e-9, stage)
+
+    def test_detector_scores_from_the_same_tables(self):
+        document = AnalyzedDocument("The claim was verified by Reuters and the figures were checked.")
+        self.assertAlmostEqual(self.detector._verify_with_fact_checkers((), document), 0.9)
+        with mock.patch.dict(RULE_SETS['fact_checkers'].weights, {'fact_check_language': 0.1}):
+            self.assertAlmostEqual(self.detector._verify_with_fact_checkers((), document), 0.6)
+            engine = LinearRuleEngine(self.detector, ['fact_checkers'])
+            self.assertAlmostEqual(engine.score([document])[0, 0], 0.6)
+
+    def test_weight_table_is_block_diagonal(self):
+        engine = LinearRuleEngine(self.detector, ['fact_checkers', 'online_verification', 'ai_analysis'])
+        self.assertEqual(engine.stages, ['fact_checkers', 'ai_analysis'])
+        self.assertEqual(engine.weights.shape, (len(engine.feature_names), 2))
+        column = engine.feature_names.index('fact_checkers.debunked_claims')
+        self.assertEqual(engine.weights[column, 0], -0.6)
+        self.assertEqual(engine.weights[column, 1], 0.0)
+
+    def test_scores_are_clipped(self):
+        engine = LinearRuleEngine(self.detector, ['fact_checkers'])
+        features = sparse.csr_matrix(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]]))
+        scores = engine.score_features(features)
+        np.testing.assert_allclose(scores[:, 0], [0.0, 0.9, 0.3, 0.5])
+
+    def test_featurize_shape(self):
+        features = self.engine.featurize(self.documents())
+        self.assertTrue(sparse.isspmatrix_csr(features))
+        self.assertEqual(features.shape, (len(TEXTS), len(self.engine.feature_names)))
+        self.assertEqual(self.engine.score(self.documents()).shape, (len(TEXTS), len(RULE_SETS)))
+
+class TestBatchPrediction(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        self.detector.config.LINEAR_RULE_ENGINE = True
+        self.detector.cache.enabled = False
+
+    def test_batch_matches_single_predictions(self):
+        for profile in ('fast', 'balanced', 'full'):
+            batch = self.detector.predict_batch(TEXTS, profile=profile)
+            for text, result in zip(TEXTS, batch):
+                single = self.detector.predict(text, profile=profile)
+                self.assertEqual(result['prediction'], single['prediction'])
+                self.assertAlmostEqual(result['verification_score'], single['verification_score'], places=9)
+                self.assertEqual(sorted(result['key_claims']), sorted(single['key_claims']))
+                for key, score in single['external_verification'].items():
+                    self.assertAlmostEqual(result['external_verification'][key], score, places=9)
+
+    def test_key_claims_extracted_once_per_text(self):
+        with mock.patch.object(self.detector, '_extract_key_claims',
+                               wraps=self.detector._extract_key_claims) as extract:
+            self.detector.compute_signals_batch(TEXTS, stages=['google_search', 'fact_checkers'])
+        self.assertEqual(extract.call_count, len(TEXTS))
+
+    def test_per_text_path_by_default(self):
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        results = detector.predict_batch(TEXTS[:2] + [''])
+        self.assertEqual(results[2], {'error': 'No text provided'})
+        self.assertFalse(detector._rule_engines)
+
+    def test_engine_results_are_cached_apart(self):
+        """Engine scores may differ from predict() by rounding, so neither answers for the other"""
+        self.detector.cache.enabled = True
+        self.detector.predict_batch(TEXTS[:1])
+        self.assertFalse(self.detector.predict(TEXTS[0], include_timings=True)['timings']['cache_hit'])
+
+if __name__ == '__main__':
+    unittest.main()
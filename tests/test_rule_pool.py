@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+import multiprocessing
+from unittest import mock
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import rule_pool
+
+class FakeSignalsDetector:
+    def compute_signals(self, text, timings=None, stages=None):
+        timings['lexicon_scan'] = 0.001
+        return {'length': len(text), 'pid': os.getpid()}
+
+def init_fake_worker():
+    rule_pool._worker_detector = FakeSignalsDetector()
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'requires fork start method')
+class TestRuleAnalysisPool(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(rule_pool, '_init_worker', init_fake_worker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = rule_pool.RuleAnalysisPool(workers=2, start_method='fork')
+        self.addCleanup(self.pool.close)
+
+    def test_signals_computed_in_worker(self):
+        """Signals and stage timings come back from another process"""
+        signals, timings = self.pool.analyze('hello', timeout=30)
+        self.assertEqual(signals['length'], 5)
+        self.assertNotEqual(signals['pid'], os.getpid())
+        self.assertEqual(timings, {'lexicon_scan': 0.001})
+
+    def test_stats(self):
+        futures = [self.pool.submit(str(i)) for i in range(10)]
+        for future in futures:
+            future.result(timeout=30)
+        stats = self.pool.stats()
+        self.assertEqual(stats['submitted'], 10)
+        self.assertEqual(stats['completed'], 10)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(stats['workers'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from unittest import mock
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.cli import score
+
+class FakeDetector:
+    """Scores a text by its length; enough to check ordering and resume"""
+
+    def predict_batch(self, texts):
+        return [{'length': len(text)} if text else {'error': 'No text provided'} for text in texts]
+
+class TestReadRecords(unittest.TestCase):
+
+    def test_jsonl(self):
+        stream = io.StringIO('{"id": 1, "text": "a"}\n\nnot json\n"plain"\n')
+        self.assertEqual(list(score.read_records(stream)), [(1, 'a'), (None, None), (None, 'plain')])
+
+    def test_csv(self):
+        stream = io.StringIO('id,body\n7,"hello, world"\n')
+        records = list(score.read_records(stream, 'csv', text_field='body'))
+        self.assertEqual(records, [('7', 'hello, world')])
+
+class TestScoreRecords(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(score, '_make_detector', return_value=FakeDetector())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        score._detector = None
+        self.addCleanup(setattr, score, '_detector', None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.records = [(i, 'x' * i) for i in range(50)]
+
+    def read_output(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_ordered_output(self):
+        path = os.path.join(self.directory.name, 'out.jsonl')
+        stats = score.score_records(iter(self.records), path, workers=0, chunk_size=7, progress=False)
+        self.assertEqual(stats['records'], 50)
+        self.assertEqual(stats['errors'], 1)
+        rows = self.read_output(path)
+        self.assertEqual([row['id'] for row in rows], list(range(50)))
+        self.assertEqual(rows[10]['result'], {'length': 10})
+        self.assertFalse(os.path.exists(path + '.checkpoint'))
+
+    def test_resume_after_interruption(self):
+        """An interrupted run resumes from its checkpoint without duplicate rows"""
+        path = os.path.join(self.directory.name, 'out.jsonl')
+
+        def interrupted():
+            for index, record in enumerate(self.records):
+                if index == 30:
+                    raise KeyboardInterrupt
+                yield record
+
+        with self.assertRaises(KeyboardInterrupt):
+            score.score_records(interrupted(), path, workers=0, chunk_size=5, window=2,
+                                checkpoint_every=10, progress=False)
+        self.assertTrue(os.path.exists(path + '.checkpoint'))
+
+        stats = score.score_records(iter(self.records), path, workers=0, chunk_size=5,
+                                    checkpoint_every=10, resume=True, progress=False)
+        self.assertGreater(stats['resumed_from'], 0)
+        rows = self.read_output(path)
+        self.assertEqual([row['index'] for row in rows], list(range(50)))
+        self.assertEqual([row['id'] for row in rows], list(range(50)))
+
+if __name__ == '__main__':
+    unittest.main()
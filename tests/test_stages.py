@@ -0,0 +1,98 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+from src.models.fake_news_detector import FakeNewsDetector
+from src.models.stages import PROFILES, STAGES, describe_stages, required_inputs, resolve_profile
+
+TEXT = ("According to Reuters, officials confirmed on March 3, 2024 that 120 residents were evacuated. "
+        "\"We acted quickly,\" the mayor said in a statement.")
+
+class TestStageRegistry(unittest.TestCase):
+
+    def test_profiles_reference_registered_stages(self):
+        for names in PROFILES.values():
+            self.assertTrue(all(name in STAGES for name in names))
+        self.assertAlmostEqual(sum(stage.weight for stage in resolve_profile('balanced')), 1.0)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            resolve_profile('thorough')
+
+    def test_required_inputs(self):
+        self.assertEqual(required_inputs(resolve_profile('fast')), ['hits'])
+        self.assertEqual(required_inputs(resolve_profile('balanced')), ['key_claims', 'hits'])
+
+    def test_describe_stages(self):
+        info = describe_stages({'ai_analysis': {'mean_ms': 0.5, 'p99_ms': 1.0}})
+        self.assertEqual(info['stages']['ai_analysis']['measured_mean_ms'], 0.5)
+        self.assertEqual(info['stages']['model']['runs_in'], 'parent')
+        self.assertEqual(info['profiles']['fast'], list(PROFILES['fast']))
+
+class TestProfilesInDetector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        cls.detector.cache.enabled = False
+
+    def test_only_selected_stages_run(self):
+        result = self.detector.predict(TEXT, include_timings=True, profile='fast')
+        self.assertEqual(result['profile'], 'fast')
+        self.assertEqual(set(result['external_verification']),
+                         {STAGES[name].result_key for name in PROFILES['fast']})
+        self.assertNotIn('extract_claims', result['timings'])
+        self.assertNotIn('google_search', result['timings'])
+        self.assertNotIn('preprocess', result['timings'])
+        self.assertEqual(result['key_claims'], [])
+
+    def test_weights_renormalised(self):
+        result = self.detector.predict(TEXT, profile='full')
+        # No model loaded: the transformer stage is dropped instead of contributing a neutral 0.5
+        stages = [stage for stage in resolve_profile('full') if stage.name != 'model']
+        scores = result['external_verification']
+        self.assertNotIn('model_score', scores)
+        self.assertTrue(result['model_unavailable'])
+        expected = sum(stage.weight * scores[stage.result_key] for stage in stages) / sum(stage.weight for stage in stages)
+        self.assertAlmostEqual(result['verification_score'], expected * 100)
+        self.assertEqual(self.detector.predict_batch([TEXT], profile='full')[0]['verification_score'],
+                         result['verification_score'])
+        self.assertNotIn('model_unavailable', self.detector.predict(TEXT, profile='balanced'))
+
+    def test_model_stage_runs_once_ready(self):
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        rules_only = detector.predict(TEXT, profile='full')
+        detector.model_status = 'ready'
+        with mock.patch.object(detector, '_get_ml_prediction', return_value=0.9):
+            result = detector.predict(TEXT, profile='full')
+        self.assertEqual(result['external_verification']['model_score'], 0.9)
+        self.assertNotIn('model_unavailable', result)
+        self.assertEqual(result['decided_by'], 'model')
+        # Results without the model are cached under a different key
+        self.assertNotEqual(result['verification_score'], rules_only['verification_score'])
+
+    def test_cached_result_matches_fresh_result(self):
+        """Several rules read spacing and character offsets, so whitespace variants are cached separately"""
+        single = "According to officials the deep state hoax was exposed!!! SHARE before they delete it"
+        double = single.replace("According to", "According  to")
+        detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        detector.predict(double)
+        cached = detector.predict(single, include_timings=True)
+        self.assertFalse(cached['timings']['cache_hit'])
+        self.assertEqual(cached['verification_score'], self.detector.predict(single)['verification_score'])
+        self.assertNotEqual(self.detector.predict(double)['verification_score'], cached['verification_score'])
+        self.assertTrue(detector.predict(single + '\n', include_timings=True)['timings']['cache_hit'])
+
+    def test_balanced_is_default(self):
+        result = self.detector.predict(TEXT)
+        self.assertEqual(result['profile'], 'balanced')
+        self.assertIn('google_search_score', result['external_verification'])
+        self.assertTrue(result['key_claims'])
+
+if __name__ == '__main__':
+    unittest.main()
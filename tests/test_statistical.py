@@ -0,0 +1,251 @@
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+from unittest import mock
+
+# Add repository root to path so src.* imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault('NLTK_AUTO_DOWNLOAD', 'false')
+
+import numpy as np
+
+from src.cli.__main__ import main as cli_main
+from src.config.config import Config
+from src.models.fake_news_detector import FakeNewsDetector
+from src.models.statistical import MANIFEST_FILE, StatisticalClassifier, train
+
+FAKE_WORDS = "shocking secret exposed miracle cure they hide truth wake share deleted hoax banned".split()
+REAL_WORDS = "officials said reuters reported according statement ministry data percent study confirmed".split()
+COMMON_WORDS = "the a people city government week new year report more after".split()
+
+def labeled_corpus(count=600, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        label = rng.choice(['fake', 'real'])
+        words = [rng.choice(FAKE_WORDS if label == 'fake' else REAL_WORDS) for _ in range(6)]
+        words += [rng.choice(COMMON_WORDS) for _ in range(10)]
+        rng.shuffle(words)
+        records.append((' '.join(words), label))
+    return records
+
+class TestStatisticalClassifier(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'statistical')
+
+    def test_hashing_model_learns_and_reports_holdout(self):
+        classifier, metrics = train(labeled_corpus() + [('', 'fake'), ('text', 'satire')],
+                                    n_features=2 ** 12, chunk_size=100)
+        self.assertEqual(metrics['skipped'], 2)
+        self.assertEqual(metrics['trained'] + metrics['holdout'], 600)
+        self.assertGreater(metrics['holdout_accuracy'], 0.9)
+        scores = classifier.credibility(["officials said the ministry confirmed", "shocking secret cure exposed"])
+        self.assertGreater(scores[0], 0.9)
+        self.assertLess(scores[1], 0.1)
+
+    def test_matches_sklearn_pipeline(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.naive_bayes import MultinomialNB
+
+        records = labeled_corpus()
+        classifier, _ = train(records, vectorizer='tfidf', holdout=0)
+        vectorizer = TfidfVectorizer(ngram_range=(1, 2), max_features=2 ** 18)
+        model = MultinomialNB(alpha=0.1).fit(vectorizer.fit_transform([t for t, _ in records]), [l for _, l in records])
+
+        texts = [text for text, _ in labeled_corpus(50, seed=1)]
+        np.testing.assert_allclose(classifier.predict_proba(texts), model.predict_proba(vectorizer.transform(texts)),
+                                   rtol=1e-4, atol=1e-6)
+
+    def test_save_load_memory_mapped(self):
+        classifier, _ = train(labeled_corpus(), n_features=2 ** 12)
+        first_id = classifier.save(self.path)
+        loaded = StatisticalClassifier.load(self.path)
+        self.assertEqual(loaded.model_id, first_id)
+        self.assertIsInstance(loaded.arrays['feature_log_prob'], np.memmap)
+        texts = [text for text, _ in labeled_corpus(20, seed=2)]
+        np.testing.assert_allclose(loaded.credibility(texts), classifier.credibility(texts), rtol=1e-5)
+
+        # A new version replaces the old files; an open reader keeps working
+        second, _ = train(labeled_corpus(seed=3), n_features=2 ** 12)
+        second_id = second.save(self.path)
+        self.assertNotEqual(second_id, first_id)
+        self.assertFalse(any(first_id in entry for entry in os.listdir(self.path)))
+        self.assertEqual(len(loaded.credibility(texts)), 20)
+        self.assertEqual(StatisticalClassifier.load(self.path).model_id, second_id)
+
+    def test_train_command(self):
+        corpus = os.path.join(self.directory.name, 'labeled.jsonl')
+        with open(corpus, 'w') as f:
+            for text, label in labeled_corpus(200):
+                f.write(json.dumps({'text': text, 'label': label.upper()}) + '\n')
+            f.write('not json\n')
+        code = cli_main(['train-statistical', corpus, '--output', self.path, '--n-features', '4096'])
+        self.assertEqual(code, 0)
+        with open(os.path.join(self.path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest['classes'], ['fake', 'real'])
+        self.assertEqual(manifest['metrics']['skipped'], 1)
+
+class TestStatisticalStage(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        self.detector.config.STATISTICAL_MODEL_DIR = os.path.join(directory.name, 'statistical')
+        self.detector.cache.enabled = False
+
+    def test_dropped_without_artifact(self):
+        """No neutral 0.5 at weight 0.25: the stage is left out and reported unavailable"""
+        texts = ["officials said the ministry confirmed", "shocking secret cure exposed"]
+        for text in texts:
+            result = self.detector.predict(text, profile='statistical')
+            self.assertNotIn('statistical_score', result['external_verification'])
+            self.assertTrue(result['statistical_unavailable'])
+            self.assertEqual(result['verification_score'],
+                             self.detector.predict(text, profile='balanced')['verification_score'])
+        for result in self.detector.predict_batch(texts, profile='statistical'):
+            self.assertTrue(result['statistical_unavailable'])
+        cascaded = self.detector.predict(texts[1], profile='statistical', cascade=True)
+        self.assertTrue(cascaded['statistical_unavailable'])
+
+    def test_stage_scores_with_artifact(self):
+        classifier, _ = train(labeled_corpus(), n_features=2 ** 12)
+        classifier.save(self.detector.config.STATISTICAL_MODEL_DIR)
+        texts = ["officials said the ministry confirmed", "shocking secret cure exposed"]
+        single = [self.detector.predict(text, profile='statistical') for text in texts]
+        self.assertGreater(single[0]['external_verification']['statistical_score'], 0.9)
+        self.assertLess(single[1]['external_verification']['statistical_score'], 0.1)
+        self.assertNotIn('statistical_unavailable', single[0])
+
+        batch = self.detector.predict_batch(texts, profile='statistical')
+        for one, many in zip(single, batch):
+            self.assertAlmostEqual(one['external_verification']['statistical_score'],
+                                   many['external_verification']['statistical_score'])
+        self.assertEqual(self.detector.stage_info()['statistical_model']['model_id'], classifier.model_id)
+
+class TestFeedbackUpdates(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'statistical')
+        self.detector = FakeNewsDetector(load_model=False, executor_mode='thread')
+        self.detector.config.STATISTICAL_MODEL_DIR = self.path
+        self.detector.config.STATISTICAL_RELOAD_SECONDS = 0
+        self.detector.cache.enabled = False
+
+    def train_and_save(self, **kwargs):
+        classifier, _ = train(labeled_corpus(), n_features=2 ** 12, **kwargs)
+        classifier.save(self.path)
+        return classifier
+
+    def test_updated_leaves_original_untouched(self):
+        self.train_and_save()
+        loaded = StatisticalClassifier.load(self.path)
+        text = "officials said the ministry confirmed"
+        before = loaded.credibility([text])[0]
+        updated = loaded.updated([text] * 20, ['FAKE'] * 20)
+        self.assertLess(updated.credibility([text])[0], before)
+        self.assertEqual(loaded.credibility([text])[0], before)
+        self.assertNotEqual(updated.model_id, loaded.model_id)
+        self.assertEqual(updated.manifest['updated_examples'], 20)
+        with self.assertRaises(ValueError):
+            loaded.updated([text], ['satire'])
+
+    def test_tfidf_models_need_retraining(self):
+        classifier, _ = train(labeled_corpus(), vectorizer='tfidf')
+        with self.assertRaises(ValueError):
+            classifier.updated(["text"], ['fake'])
+
+    def test_detector_swaps_and_other_processes_reload(self):
+        with self.assertRaises(LookupError):
+            self.detector.update_statistical_model(["text"], ['fake'])
+
+        self.train_and_save()
+        # Stands in for a rule worker process reading the same artifact directory
+        other = FakeNewsDetector(load_model=False, executor_mode='thread')
+        other.config.STATISTICAL_MODEL_DIR = self.path
+        other.config.STATISTICAL_RELOAD_SECONDS = 0
+        first_id = other.statistical_model.model_id
+
+        text = "officials said the ministry confirmed"
+        before = self.detector._get_statistical_predictions([text])[0]
+        update = self.detector.update_statistical_model([text] * 20, ['fake'] * 20)
+        self.assertEqual(update['examples'], 20)
+        self.assertEqual(self.detector.statistical_model.model_id, update['model_id'])
+        self.assertLess(self.detector._get_statistical_predictions([text])[0], before)
+
+        self.assertNotEqual(other.statistical_model.model_id, first_id)
+        self.assertEqual(other.statistical_model.model_id, update['model_id'])
+
+    def test_inference_continues_during_updates(self):
+        import threading
+        self.train_and_save()
+        self.detector.statistical_model
+        errors = []
+        stop = threading.Event()
+
+        def serve():
+            while not stop.is_set():
+                try:
+                    self.detector._get_statistical_predictions(["officials said", "shocking secret"])
+                except Exception as e:
+                    errors.append(e)
+
+        reader = threading.Thread(target=serve)
+        reader.start()
+        try:
+            for label in ['fake', 'real'] * 5:
+                self.detector.update_statistical_model(["officials said"], [label], persist=False)
+        finally:
+            stop.set()
+            reader.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.detector.statistical_model.manifest['updates'], 10)
+
+    def test_feedback_endpoint(self):
+        # Without background initialization, which would replace the detector set below
+        with mock.patch.object(Config, 'AUTO_INITIALIZE', False):
+            import app as app_module
+        self.addCleanup(setattr, app_module, 'detector', app_module.detector)
+        app_module.detector = self.detector
+        for name, value in (('FEEDBACK_ENABLED', True), ('ADMIN_TOKEN', 'reviewer-secret')):
+            patcher = mock.patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        client = app_module.app.test_client()
+        client.environ_base['HTTP_X_ADMIN_TOKEN'] = 'reviewer-secret'
+
+        response = client.post('/api/feedback', json={'text': 'officials said', 'label': 'fake'})
+        self.assertEqual(response.status_code, 409)
+
+        self.train_and_save()
+        response = client.post('/api/feedback', json={'items': [{'text': 'officials said', 'label': 'satire'}]})
+        self.assertEqual(response.status_code, 400)
+        response = client.post('/api/feedback', json={'items': [{'text': '', 'label': 'fake'}]})
+        self.assertEqual(response.status_code, 400)
+        response = client.post('/api/feedback', json={'items': [{'text': 'officials said', 'label': 'fake'}] * 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['examples'], 3)
+        self.assertEqual(StatisticalClassifier.load(self.path).model_id, response.get_json()['model_id'])
+
+    def test_update_command(self):
+        self.train_and_save()
+        feedback = os.path.join(os.path.dirname(self.path), 'feedback.jsonl')
+        with open(feedback, 'w') as f:
+            for _ in range(5):
+                f.write(json.dumps({'text': 'officials said the ministry confirmed', 'label': 'fake'}) + '\n')
+            f.write(json.dumps({'text': 'unlabeled'}) + '\n')
+        self.assertEqual(cli_main(['update-statistical', feedback, '--model-dir', self.path]), 0)
+        manifest = StatisticalClassifier.load(self.path).manifest
+        self.assertEqual(manifest['updated_examples'], 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import sys
+import os
+import re
+from unittest import mock
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import utils.text_preprocessor as text_preprocessor
+from utils.text_preprocessor import ENGLISH_STOPWORDS, TextPreprocessor
+
+def legacy_preprocess(text, stop_words):
+    """The original six-pass pipeline (whitespace tokenization, no lemmatizer)"""
+    text = text.lower()
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'\S+@\S+', '', text)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\d+', '', text)
+    tokens = [token for token in text.split() if token not in stop_words]
+    return ' '.join(token for token in tokens if len(token) > 2)
+
+class TestTextPreprocessor(unittest.TestCase):
+
+    def setUp(self):
+        self.preprocessor = TextPreprocessor(lightweight=True)
+        self.samples = [
+            "BREAKING: Officials said the report, published on March 3, 2024, was accurate!",
+            "Visit https://example.com/story?id=42&ref=home for the full story.",
+            "Contact press@agency.gov or <a href='x'>click here</a> <b>now</b>",
+            "covid-19 h2o abc123def 2024 under_score",
+            "Die Regierung kündigte über 50 Maßnahmen an, café résumé naïve",
+            "Unicode digits ２０２０ and a mail x@y near https://t.co/abc",
+            "",
+            "   \t\n  "
+        ]
+
+    def test_matches_legacy_pipeline(self):
+        """Fast path and general path both reproduce the old pipeline"""
+        for text in self.samples:
+            self.assertEqual(self.preprocessor.preprocess(text), legacy_preprocess(text, ENGLISH_STOPWORDS), text)
+
+    def test_tokens_without_join(self):
+        tokens = self.preprocessor.preprocess_tokens("The senators voted on 12 bills in Washington")
+        self.assertEqual(tokens, ['senators', 'voted', 'bills', 'washington'])
+
+    def test_keep_stopwords(self):
+        tokens = self.preprocessor.preprocess_tokens("they are not here", remove_stopwords=False)
+        self.assertEqual(tokens, ['they', 'are', 'not', 'here'])
+
+    def test_treebank_splits(self):
+        """Contractions are split the way word_tokenize splits them"""
+        self.preprocessor.treebank_splits = True
+        self.assertEqual(self.preprocessor.preprocess_tokens("gonna gotta", remove_stopwords=False), ['gon', 'got'])
+
+    def test_nltk_resolved_on_first_use(self):
+        with mock.patch.object(text_preprocessor, 'ensure_resource', return_value=False) as ensure:
+            preprocessor = TextPreprocessor()
+            ensure.assert_not_called()
+            preprocessor.preprocess_tokens("The senators voted")
+            calls = ensure.call_count
+            self.assertGreater(calls, 0)
+            preprocessor.preprocess_tokens("The senators voted again")
+            self.assertEqual(ensure.call_count, calls)
+
+    def test_batch_features_match_single(self):
+        """Vectorized features equal extract_features() on ASCII, Unicode and empty texts, across chunks"""
+        texts = self.samples + [
+            "Hello. World!!! Really?? ...", "ÉCOLE Über straße ǅ x\x1cy", "SHOCKING: act NOW", "you know", None
+        ]
+        matrix = self.preprocessor.extract_features_batch(texts, chunk_size=3)
+        expected = [self.preprocessor.extract_features(text or '') for text in texts]
+        self.assertEqual(matrix.to_dicts(), expected)
+        self.assertEqual(len(matrix), len(texts))
+        self.assertEqual(list(matrix['exclamation_count'][:3]), [1.0, 0.0, 0.0])
+
+    def test_batch_features_empty(self):
+        matrix = self.preprocessor.extract_features_batch([])
+        self.assertEqual(matrix.values.shape, (0, len(matrix.columns)))
+
+if __name__ == '__main__':
+    unittest.main()
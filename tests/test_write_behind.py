@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database.write_behind import PredictionWriter
+
+class FakeInsertResult:
+    def __init__(self, documents):
+        self.inserted_ids = list(range(len(documents)))
+
+class FakeCollection:
+    """Collects insert_many calls; can be paused to simulate a slow server"""
+
+    def __init__(self):
+        self.batches = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def insert_many(self, documents, ordered=True):
+        self.release.wait(5)
+        self.batches.append((list(documents), ordered))
+        return FakeInsertResult(documents)
+
+class TestPredictionWriter(unittest.TestCase):
+
+    def test_flush_by_size(self):
+        """Full batches are written unordered"""
+        collection = FakeCollection()
+        writer = PredictionWriter(collection, batch_size=5, flush_interval=10)
+        for i in range(10):
+            self.assertTrue(writer.put({'n': i}))
+        deadline = time.time() + 5
+        while writer.stats()['written'] < 10 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([len(batch) for batch, _ in collection.batches], [5, 5])
+        self.assertTrue(all(ordered is False for _, ordered in collection.batches))
+        writer.close()
+
+    def test_flush_on_close(self):
+        """Closing flushes a partial batch without waiting for the interval"""
+        collection = FakeCollection()
+        writer = PredictionWriter(collection, batch_size=100, flush_interval=60)
+        writer.put({'n': 1})
+        writer.put({'n': 2})
+        start = time.time()
+        writer.close()
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(writer.stats()['written'], 2)
+        self.assertFalse(writer.put({'n': 3}))
+
+    def test_drop_on_overflow(self):
+        """A full queue drops documents and counts them"""
+        collection = FakeCollection()
+        collection.release.clear()
+        writer = PredictionWriter(collection, batch_size=1, flush_interval=0, max_queue=2)
+        results = [writer.put({'n': i}) for i in range(10)]
+        self.assertIn(False, results)
+        stats = writer.stats()
+        self.assertEqual(stats['dropped'], results.count(False))
+        self.assertEqual(stats['enqueued'], results.count(True))
+        collection.release.set()
+        writer.close()
+        self.assertEqual(writer.stats()['written'], results.count(True))
+
+if __name__ == '__main__':
+    unittest.main()